@@ -51,6 +51,16 @@ class ABIL1B(GeoBenchmarks):
         self.data_files = get_filenames(self.subdir)
         dask.config.set({"array.chunk-size": "32MiB"})
 
+    def timeraw_create_scene_cold_start(self, cache_yaml_configs):
+        """Time importing Satpy and creating a scene in a new process."""
+        return f"""
+import satpy
+satpy.config.set(cache_yaml_configs={cache_yaml_configs!r})
+satpy.Scene(filenames={self.data_files!r}, reader={self.reader!r})
+"""
+    timeraw_create_scene_cold_start.params = [False, True]  # type: ignore
+    timeraw_create_scene_cold_start.param_names = ["cache_yaml_configs"]  # type: ignore
+
     def time_load_one_channel(self):
         """Time the loading of one channel."""
         self.compute_channel("C01")
@@ -51,6 +51,12 @@ class HimawariHSD(GeoBenchmarks):
         self.data_files = get_filenames(self.subdir)
         dask.config.set({"array.chunk-size": "32MiB"})
 
+    def time_create_scene(self, fh_workers):
+        """Time the creation of the scene depending on the number of file handler workers."""
+        self.create_scene(reader_kwargs={"fh_workers": fh_workers})
+    time_create_scene.params = [1, 2, 4, 8]  # type: ignore
+    time_create_scene.param_names = ["fh_workers"]  # type: ignore
+
     def time_load_one_channel(self):
         """Time the loading of one channel."""
         self.compute_channel("B01")
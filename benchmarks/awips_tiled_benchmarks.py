@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the AWIPS tiled writer."""
+
+import datetime as dt
+import shutil
+import tempfile
+
+
+class AWIPSTiled:
+    """Benchmark writing many numbered AWIPS tiles with and without streaming.
+
+    The "shared" inputs depend on a statistic of the whole data, like
+    enhanced data does, so all of their chunks share upstream tasks.
+    """
+
+    timeout = 600
+    params = [[False, True], ["independent", "shared"]]
+    param_names = ["streaming", "inputs"]
+
+    shape = (4000, 4000)
+    chunks = 1000
+    tile_size = (250, 250)
+
+    def setup(self, streaming, inputs):
+        """Create the data to save and the output directory."""
+        import dask.array as da
+        import numpy as np
+        import xarray as xr
+        from pyresample.geometry import AreaDefinition
+
+        from satpy.resample import update_resampled_coords
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+
+        area_def = AreaDefinition(
+            "bench", "bench", "bench",
+            "+proj=lcc +datum=WGS84 +ellps=WGS84 +lon_0=-95. +lat_0=25 +lat_1=25 +units=m +no_defs",
+            self.shape[1], self.shape[0], (-2000000., -2000000., 2000000., 2000000.))
+        data = da.random.random(self.shape, chunks=self.chunks).astype(np.float32)
+        if inputs == "shared":
+            data = (data + data.mean()) / 2
+        start_time = dt.datetime(2018, 1, 1, 12, 0, 0)
+        data_arr = xr.DataArray(data, dims=("y", "x"), attrs=dict(
+            name="bench_ds", platform_name="PLAT", sensor="SENSOR", units="1",
+            standard_name="toa_bidirectional_reflectance", area=area_def,
+            start_time=start_time, end_time=start_time + dt.timedelta(minutes=20),
+            valid_range=(0., 1.)))
+        self.data_arr = update_resampled_coords(data_arr, data_arr, area_def)
+        self.base_dir = tempfile.mkdtemp()
+        self.writer = AWIPSTiledWriter(base_dir=self.base_dir)
+
+    def teardown(self, streaming, inputs):
+        """Remove the written tiles."""
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _save_datasets(self, streaming, compute=True):
+        return self.writer.save_datasets([self.data_arr], sector_id="BENCH", source_name="BENCH",
+                                         tile_size=self.tile_size, streaming=streaming,
+                                         compute=compute)
+
+    def time_save_datasets(self, streaming, inputs):
+        """Time writing all of the tiles."""
+        self._save_datasets(streaming)
+
+    def track_graph_size(self, streaming, inputs):
+        """Track the number of tasks in the graph returned when not computing."""
+        import dask
+        return len(dask.delayed(self._save_datasets(streaming, compute=False)).__dask_graph__())
+    track_graph_size.unit = "tasks"  # type: ignore
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark calibrating integer counts through lookup tables."""
+
+import datetime as dt
+
+
+class SEVIRICalibration:
+    """Benchmark SEVIRI calibration of full disk counts per pixel and through a lookup table."""
+
+    timeout = 600
+    params = (["radiance", "reflectance", "brightness_temperature"], ["float", "lut"])
+    param_names = ["calibration", "method"]
+
+    shape = (3712, 3712)
+    chunks = 928
+
+    def setup(self, calibration, method):
+        """Create the counts and the calibration handler."""
+        import dask.array as da
+        import numpy as np
+        import xarray as xr
+
+        from satpy.readers import utils
+        from satpy.readers.seviri_base import SEVIRICalibrationHandler
+
+        channel = "VIS006" if calibration == "reflectance" else "IR_108"
+        counts = da.random.randint(0, 1024, size=self.shape, chunks=self.chunks).astype(np.uint16)
+        counts = xr.DataArray(counts.persist(), dims=("y", "x"))
+        self.counts = counts if method == "lut" else counts.astype(np.float32)
+        self.handler = SEVIRICalibrationHandler(
+            platform_id=324, channel_name=channel,
+            coefs={"coefs": {"NOMINAL": {"gain": 0.2, "offset": -10.0}, "EXTERNAL": {}}, "radiance_type": 2},
+            calib_mode="NOMINAL", scan_time=dt.datetime(2020, 1, 1, 12))
+        utils._calibration_luts.clear()
+
+    def time_calibrate(self, calibration, method):
+        """Time the calibration of the counts, including building the lookup table."""
+        self.handler.calibrate(self.counts, calibration).compute()
+
+    def time_calibrate_cached_table(self, calibration, method):
+        """Time the calibration of the counts of a segment after the first one."""
+        self.handler.calibrate(self.counts, calibration)
+        self.handler.calibrate(self.counts, calibration).compute()
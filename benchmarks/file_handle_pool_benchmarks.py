@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark reading variables from many netCDF files."""
+
+import os
+
+
+class NetCDFManyFiles:
+    """Benchmark reading all variables of many files, reopening the files or through the pool of open files."""
+
+    timeout = 600
+    params = ["reopen", "pool"]
+    param_names = ["mode"]
+
+    n_files = 100
+    n_variables = 10
+    max_open_files = 16
+
+    def setup_cache(self):
+        """Create the files in the cache directory of asv."""
+        import netCDF4
+        import numpy as np
+
+        tmp_dir = os.path.abspath("many_netcdf_files")
+        os.makedirs(tmp_dir, exist_ok=True)
+        for file_idx in range(self.n_files):
+            with netCDF4.Dataset(os.path.join(tmp_dir, f"file_{file_idx}.nc"), "w") as nc:
+                nc.createDimension("y", 100)
+                nc.createDimension("x", 100)
+                for var_idx in range(self.n_variables):
+                    var = nc.createVariable(f"var_{var_idx}", np.float32, dimensions=("y", "x"))
+                    var[:] = np.full((100, 100), var_idx, dtype=np.float32)
+        return tmp_dir
+
+    def setup(self, tmp_dir, mode):
+        """Create the file handlers."""
+        import satpy
+        from satpy.readers.netcdf_utils import NetCDF4FileHandler
+
+        self._config = satpy.config.set({"readers.max_open_files": self.max_open_files if mode == "pool" else None})
+        self._config.__enter__()
+        self.file_handlers = [NetCDF4FileHandler(os.path.join(tmp_dir, f"file_{file_idx}.nc"), {}, {},
+                                                 cache_handle=mode == "pool")
+                              for file_idx in range(self.n_files)]
+
+    def teardown(self, tmp_dir, mode):
+        """Close the pooled files."""
+        from satpy.readers.utils import FILE_HANDLE_POOL
+
+        self.file_handlers = []
+        FILE_HANDLE_POOL.clear()
+        self._config.__exit__(None, None, None)
+
+    def time_read_variables(self, tmp_dir, mode):
+        """Time reading every variable of every file."""
+        for file_handler in self.file_handlers:
+            for var_idx in range(self.n_variables):
+                file_handler[f"var_{var_idx}"].values
+
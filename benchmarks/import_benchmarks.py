@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the import of Satpy."""
+
+import subprocess  # nosec B404
+import sys
+
+
+def _count_imported_modules(code):
+    """Count the modules imported by running *code* in a new interpreter."""
+    code += "; import sys; print(len(sys.modules))"
+    return int(subprocess.check_output([sys.executable, "-c", code], text=True))  # nosec B603
+
+
+class Import:
+    """Benchmark the import of Satpy in a new process."""
+
+    timeout = 120
+
+    def timeraw_import_satpy(self):
+        """Time importing the satpy package."""
+        return "import satpy"
+
+    def timeraw_import_scene(self):
+        """Time importing Satpy and creating an empty scene."""
+        return "from satpy import Scene; Scene()"
+
+    def track_modules_imported_by_satpy(self):
+        """Track the number of modules imported with the satpy package."""
+        return _count_imported_modules("import satpy")
+    track_modules_imported_by_satpy.unit = "modules"  # type: ignore
+
+    def track_modules_imported_by_scene(self):
+        """Track the number of modules imported to create an empty scene."""
+        return _count_imported_modules("from satpy import Scene; Scene()")
+    track_modules_imported_by_scene.unit = "modules"  # type: ignore
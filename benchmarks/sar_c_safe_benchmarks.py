@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the reading of SAR-C calibration tie points."""
+
+import os
+
+
+class SARTiePointInterpolation:
+    """Benchmark interpolating calibration vectors to a Sentinel-1 IW image, bilinearly and triangulated."""
+
+    timeout = 600
+    params = ["rectilinear", "triangulated"]
+    param_names = ["method"]
+
+    shape = (16000, 25000)
+    chunks = 4096
+
+    def setup(self, method):
+        """Create the tie points like the calibration vectors of an image."""
+        import numpy as np
+
+        pixels, lines = np.meshgrid(np.arange(0, self.shape[1] + 40, 40), np.arange(-500, self.shape[0] + 1000, 700))
+        self.values = 500 + 0.01 * pixels + 0.001 * lines
+        if method == "triangulated":
+            # jitter the pixels so they are not on a grid
+            pixels = pixels + (np.arange(pixels.shape[0]) % 2)[:, np.newaxis]
+        self.pixels = pixels.ravel()
+        self.lines = lines.ravel()
+
+    def time_interpolate(self, method):
+        """Time interpolating the full image."""
+        from satpy.readers.sar_c_safe import interpolate_xarray_linear
+        interpolate_xarray_linear(self.pixels, self.lines, self.values.ravel(), self.shape,
+                                  chunks=self.chunks).data.compute()
+
+
+class SARCalibrationXMLParsing:
+    """Benchmark reading the calibration vectors of a large calibration file."""
+
+    timeout = 600
+
+    n_vectors = 1000
+    n_pixels = 700
+
+    def setup_cache(self):
+        """Create the calibration file in the cache directory of asv."""
+        import numpy as np
+
+        pixels = " ".join(str(pixel) for pixel in np.arange(self.n_pixels) * 40)
+        values = " ".join(f"{value:.6e}" for value in np.linspace(500, 800, self.n_pixels))
+        vector = ("<calibrationVector><azimuthTime>2020-01-01T00:00:00.000000</azimuthTime><line>{line}</line>"
+                  f'<pixel count="{self.n_pixels}">{pixels}</pixel><sigmaNought>{values}</sigmaNought>'
+                  f"<betaNought>{values}</betaNought><gamma>{values}</gamma><dn>{values}</dn></calibrationVector>")
+        filename = os.path.abspath("calibration.xml")
+        with open(filename, "w") as fd:
+            fd.write("<calibration><calibrationInformation><absoluteCalibrationConstant>1.0"
+                     "</absoluteCalibrationConstant></calibrationInformation>"
+                     f'<calibrationVectorList count="{self.n_vectors}">')
+            for line in range(self.n_vectors):
+                fd.write(vector.format(line=line * 20))
+            fd.write("</calibrationVectorList></calibration>")
+        return filename
+
+    def time_read_calibration_vector(self, filename):
+        """Time parsing the file and reading one calibration vector."""
+        import datetime as dt
+
+        from satpy.readers.sar_c_safe import Calibrator, XMLArray
+
+        filename_info = {"start_time": dt.datetime(2020, 1, 1), "end_time": dt.datetime(2020, 1, 1),
+                         "polarization": "vv"}
+        calibrator = Calibrator(filename, filename_info, {}, image_shape=(20000, 28000))
+        XMLArray(calibrator.root, ".//calibrationVector", "sigmaNought")
+
+    def peakmem_read_calibration_vector(self, filename):
+        """Measure the peak memory of parsing the file and reading one calibration vector."""
+        self.time_read_calibration_vector(filename)
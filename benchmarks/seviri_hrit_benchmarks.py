@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import os
 
+import dask.array as da
+import numpy as np
 from pyspectral.rayleigh import check_and_download as download_luts
 from pyspectral.rsr_reader import check_and_download as download_rsr
 
@@ -74,3 +76,28 @@ class SEVIRIHRIT(GeoBenchmarks):
     def peakmem_save_overview_to_geotiff(self):
         """Check peak memory usage of the generation and saving of overview."""
         self.save_composite_as_geotiff("overview")
+
+
+class SEVIRIDec10216:
+    """Benchmark the unpacking of 10-bit SEVIRI data."""
+
+    params = ["numpy", "dask"]
+    param_names = ["array type"]
+
+    def setup(self, array_type):
+        """Create packed data of the size of a full disk VIS/IR channel."""
+        rng = np.random.default_rng(42)
+        packed = rng.integers(0, 256, size=(3712, 3712 * 10 // 8), dtype=np.uint8)
+        if array_type == "dask":
+            packed = da.from_array(packed, chunks=(464, -1))
+        self.packed = packed
+
+    def time_dec10216(self, array_type):
+        """Time the unpacking of a full disk channel."""
+        from satpy.readers.seviri_base import dec10216
+        np.asarray(dec10216(self.packed))
+
+    def peakmem_dec10216(self, array_type):
+        """Check peak memory usage of the unpacking of a full disk channel."""
+        from satpy.readers.seviri_base import dec10216
+        np.asarray(dec10216(self.packed))
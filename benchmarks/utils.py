@@ -30,10 +30,11 @@ def get_filenames(subdir):
 class GeoBenchmarks:
     """Class for geo benchmarks."""
 
-    def create_scene(self, filenames=None):
+    def create_scene(self, filenames=None, reader_kwargs=None):
         """Create a scene."""
         from satpy import Scene
-        scn = Scene(filenames=filenames or self.data_files, reader=self.reader)
+        scn = Scene(filenames=filenames or self.data_files, reader=self.reader,
+                    reader_kwargs=reader_kwargs)
         return scn
 
     def load_no_padding(self, composite, filenames=None):
@@ -25,14 +25,44 @@ except ModuleNotFoundError:
         "you didn't install 'satpy' properly. Try reinstalling ('pip "
         "install').")
 
+import importlib
+from typing import TYPE_CHECKING
+
 from satpy._config import config  # noqa
 from satpy.dataset import DataID, DataQuery  # noqa
 from satpy.dataset.data_dict import DatasetDict  # noqa
-from satpy.multiscene import MultiScene  # noqa
-from satpy.readers import available_readers  # noqa
-from satpy.readers import find_files_and_readers  # noqa
-from satpy.scene import Scene  # noqa
 from satpy.utils import get_logger  # noqa
-from satpy.writers import available_writers  # noqa
+
+if TYPE_CHECKING:
+    from satpy.multiscene import MultiScene  # noqa
+    from satpy.readers import available_readers, find_files_and_readers  # noqa
+    from satpy.scene import Scene  # noqa
+    from satpy.writers import available_writers  # noqa
 
 log = get_logger("satpy")
+
+# The heavy parts of the public API (readers, writers, resampling...) are
+# only imported on first access, to keep `import satpy` fast
+_LAZY_ATTRIBUTES = {
+    "MultiScene": "satpy.multiscene",
+    "Scene": "satpy.scene",
+    "available_readers": "satpy.readers",
+    "available_writers": "satpy.writers",
+    "find_files_and_readers": "satpy.readers",
+}
+
+
+def __getattr__(name):
+    """Import the lazily loaded attributes of the package on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the package, including the lazily loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -20,17 +20,22 @@ from __future__ import annotations
 
 import ast
 import glob
+import hashlib
 import logging
 import os
+import pickle  # nosec B403
 import sys
 import tempfile
 from collections import OrderedDict
+from contextlib import suppress
 from importlib.metadata import EntryPoint, entry_points
 from importlib.resources import files as impr_files
 from typing import Iterable
 
+import yaml
 from donfig import Config
 from platformdirs import AppDirs
+from yaml import UnsafeLoader
 
 from satpy._compat import cache
 
@@ -46,6 +51,11 @@ _CONFIG_DEFAULTS = {
     "cache_dir": _satpy_dirs.user_cache_dir,
     "cache_lonlats": False,
     "cache_sensor_angles": False,
+    "cache_area_slices": False,
+    "cache_file_metadata": False,
+    "cache_file_metadata_max_size": 100 * 1024 ** 2,
+    "cache_yaml_configs": False,
+    "resample_cache_max_size": None,
     "config_path": [],
     "data_dir": _satpy_dirs.user_data_dir,
     "demo_data_dir": ".",
@@ -53,6 +63,7 @@ _CONFIG_DEFAULTS = {
     "sensor_angles_position_preference": "actual",
     "readers": {
         "clip_negative_radiances": False,
+        "max_open_files": None,
     },
 }
 
@@ -194,3 +205,65 @@ def get_config_path(filename):
             return path
     raise FileNotFoundError("Could not find file in configuration path: "
                             "'{}'".format(filename))
+
+
+def load_yaml_config(filename, loader=UnsafeLoader):
+    """Load the YAML configuration file *filename* with *loader*.
+
+    When the ``cache_yaml_configs`` option of ``satpy.config`` is set, the
+    parsed configuration is pickled to the ``yaml_configs`` subdirectory of
+    the ``cache_dir`` and loaded from there the next time, which is much
+    faster than parsing the YAML again. An entry is rebuilt when the size or
+    the modification time of the file changes.
+
+    Returns: The parsed content of the file, a new object on each call.
+    """
+    cache_file = None
+    if config.get("cache_yaml_configs", False):
+        cache_file, file_stamp = _get_yaml_config_cache_path(filename, loader)
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as fd:
+                cached_stamp, conf = pickle.load(fd)  # nosec
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
+        else:
+            if cached_stamp == file_stamp:
+                return conf
+
+    with open(filename, "r", encoding="utf-8") as fd:
+        conf = yaml.load(fd, Loader=loader)  # nosec B506
+    if cache_file is not None:
+        _write_yaml_config_cache(cache_file, (file_stamp, conf))
+    return conf
+
+
+def _get_yaml_config_cache_path(filename, loader):
+    try:
+        path = os.path.abspath(os.fspath(filename))
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None, None
+    key = repr((path, loader.__module__, loader.__qualname__))
+    key_hash = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+    cache_file = os.path.join(config["cache_dir"], "yaml_configs", key_hash + ".pkl")
+    return cache_file, (stat.st_size, stat.st_mtime_ns)
+
+
+def _write_yaml_config_cache(cache_file, entry):
+    cache_dir = os.path.dirname(cache_file)
+    # write to a temporary file first so that concurrent readers never see partial entries
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fdn, tmpfilepath = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError as err:
+        LOG.debug("Could not cache YAML configuration to %s: %s", cache_file, str(err))
+        return
+    try:
+        with os.fdopen(fdn, "wb") as fd:
+            pickle.dump(entry, fd, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfilepath, cache_file)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as err:
+        LOG.debug("Could not cache YAML configuration to %s: %s", cache_file, str(err))
+        with suppress(OSError):
+            os.remove(tmpfilepath)
@@ -24,12 +24,9 @@ import warnings
 from functools import lru_cache, update_wrapper
 from typing import Callable, Iterable
 
-import yaml
-from yaml import UnsafeLoader
-
 import satpy
 from satpy import DataID, DataQuery
-from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config, load_yaml_config
 from satpy.dataset.dataid import minimal_default_keys_config
 from satpy.utils import recursive_dict_update
 
@@ -179,8 +176,7 @@ def _load_config(composite_configs):
 
     conf = {}
     for composite_config in composite_configs:
-        with open(composite_config, "r", encoding="utf-8") as conf_file:
-            conf = recursive_dict_update(conf, yaml.load(conf_file, Loader=UnsafeLoader))
+        conf = recursive_dict_update(conf, load_yaml_config(composite_config))
     try:
         sensor_name = conf["sensor_name"]
     except KeyError:
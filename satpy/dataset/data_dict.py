@@ -17,15 +17,152 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Classes and functions related to a dictionary with DataID keys."""
 
+import itertools
+import math
+import numbers
+
 import numpy as np
 
 from .dataid import DataID, create_filtered_query, minimal_default_keys_config
 
+# width of the wavelength bins of the DataID index, in the unit of the wavelengths (µm)
+WAVELENGTH_BIN_WIDTH = 0.1
+# wavelength ranges spanning more bins than this are not binned
+MAX_WAVELENGTH_BINS = 100
+
 
 class TooManyResults(KeyError):
     """Special exception when one key maps to multiple items in the container."""
 
 
+class DataIDIndex:
+    """Secondary index of DataIDs by name and wavelength.
+
+    The index gives the DataIDs that can match a query without going through
+    all of them. These candidates still need to be filtered with
+    :meth:`DataQuery.filter_dataids <satpy.dataset.dataid.DataQuery.filter_dataids>`,
+    which checks the other fields (resolution, calibration, modifiers...) on
+    the few remaining DataIDs. DataIDs without a name or wavelength that can
+    be indexed are candidates for all queries.
+
+    The candidates are given in the order the DataIDs were added to the
+    index, like the keys of the dictionary it is built for.
+    """
+
+    def __init__(self, dataids=()):
+        """Index the *dataids*."""
+        self._insertion_order = {}
+        self._counter = itertools.count()
+        self._by_name = {}
+        self._without_name = set()
+        self._by_wavelength_bin = {}
+        self._without_wavelength_bin = set()
+        for dataid in dataids:
+            self.add(dataid)
+
+    def __len__(self):
+        """Get the number of indexed DataIDs."""
+        return len(self._insertion_order)
+
+    def add(self, dataid):
+        """Add *dataid* to the index."""
+        if dataid in self._insertion_order:
+            return
+        self._insertion_order[dataid] = next(self._counter)
+        name = _get_indexable_name(dataid)
+        if name is not None:
+            self._by_name.setdefault(name, set()).add(dataid)
+        else:
+            self._without_name.add(dataid)
+        wavelength_bins = _get_wavelength_bins(_get_field(dataid, "wavelength"))
+        if wavelength_bins is None:
+            self._without_wavelength_bin.add(dataid)
+        for wavelength_bin in wavelength_bins or ():
+            self._by_wavelength_bin.setdefault(wavelength_bin, set()).add(dataid)
+
+    def discard(self, dataid):
+        """Remove *dataid* from the index if it is present."""
+        if self._insertion_order.pop(dataid, None) is None:
+            return
+        self._without_name.discard(dataid)
+        self._without_wavelength_bin.discard(dataid)
+        name = _get_indexable_name(dataid)
+        if name is not None:
+            _discard_from_bin(self._by_name, name, dataid)
+        for wavelength_bin in _get_wavelength_bins(_get_field(dataid, "wavelength")) or ():
+            _discard_from_bin(self._by_wavelength_bin, wavelength_bin, dataid)
+
+    def get_candidates(self, query):
+        """Get the indexed DataIDs that can match *query*.
+
+        Returns:
+            List of DataIDs, or None if the query doesn't have a name or
+            wavelength that can be looked up in the index.
+        """
+        candidates = None
+        names = _get_query_values(query.get("name"), str)
+        if names is not None:
+            candidates = self._without_name.union(*(self._by_name.get(name, ()) for name in names))
+        wavelengths = _get_query_values(query.get("wavelength"), numbers.Real)
+        if wavelengths is not None and all(math.isfinite(wavelength) for wavelength in wavelengths):
+            wavelength_candidates = self._without_wavelength_bin.union(
+                *(self._by_wavelength_bin.get(_get_wavelength_bin(wavelength), ()) for wavelength in wavelengths))
+            if candidates is None:
+                candidates = wavelength_candidates
+            else:
+                candidates &= wavelength_candidates
+        if candidates is None:
+            return None
+        return sorted(candidates, key=self._insertion_order.__getitem__)
+
+
+def _get_field(dataid, key):
+    try:
+        return dataid.get(key)
+    except AttributeError:
+        return None
+
+
+def _get_indexable_name(dataid):
+    name = _get_field(dataid, "name")
+    if isinstance(name, str) and name != "*":
+        return name
+    return None
+
+
+def _discard_from_bin(bins, bin_key, dataid):
+    dataids = bins[bin_key]
+    dataids.discard(dataid)
+    if not dataids:
+        del bins[bin_key]
+
+
+def _get_query_values(value, value_type):
+    """Get the values a query field can match, or None if they can't be looked up in the index."""
+    if isinstance(value, value_type) and not isinstance(value, bool) and value != "*":
+        return [value]
+    if isinstance(value, list) and value and all(isinstance(val, value_type) and not isinstance(val, bool)
+                                                 for val in value):
+        return value
+    return None
+
+
+def _get_wavelength_bin(wavelength):
+    return math.floor(wavelength / WAVELENGTH_BIN_WIDTH)
+
+
+def _get_wavelength_bins(wavelength):
+    """Get the bins covered by a wavelength range, or None if it can't be binned."""
+    try:
+        min_bin = _get_wavelength_bin(wavelength.min)
+        max_bin = _get_wavelength_bin(wavelength.max)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        return None
+    if max_bin - min_bin >= MAX_WAVELENGTH_BINS:
+        return None
+    return range(min_bin, max_bin + 1)
+
+
 def get_best_dataset_key(key, choices):
     """Choose the "best" `DataID` from `choices` based on `key`.
 
@@ -102,7 +239,7 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     """
     key = create_filtered_query(key, query)
 
-    res = key.filter_dataids(key_container)
+    res = key.filter_dataids(_get_candidate_keys(key, key_container))
     if not res:
         raise KeyError("No dataset matching '{}' found".format(str(key)))
 
@@ -121,7 +258,90 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     return res[:num_results]
 
 
-class DatasetDict(dict):
+def _get_candidate_keys(query, key_container):
+    """Get the keys of *key_container* that may match *query*, through its index if it has one."""
+    if not isinstance(key_container, DataIDDict):
+        return key_container
+    candidates = key_container.dataid_index.get_candidates(query)
+    if candidates is None:
+        return key_container.keys()
+    return candidates
+
+
+class DataIDDict(dict):
+    """Dictionary with DataID keys, indexed to find the keys matching a query quickly.
+
+    The :class:`DataIDIndex` of the keys is updated along with the
+    dictionary, and used by :func:`get_key` when the dictionary is passed as
+    the key container.
+    """
+
+    @property
+    def dataid_index(self):
+        """Get the index of the keys, building it if needed."""
+        index = self.__dict__.get("_dataid_index")
+        if index is None:
+            index = self.__dict__["_dataid_index"] = DataIDIndex(super().keys())
+        return index
+
+    def _reset_dataid_index(self):
+        self.__dict__.pop("_dataid_index", None)
+
+    def __getstate__(self):
+        """Get the state of the object to copy or pickle, without the index."""
+        state = self.__dict__.copy()
+        state.pop("_dataid_index", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the object."""
+        self.__dict__.update(state)
+
+    def __setitem__(self, key, value):
+        """Set an item and index its key."""
+        super().__setitem__(key, value)
+        self.dataid_index.add(key)
+
+    def __delitem__(self, key):
+        """Delete an item and remove its key from the index."""
+        super().__delitem__(key)
+        self.dataid_index.discard(key)
+
+    def pop(self, key, *args):
+        """Remove an item and return its value."""
+        value = super().pop(key, *args)
+        self.dataid_index.discard(key)
+        return value
+
+    def popitem(self):
+        """Remove and return the last inserted item."""
+        key, value = super().popitem()
+        self.dataid_index.discard(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        """Get the value of *key*, inserting *default* if it is missing."""
+        value = super().setdefault(key, default)
+        self.dataid_index.add(key)
+        return value
+
+    def update(self, *args, **kwargs):
+        """Update the dictionary, the index is rebuilt when needed."""
+        super().update(*args, **kwargs)
+        self._reset_dataid_index()
+
+    def __ior__(self, other):
+        """Update the dictionary in place."""
+        self.update(other)
+        return self
+
+    def clear(self):
+        """Remove all the items."""
+        super().clear()
+        self._reset_dataid_index()
+
+
+class DatasetDict(DataIDDict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
     Note: Internal dictionary keys are `DataID` objects.
@@ -155,7 +375,7 @@ class DatasetDict(dict):
             **dfilter (dict): See `get_key` function for more information.
 
         """
-        return get_key(match_key, self.keys(), num_results=num_results,
+        return get_key(match_key, self, num_results=num_results,
                        best=best, **dfilter)
 
     def getitem(self, item):
@@ -26,8 +26,6 @@ from operator import eq, is_
 
 import numpy as np
 
-from satpy.writers.utils import flatten_dict
-
 
 def combine_metadata(*metadata_objects, average_times=None):
     """Combine the metadata of two or more Datasets.
@@ -226,6 +224,9 @@ def _dict_equal(d1, d2):
 
     Nested dictionaries are flattened to facilitate comparison.
     """
+    # imported here to not import all the writers with satpy.dataset
+    from satpy.writers.utils import flatten_dict
+
     d1_flat = flatten_dict(d1)
     d2_flat = flatten_dict(d2)
     if not _dict_keys_equal(d1_flat, d2_flat):
@@ -19,13 +19,15 @@
 
 from __future__ import annotations
 
+import weakref
+from contextlib import suppress
 from typing import Container, Iterable, Optional
 
 import numpy as np
 
 from satpy import DataID, DatasetDict
 from satpy.dataset import ModifierTuple, create_filtered_query
-from satpy.dataset.data_dict import TooManyResults, get_key
+from satpy.dataset.data_dict import DataIDDict, TooManyResults, get_key
 from satpy.node import EMPTY_LEAF_NAME, LOG, CompositorNode, MissingDependencies, Node, ReaderNode
 
 
@@ -44,6 +46,11 @@ class Tree:
         # __contains__
         self._all_nodes = _DataIDContainer()
 
+        # copies of a tree share its nodes until they need their own, see
+        # `_share_nodes_with`
+        self._node_owner = None
+        self._node_sharers = weakref.WeakSet()
+
     def leaves(self,
                limit_nodes_to: Optional[Iterable[DataID]] = None,
                unique: bool = True
@@ -59,6 +66,7 @@ class Tree:
             list of leaf nodes
 
         """
+        self._detach_shared_nodes()
         if limit_nodes_to is None:
             return self._root.leaves(unique=unique)
 
@@ -88,6 +96,7 @@ class Tree:
             list of trunk nodes
 
         """
+        self._detach_shared_nodes()
         if limit_nodes_to is None:
             return self._root.trunk(unique=unique,
                                     limit_children_to=limit_children_to)
@@ -102,6 +111,7 @@ class Tree:
 
     def add_child(self, parent, child):
         """Add a child to the tree."""
+        self._prepare_nodes_for_update()
         Node.add_child(parent, child)
         # Sanity check: Node objects should be unique. They can be added
         #               multiple times if more than one Node depends on them
@@ -116,6 +126,7 @@ class Tree:
 
     def add_leaf(self, ds_id, parent=None):
         """Add a leaf to the tree."""
+        self._prepare_nodes_for_update()
         if parent is None:
             parent = self._root
         try:
@@ -125,12 +136,53 @@ class Tree:
         self.add_child(parent, node)
         return node
 
+    def _share_nodes_with(self, other):
+        """Share the nodes of this tree with *other*.
+
+        The tree owning the nodes keeps using them. The sharing tree copies
+        them the first time it hands out or modifies nodes, or when the owner
+        is about to modify them. Trees that are copied and only checked for
+        the nodes they contain never copy the nodes.
+        """
+        owner = self._get_node_owner() or self
+        other._root = self._root
+        other._all_nodes = self._all_nodes
+        other._node_owner = weakref.ref(owner)
+        owner._node_sharers.add(other)
+
+    def _get_node_owner(self):
+        if self._node_owner is None:
+            return None
+        return self._node_owner()
+
+    def _detach_shared_nodes(self):
+        """Copy the nodes of this tree if they are shared with the tree owning them."""
+        if self._node_owner is None:
+            return
+        owner = self._get_node_owner()
+        if owner is not None:
+            owner._node_sharers.discard(self)
+        self._node_owner = None
+        shared_root = self._root
+        self._root = Node(None)
+        self._all_nodes = _DataIDContainer()
+        for child in shared_root.children:
+            child = child.copy(node_cache=self._all_nodes)
+            self.add_child(self._root, child)
+
+    def _prepare_nodes_for_update(self):
+        """Make sure no other tree shares the nodes before modifying them."""
+        self._detach_shared_nodes()
+        for sharer in list(self._node_sharers):
+            sharer._detach_shared_nodes()
+
     def __contains__(self, item):
         """Check if a item is in the tree."""
         return item in self._all_nodes
 
     def __getitem__(self, item):
         """Get an item of the tree."""
+        self._detach_shared_nodes()
         return self._all_nodes[item]
 
     def contains(self, item):
@@ -139,6 +191,7 @@ class Tree:
 
     def getitem(self, item):
         """Get Node when we know the *exact* DataID or DataQuery."""
+        self._detach_shared_nodes()
         return super(_DataIDContainer, self._all_nodes).__getitem__(item)
 
     def __str__(self):
@@ -186,13 +239,16 @@ class DependencyTree(Tree):
         self.compositors = {}
         self.modifiers = {}
         self._available_only = available_only
+        # (dataset key, query, reader names) -> name of the node the key was resolved to
+        self._resolved_keys = {}
         self.update_compositors_and_modifiers(compositors or {}, modifiers or {})
 
     def update_compositors_and_modifiers(self, compositors: dict, modifiers: dict) -> None:
         """Add additional compositors and modifiers to the tree.
 
         Provided dictionaries and the first sub-level dictionaries are copied
-        to avoid modifying the input.
+        to avoid modifying the input. The keys resolved previously are
+        forgotten if new compositors or modifiers are added.
 
         Args:
             compositors (dict):
@@ -201,10 +257,23 @@ class DependencyTree(Tree):
                 Sensor name -> Modifier name -> (Modifier Class, modifier options)
 
         """
+        updated = False
         for sensor_name, sensor_comps in compositors.items():
-            self.compositors.setdefault(sensor_name, DatasetDict()).update(sensor_comps)
+            known_comps = self.compositors.setdefault(sensor_name, DatasetDict())
+            new_comps = {comp_id: comp for comp_id, comp in sensor_comps.items()
+                         if dict.get(known_comps, comp_id) is not comp}
+            if new_comps:
+                known_comps.update(new_comps)
+                updated = True
         for sensor_name, sensor_mods in modifiers.items():
-            self.modifiers.setdefault(sensor_name, {}).update(sensor_mods)
+            known_mods = self.modifiers.setdefault(sensor_name, {})
+            new_mods = {mod_name: mod for mod_name, mod in sensor_mods.items()
+                        if known_mods.get(mod_name) is not mod}
+            if new_mods:
+                known_mods.update(new_mods)
+                updated = True
+        if updated:
+            self._resolved_keys.clear()
 
     def copy(self):
         """Copy this node tree.
@@ -214,15 +283,18 @@ class DependencyTree(Tree):
         data. Theoretically it should be possible for tree copies to request
         compositor or modifier information as long as they don't depend on
         any datasets not already existing in the dependency tree.
+
+        The nodes are shared between the trees and only copied when one of
+        the trees is modified, so copying a tree that is only read from
+        afterwards (e.g. when resampling a Scene) is cheap.
         """
         new_tree = DependencyTree({}, self.compositors, self.modifiers)
-        for c in self._root.children:
-            c = c.copy(node_cache=new_tree._all_nodes)
-            new_tree.add_child(new_tree._root, c)
+        self._share_nodes_with(new_tree)
         return new_tree
 
     def update_node_name(self, node, new_name):
         """Update 'name' property of a node and any related metadata."""
+        self._prepare_nodes_for_update()
         old_name = node.name
         if old_name not in self._all_nodes:
             raise RuntimeError
@@ -242,6 +314,7 @@ class DependencyTree(Tree):
             (Node, set): Root node of the dependency tree and a set of unknown datasets
 
         """
+        self._prepare_nodes_for_update()
         unknown_datasets = list()
         known_nodes = list()
         for key in dataset_keys.copy():
@@ -272,6 +345,20 @@ class DependencyTree(Tree):
                                `satpy.readers.get_key` for more details.
 
         """
+        resolved_key = self._get_resolved_key(dataset_key, query)
+        try:
+            node = self.getitem(self._resolved_keys[resolved_key])
+        except (KeyError, TypeError):
+            # not resolved yet, or the node was renamed since
+            node = self._resolve_subtree_for_key(dataset_key, query)
+            with suppress(TypeError):
+                self._resolved_keys[resolved_key] = node.name
+        return node
+
+    def _get_resolved_key(self, dataset_key, query):
+        return dataset_key, query, self._available_only, tuple(sorted(self.readers))
+
+    def _resolve_subtree_for_key(self, dataset_key, query=None):
         # 0 check if the *exact* dataset is already loaded
         try:
             node = self._get_subtree_for_existing_key(dataset_key)
@@ -582,7 +669,7 @@ class DependencyTree(Tree):
         return prereq_nodes, unknown_datasets
 
 
-class _DataIDContainer(dict):
+class _DataIDContainer(DataIDDict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
     Note: Internal dictionary keys are `DataID` objects.
@@ -604,7 +691,7 @@ class _DataIDContainer(dict):
                                 wavelength.
 
         """
-        return get_key(match_key, self.keys())
+        return get_key(match_key, self)
 
     def __getitem__(self, item):
         """Get item from container."""
@@ -22,7 +22,9 @@ import datetime as dt
 import hashlib
 import os
 import shutil
+import threading
 import warnings
+import weakref
 from functools import update_wrapper
 from glob import glob
 from typing import Any, Callable, Optional, Union
@@ -255,6 +257,84 @@ def cache_to_zarr_if(
     return _decorator
 
 
+class SwathCacheHelper:
+    """Helper for caching function results in memory for each swath geometry.
+
+    It is recommended to use this class through the :func:`cache_per_swath`
+    decorator.
+
+    Results are only cached when one of the positional arguments is a
+    :class:`~pyresample.geometry.SwathDefinition`. They are stored per swath
+    object, which is identified by its identity rather than by its (costly
+    to hash) coordinates, and keyed by the other arguments, typically the
+    observation time and the chunks. All the datasets of a Scene sharing the
+    same swath object, the angles are thus computed once for all the
+    modifiers needing them. The cached results of a swath are dropped when
+    the swath object is garbage collected.
+
+    Args:
+        func: Function that will be called to generate the value to cache.
+
+    """
+
+    def __init__(self, func: Callable):
+        """Hold on to provided arguments for future use."""
+        self._func = func
+        self._caches: dict[int, dict] = {}
+        self._lock = threading.Lock()
+
+    def cache_clear(self, *args, **kwargs):
+        """Remove all the cached results.
+
+        If the decorated function has a ``cache_clear`` method too, like
+        functions decorated with :func:`cache_to_zarr_if`, it is called with
+        the provided arguments.
+
+        """
+        with self._lock:
+            self._caches.clear()
+        if hasattr(self._func, "cache_clear"):
+            self._func.cache_clear(*args, **kwargs)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Call the decorated function, or get its cached result."""
+        swath = next((arg for arg in args if isinstance(arg, SwathDefinition)), None)
+        if swath is None:
+            return self._func(*args, **kwargs)
+        key = (tuple(None if arg is swath else arg for arg in args), tuple(sorted(kwargs.items())))
+        try:
+            return self._get_swath_cache(swath)[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments
+            return self._func(*args, **kwargs)
+        res = self._func(*args, **kwargs)
+        self._get_swath_cache(swath)[key] = res
+        return res
+
+    def _get_swath_cache(self, swath: SwathDefinition) -> dict:
+        swath_id = id(swath)
+        with self._lock:
+            if swath_id not in self._caches:
+                self._caches[swath_id] = {}
+                weakref.finalize(swath, self._remove_swath_cache, swath_id)
+            return self._caches[swath_id]
+
+    def _remove_swath_cache(self, swath_id: int):
+        with self._lock:
+            self._caches.pop(swath_id, None)
+
+
+def cache_per_swath(func: Callable) -> Callable:
+    """Decorate a function and cache its results in memory for each swath geometry.
+
+    See :class:`SwathCacheHelper` for more information.
+
+    """
+    return update_wrapper(SwathCacheHelper(func), func, updated=())
+
+
 def _hash_args(*args, unhashable_types=DEFAULT_UNCACHE_TYPES):
     import json
     hashable_args = []
@@ -359,7 +439,8 @@ def get_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray, xr.D
     Note that this function can benefit from the ``satpy.config`` parameters
     :ref:`cache_lonlats <config_cache_lonlats_setting>` and
     :ref:`cache_sensor_angles <config_cache_sensor_angles_setting>`
-    being set to ``True``.
+    being set to ``True``. For swath data, the angles are always cached in
+    memory for each swath object, see :func:`cache_per_swath`.
 
     Args:
         data_arr: DataArray to get angles for. Information extracted from this
@@ -410,6 +491,7 @@ def get_cos_sza(data_arr: xr.DataArray) -> xr.DataArray:
     return _geo_dask_to_data_array(cos_sza)
 
 
+@cache_per_swath
 @cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
 def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto") -> tuple[da.Array, da.Array]:
     with ignore_invalid_float_warnings():
@@ -422,15 +504,20 @@ def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto"
 
 def _get_sun_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
     chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats,
-                         data_arr.attrs["start_time"],
+    suna, sunz = _get_sun_angles_from_area(data_arr.attrs["area"], data_arr.attrs["start_time"], chunks)
+    suna = _geo_dask_to_data_array(suna)
+    sunz = _geo_dask_to_data_array(sunz)
+    return suna, sunz
+
+
+@cache_per_swath
+def _get_sun_angles_from_area(area: PRGeometry, start_time: dt.datetime, chunks) -> tuple[da.Array, da.Array]:
+    lons, lats = _get_valid_lonlats(area, chunks)
+    suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats, start_time,
                          dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
                          chunks=lons.chunks)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
+    cos_sza = _get_cos_sza(start_time, lons, lats)
     sunz = np.rad2deg(np.arccos(cos_sza))
-    suna = _geo_dask_to_data_array(suna)
-    sunz = _geo_dask_to_data_array(sunz)
     return suna, sunz
 
 
@@ -489,6 +576,7 @@ def _dim_index_with_default(dims: tuple, dim_name: str, default: int) -> int:
         return default
 
 
+@cache_per_swath
 @cache_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args)
 def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_def, chunks):
     lons, lats = _get_valid_lonlats(area_def, chunks)
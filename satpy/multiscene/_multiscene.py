@@ -19,10 +19,12 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 import warnings
-from queue import Queue
-from threading import Thread
+from importlib.util import find_spec
+from queue import Full, Queue
+from threading import Event, Thread
 from typing import Callable, Collection, Mapping
 
 import dask.array as da
@@ -38,10 +40,17 @@ try:
 except ImportError:
     imageio = None
 
-try:
-    from dask.distributed import get_client
-except ImportError:
-    get_client = None
+
+def _get_distributed_client():
+    """Get the current dask distributed client.
+
+    ``dask.distributed`` is slow to import, so it is only imported when needed.
+    """
+    from dask.distributed import get_client as get_current_client
+    return get_current_client()
+
+
+get_client = _get_distributed_client if find_spec("distributed") is not None else None
 
 log = logging.getLogger(__name__)
 
@@ -115,13 +124,74 @@ class _GroupAliasGenerator:
         return dataset.attrs["_satpy_id"].to_dict().keys()
 
 
+_PREFETCH_END = object()
+
+
+def _prefetch(iterable, prefetch):
+    """Iterate over *iterable*, getting up to *prefetch* items in advance in a background thread."""
+    if prefetch < 1:
+        yield from iterable
+        return
+
+    items = Queue(prefetch)
+    stop = Event()
+    # daemon thread so it is killed if an error is raised from the main thread
+    producer = Thread(target=_produce_items, args=(iterable, items, stop), daemon=True)
+    producer.start()
+    try:
+        err = yield from _consume_items(items)
+    finally:
+        stop.set()
+        producer.join()
+    if err is not None:
+        raise err
+
+
+def _consume_items(items):
+    """Yield the items of the *items* queue until the end, returning the error raised when producing them."""
+    while True:
+        item, err = items.get()
+        if item is _PREFETCH_END:
+            return err
+        yield item
+
+
+def _produce_items(iterable, items, stop):
+    """Put the items of *iterable* in the *items* queue, followed by the end marker and the error raised if any."""
+    try:
+        for item in iterable:
+            if not _put_item(items, (item, None), stop):
+                return
+    except Exception as err:
+        _put_item(items, (_PREFETCH_END, err), stop)
+    else:
+        _put_item(items, (_PREFETCH_END, None), stop)
+
+
+def _put_item(items, item, stop):
+    """Put *item* in the *items* queue, unless *stop* is set before there is room for it."""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+        except Full:
+            continue
+        return True
+    return False
+
+
 class _SceneGenerator(object):
-    """Fancy way of caching Scenes from a generator."""
+    """Fancy way of caching Scenes from a generator.
+
+    When *cache* is False only the first Scene is kept, so the Scenes can
+    only be iterated over once after that.
+    """
 
-    def __init__(self, scene_gen):
+    def __init__(self, scene_gen, cache=True):
         self._scene_gen = scene_gen
         self._scene_cache = []
         self._dataset_idx = {}
+        self._cache = cache
+        self._streaming_iter = None
         # this class itself is not an iterator, make one
         self._self_iter = self._create_cached_iter()
 
@@ -133,14 +203,18 @@ class _SceneGenerator(object):
     def _create_cached_iter(self):
         """Iterate over the provided scenes, caching them for later."""
         for scn in self._scene_gen:
-            self._scene_cache.append(scn)
+            if self._cache or not self._scene_cache:
+                self._scene_cache.append(scn)
             yield scn
 
     def __iter__(self):
         """Iterate over the provided scenes, caching them for later."""
         idx = 0
+        streaming_iter = object()
         while True:
             if idx >= len(self._scene_cache):
+                if not self._cache and idx > 0:
+                    self._check_single_iteration(streaming_iter)
                 try:
                     scn = next(self._self_iter)
                 except StopIteration:
@@ -150,6 +224,12 @@ class _SceneGenerator(object):
             yield scn
             idx += 1
 
+    def _check_single_iteration(self, streaming_iter):
+        if self._streaming_iter is None:
+            self._streaming_iter = streaming_iter
+        elif self._streaming_iter is not streaming_iter:
+            raise RuntimeError("The Scenes of a streaming MultiScene can only be iterated over once.")
+
     def __getitem__(self, ds_id):
         """Get a specific dataset from the scenes."""
         for scn in self:
@@ -159,12 +239,23 @@ class _SceneGenerator(object):
 class MultiScene(object):
     """Container for multiple `Scene` objects."""
 
-    def __init__(self, scenes=None):
+    def __init__(self, scenes=None, streaming=False, prefetch=1):
         """Initialize MultiScene and validate sub-scenes.
 
         Args:
             scenes (iterable):
                 `Scene` objects to operate on (optional)
+            streaming (bool):
+                Process the Scenes of a generator one after the other without
+                keeping them in memory. The Scenes can then only be iterated
+                over once, so operations that need all of them at the same
+                time (like :meth:`blend` or the :attr:`scenes` property) are
+                not available. Default is False.
+            prefetch (int):
+                Number of Scenes to create in a background thread, along with
+                the loading and resampling requested, while the current Scene
+                is being saved. Only used when ``streaming`` is True.
+                Default is 1.
 
         .. note::
 
@@ -176,9 +267,11 @@ class MultiScene(object):
             ``MultiScene(list(scenes))``.
 
         """
+        self._streaming = streaming
+        self._prefetch = prefetch
         self._scenes = scenes or []
         scenes = iter(self._scenes)
-        self._scene_gen = _SceneGenerator(iter(scenes))
+        self._scene_gen = _SceneGenerator(iter(scenes), cache=not streaming)
         # if we were originally given a generator-like object then we want to
         # coordinate the loading between _SceneGenerator and _scenes
         # otherwise it doesn't really matter and other operations may prefer
@@ -198,6 +291,8 @@ class MultiScene(object):
             reader: str | Collection[str] | None = None,
             ensure_all_readers: bool = False,
             scene_kwargs: Mapping | None = None,
+            streaming: bool = False,
+            prefetch: int = 1,
             **kwargs
     ):
         """Create multiple Scene objects from multiple files.
@@ -210,6 +305,9 @@ class MultiScene(object):
                 all scenes where at least one reader has at least one file.
             scene_kwargs: additional arguments to pass on to
                 :func:`Scene.__init__` for each created scene.
+            streaming: Process the scenes one after the other without keeping
+                them in memory, see :class:`MultiScene`.
+            prefetch: Number of scenes to prepare in advance when streaming.
 
         This uses the :func:`satpy.readers.group_files` function to group
         files. See this function for more details on additional possible
@@ -232,13 +330,20 @@ class MultiScene(object):
             )
             file_groups = [fg for fg in file_groups if all(fg.values())]
         scenes = (Scene(filenames=fg, **scene_kwargs) for fg in file_groups)
-        return cls(scenes)
+        return cls(scenes, streaming=streaming, prefetch=prefetch)
 
     def __iter__(self):
         """Iterate over the provided Scenes once."""
         for scn in self._scenes:
             yield scn
 
+    def _iter_scenes(self):
+        """Iterate over the Scenes, preparing the next ones in advance when streaming."""
+        scenes = iter(self._scenes)
+        if self._streaming and self.is_generator:
+            return _prefetch(scenes, self._prefetch)
+        return scenes
+
     @property
     def scenes(self):
         """Get list of Scene objects contained in this MultiScene.
@@ -250,6 +355,9 @@ class MultiScene(object):
             will load/iterate through the generator possibly
 
         """
+        if self.is_generator and self._streaming:
+            raise RuntimeError("The Scenes of a streaming MultiScene are not kept in memory, "
+                               "iterate over the MultiScene instead.")
         if self.is_generator:
             log.debug("Forcing iteration of generator-like object of Scenes")
             self._scenes = list(self._scenes)
@@ -308,8 +416,8 @@ class MultiScene(object):
         new_gen = self._call_scene_func(gen, func_name, create_new_scene, *args, **kwargs)
         new_gen = new_gen if self.is_generator else list(new_gen)
         if create_new_scene:
-            return self.__class__(new_gen)
-        self._scene_gen = _SceneGenerator(new_gen)
+            return self.__class__(new_gen, streaming=self._streaming, prefetch=self._prefetch)
+        self._scene_gen = _SceneGenerator(new_gen, cache=not self._streaming)
         self._scenes = iter(self._scene_gen)
 
     def load(self, *args, **kwargs):
@@ -406,7 +514,8 @@ class MultiScene(object):
                 # given a target, source combination
                 raise NotImplementedError("Distributed save_datasets does not support writers "
                                           "that return (source, target) combinations at this time. Use "
-                                          "the non-distributed save_datasets instead.")
+                                          "the non-distributed save_datasets instead or pass "
+                                          "'process_safe=True' to image writers.")
             future = client.compute(delayeds)
             input_q.put(future)
         input_q.put(None)
@@ -426,7 +535,10 @@ class MultiScene(object):
         Note that some writers may not be multi-process friendly and may
         produce unexpected results or fail by raising an exception. In
         these cases ``client`` should be set to ``False``.
-        This is currently a known issue for basic 'geotiff' writer work loads.
+        Image writers like the 'geotiff' writer can be used with a client if
+        ``process_safe=True`` is passed so every file is written by the
+        worker process computing it (see
+        :meth:`satpy.writers.ImageWriter.save_dataset`).
 
         Args:
             batch_size (int): Number of scenes to compute at the same time.
@@ -452,7 +564,7 @@ class MultiScene(object):
 
         client = self._get_client(client=client)
 
-        scenes = iter(self._scenes)
+        scenes = self._iter_scenes()
         if client is not None:
             self._distribute_save_datasets(scenes, client, batch_size=batch_size, **kwargs)
         else:
@@ -601,9 +713,12 @@ class MultiScene(object):
         scene_gen = self._scene_gen
 
         first_scene = self.first_scene
-        scenes = iter(self._scene_gen)
+        scenes = self._iter_scenes() if self._streaming else iter(self._scene_gen)
         info_scenes = [first_scene]
         if "end_time" in filename:
+            if self._streaming and self.is_generator:
+                raise ValueError("The filename can't contain 'end_time' when saving a streaming MultiScene, "
+                                 "as all the Scenes would have to be kept in memory to get it.")
             # if we need the last scene to generate the filename
             # then compute all the scenes so we can figure it out
             log.debug("Generating scenes to compute end_time for filename")
@@ -617,14 +732,20 @@ class MultiScene(object):
         if not dataset_ids:
             raise RuntimeError("No datasets found for saving (resampling may be needed to generate composites)")
 
+        if self._streaming:
+            # the scenes can only be iterated over once, share them between the datasets
+            scene_iters = itertools.tee(scenes, len(dataset_ids))
         writers = {}
         frames = {}
-        for dataset_id in dataset_ids:
+        for idx, dataset_id in enumerate(dataset_ids):
             if not self.is_generator and not self._all_same_area([dataset_id]):
                 raise ValueError("Sub-scene datasets must all be on the same "
                                  "area (see the 'resample' method).")
 
-            all_datasets = scene_gen[dataset_id]
+            if self._streaming:
+                all_datasets = (scn.get(dataset_id) for scn in scene_iters[idx])
+            else:
+                all_datasets = scene_gen[dataset_id]
             info_datasets = [scn.get(dataset_id) for scn in info_scenes]
             this_fn, shape, this_fill = self._get_animation_info(info_datasets, filename, fill_value=fill_value)
             data_to_write = self._get_animation_frames(
@@ -661,7 +782,9 @@ class MultiScene(object):
         Args:
             filename (str): Filename to save to. Can include python string
                             formatting keys from dataset ``.attrs``
-                            (ex. "{name}_{start_time:%Y%m%d_%H%M%S.gif")
+                            (ex. "{name}_{start_time:%Y%m%d_%H%M%S.gif").
+                            ``end_time`` can't be used when the MultiScene
+                            is streaming.
             datasets (list): DataIDs to save (default: all datasets)
             fps (int): Frames per second for produced animation
             fill_value (int): Value to use instead creating an alpha band.
@@ -19,10 +19,7 @@
 
 import logging
 
-import yaml
-from yaml import UnsafeLoader
-
-from satpy._config import config_search_paths
+from satpy._config import config_search_paths, load_yaml_config
 from satpy.utils import recursive_dict_update
 
 LOG = logging.getLogger(__name__)
@@ -60,5 +57,4 @@ class Plugin(object):
 
     def load_yaml_config(self, conf):
         """Load a YAML configuration file and recursively update the overall configuration."""
-        with open(conf, "r", encoding="utf-8") as fd:
-            self.config = recursive_dict_update(self.config, yaml.load(fd, Loader=UnsafeLoader))
+        self.config = recursive_dict_update(self.config, load_yaml_config(conf))
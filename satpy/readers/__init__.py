@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import glob
 import logging
 import os
 import pathlib
@@ -33,7 +34,7 @@ from yaml import UnsafeLoader
 
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
 
-from .yaml_reader import AbstractYAMLReader
+from .yaml_reader import AbstractYAMLReader, FilenamePatternIndex
 from .yaml_reader import load_yaml_configs as load_yaml_reader_configs
 
 LOG = logging.getLogger(__name__)
@@ -135,10 +136,25 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
         (reader_configs, filenames).
     """
     files_to_sort = set(files_to_sort)
+    readers = list(_load_readers_for_assignment(reader_names, reader_kwargs))
     reader_dict = {}
+    for reader, candidates in zip(readers, _match_files_to_readers(files_to_sort, readers)):
+        reader_name = reader.info["name"]
+        files_matching = set(reader.filter_selected_filenames(candidates & files_to_sort))
+        files_to_sort -= files_matching
+        if files_matching or reader_names is not None:
+            reader_dict[reader_name] = (reader, files_matching)
+    if files_to_sort:
+        raise ValueError("No matching readers found for these files: " +
+                         ", ".join(files_to_sort))
+    return reader_dict
+
+
+def _load_readers_for_assignment(reader_names, reader_kwargs):
+    """Load the readers to assign files to, skipping those that can't be loaded."""
     for reader_configs in configs_for_reader(reader_names):
         try:
-            reader = load_reader(reader_configs, **reader_kwargs)
+            yield load_reader(reader_configs, **reader_kwargs)
         except yaml.constructor.ConstructorError:
             LOG.exception(
                     f"ConstructorError loading {reader_configs!s}, "
@@ -146,16 +162,21 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
                     "corresponding reader (if you did not explicitly "
                     "specify the reader, Satpy tries all; performance "
                     "will improve if you pass readers explicitly).")
-            continue
-        reader_name = reader.info["name"]
-        files_matching = set(reader.filter_selected_filenames(files_to_sort))
-        files_to_sort -= files_matching
-        if files_matching or reader_names is not None:
-            reader_dict[reader_name] = (reader, files_matching)
-    if files_to_sort:
-        raise ValueError("No matching readers found for these files: " +
-                         ", ".join(files_to_sort))
-    return reader_dict
+
+
+def _match_files_to_readers(files, readers):
+    """Get the files matching any file pattern of each reader.
+
+    The files are matched to the patterns of all the readers in a single pass,
+    so that each reader only has to check the files it can handle.
+
+    Returns:
+        List with the set of candidate files for each reader.
+    """
+    pattern_index = FilenamePatternIndex(pattern for reader in readers for pattern in reader.file_patterns)
+    matches = pattern_index.classify(files)
+    return [set().union(*(matches[pattern] for pattern in reader.file_patterns))
+            for reader in readers]
 
 
 def _get_file_keys_for_reader_files(reader_files, group_keys=None):
@@ -473,44 +494,50 @@ def find_files_and_readers(start_time=None, end_time=None, base_dir=None,
     reader_files = {}
     reader_kwargs = reader_kwargs or {}
     filter_parameters = filter_parameters or reader_kwargs.get("filter_parameters", {})
-    sensor_supported = False
 
     if start_time or end_time:
         filter_parameters["start_time"] = start_time
         filter_parameters["end_time"] = end_time
     reader_kwargs["filter_parameters"] = filter_parameters
 
+    readers = []
     for reader_configs in configs_for_reader(reader):
-        (reader_instance, loadables, this_sensor_supported) = _get_loadables_for_reader_config(
-                base_dir, reader, sensor, reader_configs, reader_kwargs, fs)
-        sensor_supported = sensor_supported or this_sensor_supported
-        if loadables:
-            reader_files[reader_instance.name] = list(loadables)
+        reader_instance = _get_reader_for_sensor(reader, sensor, reader_configs, reader_kwargs)
+        if reader_instance is not None:
+            readers.append(reader_instance)
 
-    if sensor and not sensor_supported:
+    if sensor and not readers:
         raise ValueError("Sensor '{}' not supported by any readers".format(sensor))
 
+    pattern_matches = _match_directory_to_readers(base_dir, fs, readers)
+    for reader_instance in readers:
+        loadables = reader_instance.select_files_from_directory(base_dir, fs, pattern_matches=pattern_matches)
+        if loadables:
+            loadables = list(reader_instance.filter_selected_filenames(loadables))
+        if loadables:
+            reader_files[reader_instance.name] = loadables
+
     if not (reader_files or missing_ok):
         raise ValueError("No supported files found")
     return reader_files
 
 
-def _get_loadables_for_reader_config(base_dir, reader, sensor, reader_configs,
-                                     reader_kwargs, fs):
-    """Get loadables for reader configs.
+def _get_reader_for_sensor(reader, sensor, reader_configs, reader_kwargs):
+    """Load a reader for find_files_and_readers.
 
     Helper for find_files_and_readers.
 
     Args:
-        base_dir: as for `find_files_and_readers`
         reader: as for `find_files_and_readers`
         sensor: as for `find_files_and_readers`
         reader_configs: reader metadata such as returned by
             `configs_for_reader`.
         reader_kwargs: Keyword arguments to be passed to reader.
-        fs (FileSystem): as for `find_files_and_readers`
+
+    Returns:
+        The reader instance, or None if the reader can't be loaded or doesn't
+        support *sensor*.
     """
-    sensor_supported = False
     try:
         reader_instance = load_reader(reader_configs, **reader_kwargs)
     except (KeyError, IOError, yaml.YAMLError) as err:
@@ -519,18 +546,32 @@ def _get_loadables_for_reader_config(base_dir, reader, sensor, reader_configs,
         if reader and (isinstance(reader, str) or len(reader) == 1):
             # if it is a single reader then give a more usable error
             raise
-        return (None, [], False)
+        return None
 
     if not reader_instance.supports_sensor(sensor):
-        return (reader_instance, [], False)
-    if sensor is not None:
-        # sensor was specified and a reader supports it
-        sensor_supported = True
-    loadables = reader_instance.select_files_from_directory(base_dir, fs)
-    if loadables:
-        loadables = list(
-            reader_instance.filter_selected_filenames(loadables))
-    return (reader_instance, loadables, sensor_supported)
+        return None
+    return reader_instance
+
+
+def _match_directory_to_readers(base_dir, fs, readers):
+    """Match the files of *base_dir* to the file patterns of all *readers*.
+
+    Helper for find_files_and_readers. The directory is listed once and its
+    files are matched to the patterns of all the readers in a single pass,
+    instead of globbing the directory once per pattern. Patterns spanning
+    subdirectories or matching hidden files are left out, the readers glob
+    those themselves.
+
+    Returns:
+        dict mapping file patterns to the set of matching paths, to be passed
+        as ``pattern_matches`` to ``select_files_from_directory``.
+    """
+    patterns = [pattern for reader in readers for pattern in reader.file_patterns
+                if os.path.sep not in pattern and not pattern.startswith(".")]
+    if not patterns:
+        return {}
+    matcher = glob.iglob if fs is None else fs.glob
+    return FilenamePatternIndex(patterns).classify(matcher(os.path.join(base_dir or "", "*")))
 
 
 def load_readers(filenames=None, reader=None, reader_kwargs=None):
@@ -545,7 +586,11 @@ def load_readers(filenames=None, reader=None, reader_kwargs=None):
             reader instances, or a mapping of reader names to dictionaries.  If
             the keys of ``reader_kwargs`` match exactly the list of strings in
             ``reader`` or the keys of filenames, each reader instance will get its
-            own keyword arguments accordingly.
+            own keyword arguments accordingly. Besides ``filter_parameters``,
+            file based readers accept ``fh_workers`` (int) to create their file
+            handlers on a pool of threads (see
+            :class:`~satpy.readers.yaml_reader.FileYAMLReader`). These two
+            keywords are not passed on to the file handlers.
 
     Returns: Dictionary mapping reader name to reader instance
 
@@ -650,6 +695,7 @@ def _get_reader_kwargs(reader, reader_kwargs):
     for (k, v) in reader_kwargs.items():
         reader_kwargs_without_filter[k] = v.copy()
         reader_kwargs_without_filter[k].pop("filter_parameters", None)
+        reader_kwargs_without_filter[k].pop("fh_workers", None)
 
     return (reader_kwargs, reader_kwargs_without_filter)
 
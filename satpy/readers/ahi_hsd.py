@@ -60,8 +60,10 @@ in a way to produce as consistent a position between bands as possible.
 """
 
 import datetime as dt
+import functools
 import logging
 import os
+import pickle  # nosec
 import warnings
 
 import dask.array as da
@@ -73,6 +75,8 @@ from satpy.readers._geos_area import get_area_definition, get_area_extent
 from satpy.readers.file_handlers import BaseFileHandler
 from satpy.readers.utils import (
     apply_rad_correction,
+    cached_file_metadata,
+    calibrate_with_lut,
     get_earth_radius,
     get_geostationary_mask,
     get_user_calibration_factors,
@@ -350,6 +354,8 @@ class AHIHSDFileHandler(BaseFileHandler):
 
     """
 
+    concurrent_creation = True
+
     def __init__(self, filename, filename_info, filetype_info,
                  mask_space=True, calib_mode="update",
                  user_calibration=None, round_actual_position=True):
@@ -358,6 +364,7 @@ class AHIHSDFileHandler(BaseFileHandler):
                                                 filetype_info)
 
         self.is_zipped = False
+        self._source_filename = filename
         self._unzipped = unzip_file(self.filename, prefix=str(filename_info["segment"]).zfill(2))
         # Assume file is not zipped
         if self._unzipped:
@@ -375,19 +382,8 @@ class AHIHSDFileHandler(BaseFileHandler):
         self.segment_number = filename_info["segment"]
         self.total_segments = filename_info["total_segments"]
 
-        with open(self.filename) as fd:
-            self.basic_info = np.fromfile(fd,
-                                          dtype=_BASIC_INFO_TYPE,
-                                          count=1)
-            self.data_info = np.fromfile(fd,
-                                         dtype=_DATA_INFO_TYPE,
-                                         count=1)
-            self.proj_info = np.fromfile(fd,
-                                         dtype=_PROJ_INFO_TYPE,
-                                         count=1)[0]
-            self.nav_info = np.fromfile(fd,
-                                        dtype=_NAV_INFO_TYPE,
-                                        count=1)[0]
+        (self.basic_info, self.data_info,
+         self.proj_info, self.nav_info) = cached_file_metadata(self._source_filename, self._read_basic_headers)
         self.platform_name = np2str(self.basic_info["satellite"])
         self.observation_area = np2str(self.basic_info["observation_area"])
         self.sensor = "ahi"
@@ -402,6 +398,23 @@ class AHIHSDFileHandler(BaseFileHandler):
         self.user_calibration = user_calibration
         self._round_actual_position = round_actual_position
 
+    def _read_basic_headers(self):
+        """Read the header blocks needed to describe the file."""
+        with open(self.filename) as fd:
+            basic_info = np.fromfile(fd,
+                                     dtype=_BASIC_INFO_TYPE,
+                                     count=1)
+            data_info = np.fromfile(fd,
+                                    dtype=_DATA_INFO_TYPE,
+                                    count=1)
+            proj_info = np.fromfile(fd,
+                                    dtype=_PROJ_INFO_TYPE,
+                                    count=1)[0]
+            nav_info = np.fromfile(fd,
+                                   dtype=_NAV_INFO_TYPE,
+                                   count=1)[0]
+        return basic_info, data_info, proj_info, nav_info
+
     def __del__(self):
         """Delete the object."""
         if self.is_zipped and os.path.exists(self.filename):
@@ -584,7 +597,13 @@ class AHIHSDFileHandler(BaseFileHandler):
 
         return header
 
-    def _read_data(self, fp_, header, resolution):
+    def _read_header_and_data_offset(self):
+        """Read the full header and get the position of the data in the file."""
+        with open(self.filename, "rb") as fp_:
+            header = self._read_header(fp_)
+            return header, fp_.tell()
+
+    def _read_data(self, data_offset, header, resolution):
         """Read data block."""
         nlines = int(header["block2"]["number_of_lines"].item())
         ncols = int(header["block2"]["number_of_columns"].item())
@@ -596,7 +615,7 @@ class AHIHSDFileHandler(BaseFileHandler):
             (int(resolution / 500), int(resolution / 500)),
             np.float32,
         )
-        return da.from_array(np.memmap(self.filename, offset=fp_.tell(),
+        return da.from_array(np.memmap(self.filename, offset=data_offset,
                                        dtype="<u2", shape=(nlines, ncols), mode="r"),
                              chunks=chunks)
 
@@ -612,10 +631,11 @@ class AHIHSDFileHandler(BaseFileHandler):
 
     def read_band(self, key, ds_info):
         """Read the data."""
-        with open(self.filename, "rb") as fp_:
-            self._header = self._read_header(fp_)
-            res = self._read_data(fp_, self._header, key["resolution"])
-        res = self._mask_invalid(data=res, header=self._header)
+        self._header, data_offset = cached_file_metadata(self._source_filename,
+                                                         self._read_header_and_data_offset)
+        res = self._read_data(data_offset, self._header, key["resolution"])
+        if key["calibration"] == "counts":
+            res = self._mask_invalid(data=res, header=self._header)
         res = self.calibrate(res, key["calibration"])
 
         new_info = self._get_metadata(key, ds_info)
@@ -669,10 +689,27 @@ class AHIHSDFileHandler(BaseFileHandler):
         return new_info
 
     def calibrate(self, data, calibration):
-        """Calibrate the data."""
+        """Calibrate the data.
+
+        Raw integer counts are masked for invalid pixels and calibrated through
+        a lookup table shared by all segments of the band.
+        """
         if calibration == "counts":
             return data
+        return calibrate_with_lut(data, functools.partial(self._calibrate, calibration=calibration),
+                                  key=self._get_calibration_lut_key(calibration))
 
+    def _get_calibration_lut_key(self, calibration):
+        user_calibration = None
+        correction_type = self._get_user_calibration_correction_type()
+        if correction_type is not None:
+            user_calibration = (correction_type, repr(self.user_calibration.get(self.band_name)))
+        return (calibration, self.calib_mode, user_calibration,
+                pickle.dumps((self._header["block5"], self._header["calibration"])))
+
+    def _calibrate(self, data, calibration):
+        if np.issubdtype(data.dtype, np.integer):
+            data = self._mask_invalid(data=data, header=self._header)
         if calibration in ["radiance", "reflectance", "brightness_temperature"]:
             data = self.convert_to_radiance(data)
         if calibration == "reflectance":
@@ -47,6 +47,13 @@ def open_dataset(filename, *args, **kwargs):  # noqa: D417
 class BaseFileHandler:
     """Base file handler."""
 
+    #: Whether several instances of this class can be created at the same
+    #: time from different threads. Only file handlers that open and parse
+    #: their files without thread-unsafe libraries (e.g. netCDF4-python or
+    #: pyhdf) should set this to ``True``. See the ``fh_workers`` argument of
+    #: :class:`~satpy.readers.yaml_reader.FileYAMLReader`.
+    concurrent_creation = False
+
     def __init__(self, filename, filename_info, filetype_info):
         """Initialize file handler."""
         self.filename = filename
@@ -42,6 +42,7 @@ from satpy.readers.hrit_base import (
     base_hdr_map,
     image_data_function,
 )
+from satpy.readers.utils import calibrate_with_lut
 
 
 class CalibrationError(Exception):
@@ -430,10 +431,10 @@ class HRITGOESFileHandler(HRITFileHandler):
         tic = dt.datetime.now()
         if calibration == "counts":
             return data
-        if calibration == "reflectance":
-            res = self._calibrate(data)
-        elif calibration == "brightness_temperature":
-            res = self._calibrate(data)
+        if calibration in ("reflectance", "brightness_temperature"):
+            params = self.mda["calibration_parameters"]
+            key = (params["indices"].tobytes(), params["values"].tobytes(), params[b"_UNIT"])
+            res = calibrate_with_lut(data, self._calibrate, key=key)
         else:
             raise NotImplementedError("Don't know how to calibrate to " +
                                       str(calibration))
@@ -27,6 +27,7 @@ from dask.base import tokenize
 from pyhdf.SD import SD, SDC, SDS
 
 from satpy.readers.file_handlers import BaseFileHandler
+from satpy.readers.utils import FILE_HANDLE_POOL, PooledVariable
 from satpy.utils import get_legacy_chunk_size
 
 LOG = logging.getLogger(__name__)
@@ -65,18 +66,43 @@ def from_sds(var, src_path, **kwargs):
     return da.from_array(var, name=name, **kwargs)
 
 
+def _open_sd(filename):
+    """Open an HDF4 file for the pool of open files."""
+    return SD(filename, SDC.READ)
+
+
+def _select_sds(file_handle, name):
+    return file_handle.select(name)
+
+
 class HDF4FileHandler(BaseFileHandler):
-    """Base class for common HDF4 operations."""
+    """Base class for common HDF4 operations.
+
+    The datasets of the file keep it open for the lifetime of the file handler.
+    When the ``readers.max_open_files`` option of ``satpy.config`` is set, the
+    datasets are read through the process-wide pool of open files instead (see
+    :class:`satpy.readers.utils.FileHandlePool`).
+    """
+
+    _pooled = False
 
     def __init__(self, filename, filename_info, filetype_info):
         """Open file and collect information."""
         super(HDF4FileHandler, self).__init__(filename, filename_info, filetype_info)
         self.file_content = {}
-        file_handle = SD(self.filename, SDC.READ)
+        self._pooled = FILE_HANDLE_POOL.enabled
+        if self._pooled:
+            with FILE_HANDLE_POOL.open(self.filename, _open_sd) as file_handle:
+                self._collect_file_content(file_handle)
+        else:
+            file_handle = SD(self.filename, SDC.READ)
+            self._collect_file_content(file_handle)
+            del file_handle
+
+    def _collect_file_content(self, file_handle):
         self._collect_attrs("", file_handle.attributes())
         for k in file_handle.datasets().keys():
             self.collect_metadata(k, file_handle.select(k))
-        del file_handle
 
     def _collect_attrs(self, name, attrs):
         for key, value in attrs.items():
@@ -97,22 +123,34 @@ class HDF4FileHandler(BaseFileHandler):
     def collect_metadata(self, name, obj):
         """Collect all metadata about file content."""
         if isinstance(obj, SDS):
-            self.file_content[name] = obj
+            self.file_content[name] = self._get_pooled_variable(name, obj) if self._pooled else obj
             info = obj.info()
             self.file_content[name + "/dtype"] = np.dtype(HTYPE_TO_DTYPE.get(info[3]))
             self.file_content[name + "/shape"] = info[2] if isinstance(info[2], (int, float)) else tuple(info[2])
 
+    def _get_pooled_variable(self, name, obj):
+        """Describe the dataset *obj* without keeping a reference to the file."""
+        info = obj.info()
+        shape = info[2] if isinstance(info[2], (tuple, list)) else (info[2],)
+        return PooledVariable(self.filename, _open_sd, name, shape, np.dtype(HTYPE_TO_DTYPE[info[3]]),
+                              attrs=obj.attributes(), getter=_select_sds)
+
     def _open_xarray_dataset(self, val, chunks=CHUNK_SIZE):
         """Read the band in blocks."""
-        dask_arr = from_sds(val, self.filename, chunks=chunks)
-        attrs = val.attributes()
+        if isinstance(val, PooledVariable):
+            name = val.path + "-" + tokenize(os.fspath(self.filename), val.path, {"chunks": chunks})
+            dask_arr = da.from_array(val, chunks=chunks, name=name)
+            attrs = val.attrs
+        else:
+            dask_arr = from_sds(val, self.filename, chunks=chunks)
+            attrs = val.attributes()
         return xr.DataArray(dask_arr, dims=("y", "x"),
                             attrs=attrs)
 
     def __getitem__(self, key):
         """Get file content as xarray compatible objects."""
         val = self.file_content[key]
-        if isinstance(val, SDS):
+        if isinstance(val, (SDS, PooledVariable)):
             # these datasets are closed and inaccessible when the file is closed, need to reopen
             return self._open_xarray_dataset(val)
         return val
@@ -30,13 +30,19 @@ from dask.base import tokenize
 
 from satpy.readers import open_file_or_filename
 from satpy.readers.file_handlers import BaseFileHandler
-from satpy.readers.utils import np2str
+from satpy.readers.utils import FILE_HANDLE_POOL, PooledVariable, np2str
 
 LOG = logging.getLogger(__name__)
 
 
 class HDF5FileHandler(BaseFileHandler):
-    """Small class for inspecting a HDF5 file and retrieve its metadata/header data."""
+    """Small class for inspecting a HDF5 file and retrieve its metadata/header data.
+
+    When the ``readers.max_open_files`` option of ``satpy.config`` is set, the
+    datasets are read through the process-wide pool of open files (see
+    :class:`satpy.readers.utils.FileHandlePool`) instead of reopening the file
+    for every dataset.
+    """
 
     def __init__(self, filename, filename_info, filetype_info):
         """Initialize file handler."""
@@ -55,7 +61,10 @@ class HDF5FileHandler(BaseFileHandler):
 
         file_handle.visititems(self.collect_metadata)
         self._collect_attrs("", file_handle.attrs)
-        file_handle.close()
+        if FILE_HANDLE_POOL.enabled:
+            FILE_HANDLE_POOL.add(file_handle, self.filename, _open_h5py)
+        else:
+            file_handle.close()
 
     def _collect_attrs(self, name, attrs):
         attrs_cache = self._attrs_cache.setdefault(name, {})
@@ -101,12 +110,19 @@ class HDF5FileHandler(BaseFileHandler):
         """Get item for given key."""
         val = self.file_content[key]
         if isinstance(val, h5py.Dataset):
-            # these datasets are closed and inaccessible when the file is closed, need to reopen
-            f_obj = open_file_or_filename(self.filename)
-            dset = h5py.File(f_obj, "r")[key]
-            dset_data = from_h5_array(dset)
-            attrs = self._attrs_cache.get(key, dset.attrs)
-            if dset.ndim == 2:
+            if FILE_HANDLE_POOL.enabled:
+                with FILE_HANDLE_POOL.open(self.filename, _open_h5py) as h5f:
+                    dset = h5f[key]
+                    # the pooled file may be closed by the time the data are read
+                    dset_data = from_h5_array(dset, pooled_filename=self.filename)
+                    attrs = self._attrs_cache[key] if key in self._attrs_cache else dict(dset.attrs)
+            else:
+                # these datasets are closed and inaccessible when the file is closed, need to reopen
+                f_obj = open_file_or_filename(self.filename)
+                dset = h5py.File(f_obj, "r")[key]
+                dset_data = from_h5_array(dset)
+                attrs = self._attrs_cache.get(key, dset.attrs)
+            if dset_data.ndim == 2:
                 return xr.DataArray(dset_data, dims=["y", "x"], attrs=attrs)
             return xr.DataArray(dset_data, attrs=attrs)
 
@@ -124,12 +140,23 @@ class HDF5FileHandler(BaseFileHandler):
             return default
 
 
-def from_h5_array(h5dset):
-    """Create a dask array from an h5py dataset, ensuring uniqueness of the dask array name."""
+def from_h5_array(h5dset, pooled_filename=None):
+    """Create a dask array from an h5py dataset, ensuring uniqueness of the dask array name.
+
+    If *pooled_filename* is provided, the data are read from that file through the
+    pool of open files instead of the (possibly closed) file of *h5dset*.
+    """
     chunk_size = dc.get("array.chunk-size")
 
     chunks = normalize_chunks(chunk_size, dtype=h5dset.dtype, previous_chunks=h5dset.chunks, shape=h5dset.shape)
     name = h5dset.name + "-" + tokenize(os.fspath(h5dset.file.filename), h5dset.name, chunks)
 
+    if pooled_filename is not None:
+        h5dset = PooledVariable(pooled_filename, _open_h5py, h5dset.name, h5dset.shape, h5dset.dtype)
     dset_data = da.from_array(h5dset, chunks=chunks, name=name)
     return dset_data
+
+
+def _open_h5py(filename):
+    """Open an HDF5 file for the pool of open files."""
+    return h5py.File(open_file_or_filename(filename), "r")
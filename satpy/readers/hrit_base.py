@@ -23,6 +23,11 @@ the common building blocks for hrit reading.
 
 One of the features here is the on-the-fly decompression of hrit files when
 compressed hrit files are encountered (files finishing with `.C_`).
+
+Segments compressed with bzip2 (files finishing with `.bz2`) are decompressed
+in memory, straight into the array holding the data, without writing any
+temporary file. Each segment is read in its own dask task, so that several
+segments can be decompressed in parallel.
 """
 
 import datetime as dt
@@ -90,12 +95,17 @@ base_hdr_map = {0: primary_header,
 
 def decompress(infile):
     """Decompress an XRIT data file and return the decompressed buffer."""
+    with open(infile, mode="rb") as fh:
+        return decompress_buffer(fh.read())
+
+
+def decompress_buffer(buffer):
+    """Decompress the content of an XRIT data file and return the decompressed buffer."""
     from pyPublicDecompWT import xRITDecompress
 
     # decompress in-memory
-    with open(infile, mode="rb") as fh:
-        xrit = xRITDecompress()
-        xrit.decompress(fh.read())
+    xrit = xRITDecompress()
+    xrit.decompress(buffer)
 
     return xrit.data()
 
@@ -115,6 +125,8 @@ def get_header_content(fp, header_dtype, count=1):
 class HRITFileHandler(BaseFileHandler):
     """HRIT standard format reader."""
 
+    concurrent_creation = True
+
     def __init__(self, filename, filename_info, filetype_info, hdr_info):
         """Initialize the reader."""
         super(HRITFileHandler, self).__init__(filename, filename_info,
@@ -313,44 +325,18 @@ class HRITSegment:
         return data
 
     def _read_data_from_file(self):
-        if self._is_file_like():
-            return self._read_file_like()
-        return self._read_data_from_disk()
-
-    def _is_file_like(self):
-        return isinstance(self.filename, FSFile)
-
-    def _read_data_from_disk(self):
-        # For reading the image data, unzip_context is faster than generic_open
-        dtype, shape = self._get_input_info()
-        with utils.unzip_context(self.filename) as fn:
-
-            if self.compressed:
-                return np.frombuffer(
-                    decompress(fn),
-                    offset=self.offset,
-                    dtype=dtype,
-                    count=np.prod(shape)
-                )
-            else:
-                return np.fromfile(
-                    fn,
-                    offset=self.offset,
-                    dtype=dtype,
-                    count=np.prod(shape)
-                )
-
-    def _read_file_like(self):
-        # filename is likely to be a file-like object, already in memory
         dtype, shape = self._get_input_info()
+        count = int(np.prod(shape))
+        if self.compressed and not self.zipped and not self._is_file_like():
+            return np.frombuffer(decompress(self.filename), offset=self.offset, dtype=dtype, count=count)
         with utils.generic_open(self.filename, mode="rb") as fp:
-            no_elements = np.prod(shape)
+            if self.compressed:
+                return np.frombuffer(decompress_buffer(fp.read()), offset=self.offset, dtype=dtype, count=count)
             fp.seek(self.offset)
-            return np.frombuffer(
-                fp.read(np.dtype(dtype).itemsize * no_elements),
-                dtype=np.dtype(dtype),
-                count=no_elements.item()
-            ).reshape(shape)
+            return _read_into_array(fp, dtype, shape)
+
+    def _is_file_like(self):
+        return isinstance(self.filename, FSFile)
 
     def _get_input_info(self):
         total_bits = int(self.lines) * int(self.cols) * int(self.bpp)
@@ -364,3 +350,16 @@ class HRITSegment:
             raise ValueError(f"Unexpected number of bits per pixel: {self.bpp}")
         input_shape = (input_shape,)
         return input_dtype, input_shape
+
+
+def _read_into_array(fp, dtype, shape):
+    """Read the data from the current position of *fp* directly into a new array."""
+    data = np.empty(shape, dtype=dtype)
+    buffer = memoryview(data).cast("B")
+    position = 0
+    while position < buffer.nbytes:
+        nbytes = fp.readinto(buffer[position:])
+        if not nbytes:
+            raise ValueError(f"Expected {buffer.nbytes} bytes of data, got only {position}")
+        position += nbytes
+    return data
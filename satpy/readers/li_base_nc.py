@@ -191,7 +191,7 @@ import numpy as np
 import xarray as xr
 from pyproj import Proj
 
-from satpy.readers.netcdf_utils import NetCDF4FsspecFileHandler
+from satpy.readers.netcdf_utils import GroupPlaceholder, NetCDF4FsspecFileHandler
 
 logger = logging.getLogger(__name__)
 
@@ -397,7 +397,7 @@ class LINCFileHandler(NetCDF4FsspecFileHandler):
         # Check if the path is found:
         if var_path in self.file_content:
             # This is only a valid variable if it is not a netcdf group:
-            return not isinstance(self.file_content[var_path], netCDF4.Group)
+            return not isinstance(self.file_content[var_path], (netCDF4.Group, GroupPlaceholder))
 
         # Var path not in file_content:
         return False
@@ -26,7 +26,7 @@ import xarray as xr
 
 from satpy.readers import open_file_or_filename
 from satpy.readers.file_handlers import BaseFileHandler
-from satpy.readers.utils import np2str
+from satpy.readers.utils import FILE_HANDLE_POOL, PooledVariable, cached_file_metadata, np2str
 from satpy.utils import get_legacy_chunk_size
 
 LOG = logging.getLogger(__name__)
@@ -75,7 +75,20 @@ class NetCDF4FileHandler(BaseFileHandler):
     variable, a dask array will be created "manually".  This may be useful if
     you have a dataset distributed over many files, such as for FCI.  Note
     that the coordinates will be missing in this case.  If you use this option,
-    ``xarray_kwargs`` will have no effect.
+    ``xarray_kwargs`` will have no effect.  When the ``readers.max_open_files``
+    option of ``satpy.config`` is set, the handles are kept in the
+    process-wide pool of open files instead (see
+    :class:`satpy.readers.utils.FileHandlePool`), so at most that many files
+    are kept open and files are reopened when needed.
+
+    When the ``cache_file_metadata`` option of ``satpy.config`` is set and
+    neither ``cache_var_size`` nor ``cache_handle`` are used, the collected
+    file content is cached on disk (see
+    :func:`satpy.readers.utils.cached_file_metadata`) so that the file does not
+    need to be opened again when the file handler is created another time.
+    In this case variables and groups in the file content are replaced by
+    light-weight placeholders holding their name, dimensions, dtype, shape and
+    attributes.
 
     Args:
         filename (str): File to read
@@ -89,6 +102,7 @@ class NetCDF4FileHandler(BaseFileHandler):
     """
 
     file_handle = None
+    _pooled = False
 
     def __init__(self, filename, filename_info, filetype_info,
                  auto_maskandscale=False, xarray_kwargs=None,
@@ -99,6 +113,30 @@ class NetCDF4FileHandler(BaseFileHandler):
         self.file_content = {}
         self.cached_file_content = {}
         self._use_h5netcdf = False
+        self._set_xarray_kwargs(xarray_kwargs, auto_maskandscale)
+
+        if cache_handle or cache_var_size:
+            # the file content is needed with the actual file objects
+            file_handle = self._open_and_collect_file_content(auto_maskandscale)
+            self.collect_cache_vars(cache_var_size)
+            if cache_handle and FILE_HANDLE_POOL.enabled:
+                self._add_to_pool(file_handle, auto_maskandscale)
+            elif cache_handle:
+                self.file_handle = file_handle
+            else:
+                file_handle.close()
+        else:
+            self.file_content = cached_file_metadata(self.filename, self._read_file_content,
+                                                     auto_maskandscale,
+                                                     to_cache=_file_content_with_placeholders)
+
+    def _read_file_content(self, auto_maskandscale):
+        """Collect the file content and close the file."""
+        file_handle = self._open_and_collect_file_content(auto_maskandscale)
+        file_handle.close()
+        return self.file_content
+
+    def _open_and_collect_file_content(self, auto_maskandscale):
         try:
             file_handle = self._get_file_handle()
         except IOError:
@@ -107,24 +145,31 @@ class NetCDF4FileHandler(BaseFileHandler):
             raise
 
         self._set_file_handle_auto_maskandscale(file_handle, auto_maskandscale)
-        self._set_xarray_kwargs(xarray_kwargs, auto_maskandscale)
 
-        listed_variables = filetype_info.get("required_netcdf_variables")
+        listed_variables = self.filetype_info.get("required_netcdf_variables")
         if listed_variables:
             self._collect_listed_variables(file_handle, listed_variables)
         else:
             self.collect_metadata("", file_handle)
             self.collect_dimensions("", file_handle)
-        self.collect_cache_vars(cache_var_size)
-
-        if cache_handle:
-            self.file_handle = file_handle
-        else:
-            file_handle.close()
+        return file_handle
 
     def _get_file_handle(self):
         return netCDF4.Dataset(self.filename, "r")
 
+    def _add_to_pool(self, file_handle, auto_maskandscale):
+        """Keep the file handle in the pool of open files instead of the file handler."""
+        self.file_content = self._file_content_with_placeholders(self.file_content)
+        self._pool_opener = self._get_pool_opener(auto_maskandscale)
+        FILE_HANDLE_POOL.add(file_handle, self.filename, *self._pool_opener)
+        self._pooled = True
+
+    def _get_pool_opener(self, auto_maskandscale):
+        return _open_netcdf4, auto_maskandscale
+
+    def _file_content_with_placeholders(self, file_content):
+        return _file_content_with_placeholders(file_content)
+
     @staticmethod
     def _set_file_handle_auto_maskandscale(file_handle, auto_maskandscale):
         if hasattr(file_handle, "set_auto_maskandscale"):
@@ -271,9 +316,9 @@ class NetCDF4FileHandler(BaseFileHandler):
     def __getitem__(self, key):
         """Get item for given key."""
         val = self.file_content[key]
-        if isinstance(val, netCDF4.Variable):
+        if isinstance(val, (netCDF4.Variable, VariablePlaceholder)):
             return self._get_variable(key, val)
-        if isinstance(val, netCDF4.Group):
+        if isinstance(val, (netCDF4.Group, GroupPlaceholder)):
             return self._get_group(key, val)
         return val
 
@@ -291,6 +336,8 @@ class NetCDF4FileHandler(BaseFileHandler):
             group = None
         if self.file_handle is not None:
             val = self._get_var_from_filehandle(group, key)
+        elif self._pooled:
+            val = self._get_var_from_pool(group, key, val)
         else:
             val = self._get_var_from_xr(group, key)
         return val
@@ -333,6 +380,15 @@ class NetCDF4FileHandler(BaseFileHandler):
                 name=v.name)
         return x
 
+    def _get_var_from_pool(self, group, key, placeholder):
+        # Like with the file handle, without coordinates
+        path = key if group is None else group + "/" + key
+        opener, *open_args = self._pool_opener
+        v = PooledVariable(self.filename, opener, path, placeholder.shape, placeholder.dtype,
+                           attrs=placeholder.attrs, open_args=open_args)
+        return xr.DataArray(da.from_array(v), dims=placeholder.dimensions, attrs=placeholder.attrs,
+                            name=placeholder.name)
+
     def __contains__(self, item):
         """Get item from file content."""
         return item in self.file_content
@@ -351,6 +407,8 @@ class NetCDF4FileHandler(BaseFileHandler):
         v = self.file_content[var_name]
         if isinstance(v, xr.DataArray):
             val = v
+        elif isinstance(v, VariablePlaceholder):
+            val = self._get_variable(var_name, v).load()
         else:
             try:
                 val = v[:]
@@ -366,6 +424,46 @@ class NetCDF4FileHandler(BaseFileHandler):
         return self.cached_file_content[var_name]
 
 
+class VariablePlaceholder:
+    """Picklable description of a netCDF variable used in cached file contents."""
+
+    def __init__(self, name, dimensions, dtype, shape, attrs):
+        """Describe a variable."""
+        self.name = name
+        self.dimensions = dimensions
+        self.dtype = dtype
+        self.shape = shape
+        self.attrs = attrs
+
+
+class GroupPlaceholder:
+    """Picklable description of a netCDF group used in cached file contents."""
+
+    def __init__(self, name):
+        """Describe a group."""
+        self.name = name
+
+
+def _file_content_with_placeholders(file_content, variable_types=(netCDF4.Variable,), group_types=(netCDF4.Group,)):
+    """Replace the netCDF4 objects of *file_content* by picklable placeholders.
+
+    The file may already be closed, so the placeholders are made from the
+    information collected in *file_content*.
+    """
+    cacheable = {}
+    for key, val in file_content.items():
+        if isinstance(val, variable_types):
+            attr_prefix = key + "/attr/"
+            attrs = {fc_key[len(attr_prefix):]: attr for fc_key, attr in file_content.items()
+                     if fc_key.startswith(attr_prefix)}
+            val = VariablePlaceholder(key.rsplit("/", 1)[-1], file_content[key + "/dimensions"],
+                                      file_content[key + "/dtype"], file_content[key + "/shape"], attrs)
+        elif isinstance(val, group_types):
+            val = GroupPlaceholder(key.rsplit("/", 1)[-1])
+        cacheable[key] = val
+    return cacheable
+
+
 def _compose_replacement_names(variable_name_replacements, var, variable_names):
     for key in variable_name_replacements:
         vals = variable_name_replacements[key]
@@ -374,6 +472,19 @@ def _compose_replacement_names(variable_name_replacements, var, variable_names):
                 variable_names.append(var.format(**{key: val}))
 
 
+def _open_netcdf4(filename, auto_maskandscale):
+    """Open a netCDF file for the pool of open files."""
+    file_handle = netCDF4.Dataset(filename, "r")
+    file_handle.set_auto_maskandscale(auto_maskandscale)
+    return file_handle
+
+
+def _open_h5netcdf(filename):
+    """Open a (remote) netCDF file with h5netcdf for the pool of open files."""
+    import h5netcdf
+    return h5netcdf.File(open_file_or_filename(filename), "r")
+
+
 def get_data_as_xarray(variable):
     """Get data in variable as xr.DataArray."""
     try:
@@ -406,6 +517,17 @@ class NetCDF4FsspecFileHandler(NetCDF4FileHandler):
             self._use_h5netcdf = True
             return h5netcdf.File(f_obj, "r")
 
+    def _get_pool_opener(self, auto_maskandscale):
+        if self._use_h5netcdf:
+            return (_open_h5netcdf,)
+        return super()._get_pool_opener(auto_maskandscale)
+
+    def _file_content_with_placeholders(self, file_content):
+        if self._use_h5netcdf:
+            from h5netcdf import Group, Variable
+            return _file_content_with_placeholders(file_content, variable_types=(Variable,), group_types=(Group,))
+        return super()._file_content_with_placeholders(file_content)
+
     def __getitem__(self, key):
         """Get item for given key."""
         if self._use_h5netcdf:
@@ -415,9 +537,9 @@ class NetCDF4FsspecFileHandler(NetCDF4FileHandler):
     def _getitem_h5netcdf(self, key):
         from h5netcdf import Group, Variable
         val = self.file_content[key]
-        if isinstance(val, Variable):
+        if isinstance(val, (Variable, VariablePlaceholder)):
             return self._get_variable(key, val)
-        if isinstance(val, Group):
+        if isinstance(val, (Group, GroupPlaceholder)):
             return self._get_group(key, val)
         return val
 
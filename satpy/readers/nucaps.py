@@ -280,13 +280,14 @@ class NUCAPSReader(FileYAMLReader):
                     self.all_ids[new_ds_id] = new_info
                     self.pressure_dataset_names[ds_id["name"]].append(new_info["name"])
 
-    def load(self, dataset_keys, previous_datasets=None, pressure_levels=None):
+    def load(self, dataset_keys, previous_datasets=None, pressure_levels=None, roi=None):
         """Load data from one or more set of files.
 
         :param pressure_levels: mask out certain pressure levels:
                                 True for all levels
                                 (min, max) for a range of pressure levels
                                 [...] list of levels to include
+        :param roi: region of interest, see :meth:`FileYAMLReader.load`
         """
         dataset_keys = set(self.get_dataset_key(x) for x in dataset_keys)
         if pressure_levels is not None:
@@ -301,7 +302,7 @@ class NUCAPSReader(FileYAMLReader):
                 remove_plevels = True
 
         datasets_loaded = super(NUCAPSReader, self).load(
-            dataset_keys, previous_datasets=previous_datasets)
+            dataset_keys, previous_datasets=previous_datasets, roi=roi)
 
         if pressure_levels is not None:
             if remove_plevels:
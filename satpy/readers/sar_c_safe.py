@@ -43,6 +43,7 @@ from datetime import timezone as tz
 from functools import cached_property
 from pathlib import Path
 from threading import Lock
+from xml.etree.ElementTree import Element  # nosec B405
 
 import defusedxml.ElementTree as ET
 import numpy as np
@@ -90,6 +91,26 @@ def _dictify(r):
     return d
 
 
+def _parse_xml_elements(filename, tags):
+    """Parse incrementally the elements of the xml file whose tag is in *tags*.
+
+    The rest of the document is discarded as soon as it is parsed, so that only
+    the wanted elements (with their children) are kept in memory. They are
+    returned as the children of a new root element.
+    """
+    root = Element("root")
+    depth = 0
+    with filename.open() as fd:
+        for event, elt in ET.iterparse(fd, events=("start", "end")):
+            if elt.tag in tags:
+                depth += 1 if event == "start" else -1
+                if event == "end" and depth == 0:
+                    root.append(elt)
+            elif event == "end" and depth == 0:
+                elt.clear()
+    return root
+
+
 def _get_calibration_name(calibration):
     """Get the proper calibration name."""
     calibration_name = getattr(calibration, "name", calibration) or "gamma"
@@ -101,7 +122,13 @@ def _get_calibration_name(calibration):
 
 
 class SAFEXML(BaseFileHandler):
-    """XML file reader for the SAFE format."""
+    """XML file reader for the SAFE format.
+
+    Only the elements with a tag in ``xml_tags`` are kept from the file, or the
+    whole document if ``xml_tags`` is None.
+    """
+
+    xml_tags = None
 
     def __init__(self, filename, filename_info, filetype_info,
                  header_file=None, image_shape=None):
@@ -113,13 +140,19 @@ class SAFEXML(BaseFileHandler):
         self._polarization = filename_info["polarization"]
         if isinstance(self.filename, str):
             self.filename = Path(self.filename)
-        with self.filename.open() as fd:
-            self.root = ET.parse(fd)
+        if self.xml_tags is None:
+            with self.filename.open() as fd:
+                self.root = ET.parse(fd).getroot()
+        else:
+            self.root = _parse_xml_elements(self.filename, self.xml_tags)
         self._image_shape = image_shape
 
     def get_metadata(self):
         """Convert the xml metadata to dict."""
-        return dictify(self.root.getroot())
+        if self.xml_tags is None:
+            return dictify(self.root)
+        with self.filename.open() as fd:
+            return dictify(ET.parse(fd).getroot())
 
     @property
     def start_time(self):
@@ -135,6 +168,8 @@ class SAFEXML(BaseFileHandler):
 class SAFEXMLAnnotation(SAFEXML):
     """XML file reader for the SAFE format, Annotation file."""
 
+    xml_tags = {"imageInformation", "geolocationGridPoint"}
+
     def __init__(self, filename, filename_info, filetype_info,
                  header_file=None):
         """Init the XML annotation reader."""
@@ -142,9 +177,13 @@ class SAFEXMLAnnotation(SAFEXML):
         self.get_incidence_angle = functools.lru_cache(maxsize=10)(
             self._get_incidence_angle_uncached
         )
-        self.hdr = self.get_metadata()
-        self._image_shape = (self.hdr["product"]["imageAnnotation"]["imageInformation"]["numberOfLines"],
-                             self.hdr["product"]["imageAnnotation"]["imageInformation"]["numberOfSamples"])
+        self._image_shape = (int(self.root.find(".//imageInformation/numberOfLines").text),
+                             int(self.root.find(".//imageInformation/numberOfSamples").text))
+
+    @cached_property
+    def hdr(self):
+        """Get the whole annotation as a dict."""
+        return self.get_metadata()
 
     @property
     def image_shape(self):
@@ -168,6 +207,8 @@ class SAFEXMLAnnotation(SAFEXML):
 class Calibrator(SAFEXML):
     """XML file reader for the SAFE format, Calibration file."""
 
+    xml_tags = {"absoluteCalibrationConstant", "calibrationVector"}
+
     def __init__(self, filename, filename_info, filetype_info,
                  header_file=None, image_shape=None):
         """Init the XML calibration reader."""
@@ -211,6 +252,8 @@ class Calibrator(SAFEXML):
 class Denoiser(SAFEXML):
     """XML file reader for the SAFE format, Noise file."""
 
+    xml_tags = {"noiseVector", "noiseRangeVector", "noiseAzimuthVector"}
+
     def __init__(self, filename, filename_info, filetype_info,
                  header_file=None, image_shape=None):
         """Init the xml filehandler."""
@@ -285,112 +328,34 @@ class AzimuthNoiseReader:
         self.root = root
         self.elements = self.root.findall(".//noiseAzimuthVector")
         self._image_shape = shape
-        self.blocks = []
 
     def read_azimuth_noise_array(self, chunks=CHUNK_SIZE):
-        """Read the azimuth noise vectors."""
-        self._read_azimuth_noise_blocks(chunks)
-        populated_array = self._assemble_azimuth_noise_blocks(chunks)
+        """Read the azimuth noise vectors.
 
-        return populated_array
-
-    def _read_azimuth_noise_blocks(self, chunks):
-        """Read the azimuth noise blocks."""
-        self.blocks = []
-        for elt in self.elements:
-            block = _AzimuthBlock(elt)
-            new_arr = block.expand(chunks)
-            self.blocks.append(new_arr)
-
-    def _assemble_azimuth_noise_blocks(self, chunks):
-        """Assemble the azimuth noise blocks into one single array."""
-        # The strategy here is a bit convoluted. The job would be trivial if
-        # performed on regular numpy arrays, but here we want to keep the data
-        # as xarray/dask array as much as possible.
-        # Using a pure xarray approach was tested (with `combine_first`,
-        # `interpolate_na`, etc), but was found to be memory-hungry at the time
-        # of implementation (March 2021). Hence the usage of a custom algorithm,
-        # relying mostly on dask arrays.
-        slices = self._create_dask_slices_from_blocks(chunks)
-        populated_array = da.vstack(slices).rechunk(chunks)
+        Every chunk of the array is filled from the blocks overlapping it only.
+        """
+        blocks = [_AzimuthBlock(elt) for elt in self.elements]
+        blocks = [(block.first_line, block.first_pixel, block.last_pixel, block.line_values) for block in blocks]
+        rows, cols = _get_row_and_column_indices(self._image_shape, chunks)
+        populated_array = da.map_blocks(_fill_azimuth_noise_blocks, rows, cols, blocks=blocks, dtype=np.float64,
+                                        chunks=(rows.chunks[0], cols.chunks[1]))
         populated_array = xr.DataArray(populated_array, dims=["y", "x"],
                                        coords={"x": np.arange(self._image_shape[1]),
                                                "y": np.arange(self._image_shape[0])})
         return populated_array
 
-    def _create_dask_slices_from_blocks(self, chunks):
-        """Create full-width slices from azimuth noise blocks."""
-        current_line = 0
-        slices = []
-        while current_line < self._image_shape[0]:
-            new_slice = self._create_dask_slice_from_block_line(current_line, chunks)
-            slices.append(new_slice)
-            current_line += new_slice.shape[0]
-        return slices
-
-    def _create_dask_slice_from_block_line(self, current_line, chunks):
-        """Create a dask slice from the blocks at the current line."""
-        pieces = self._get_array_pieces_for_current_line(current_line)
-        dask_pieces = self._get_padded_dask_pieces(pieces, chunks)
-        new_slice = da.hstack(dask_pieces)
-
-        return new_slice
-
-    def _get_array_pieces_for_current_line(self, current_line):
-        """Get the array pieces that cover the current line."""
-        current_blocks = self._find_blocks_covering_line(current_line)
-        current_blocks.sort(key=(lambda x: x.coords["x"][0]))
-        next_line = self._get_next_start_line(current_blocks, current_line)
-        current_y = np.arange(current_line, next_line)
-        pieces = [arr.sel(y=current_y) for arr in current_blocks]
-        return pieces
-
-    def _find_blocks_covering_line(self, current_line):
-        """Find the blocks covering a given line."""
-        current_blocks = []
-        for block in self.blocks:
-            if block.coords["y"][0] <= current_line <= block.coords["y"][-1]:
-                current_blocks.append(block)
-        return current_blocks
-
-    def _get_next_start_line(self, current_blocks, current_line):
-        next_line = min((arr.coords["y"][-1] for arr in current_blocks)) + 1
-        blocks_starting_soon = [block for block in self.blocks if current_line < block.coords["y"][0] < next_line]
-        if blocks_starting_soon:
-            next_start_line = min((arr.coords["y"][0] for arr in blocks_starting_soon))
-            next_line = min(next_line, next_start_line)
-        return next_line
-
-    def _get_padded_dask_pieces(self, pieces, chunks):
-        """Get the padded pieces of a slice."""
-        pieces = sorted(pieces, key=(lambda x: x.coords["x"][0]))
-        dask_pieces = []
-        previous_x_end = -1
-        piece = pieces[0]
-        next_x_start = piece.coords["x"][0].item()
-        y_shape = len(piece.coords["y"])
-
-        x_shape = (next_x_start - previous_x_end - 1)
-        self._fill_dask_pieces(dask_pieces, (y_shape, x_shape), chunks)
-
-        for i, piece in enumerate(pieces):
-            dask_pieces.append(piece.data)
-            previous_x_end = piece.coords["x"][-1].item()
-            try:
-                next_x_start = pieces[i + 1].coords["x"][0].item()
-            except IndexError:
-                next_x_start = self._image_shape[1]
-
-            x_shape = (next_x_start - previous_x_end - 1)
-            self._fill_dask_pieces(dask_pieces, (y_shape, x_shape), chunks)
 
-        return dask_pieces
-
-    @staticmethod
-    def _fill_dask_pieces(dask_pieces, shape, chunks):
-        if shape[1] > 0:
-            new_piece = da.full(shape, np.nan, chunks=chunks)
-            dask_pieces.append(new_piece)
+def _fill_azimuth_noise_blocks(rows, cols, blocks):
+    """Fill the part of the azimuth noise array at *rows* and *cols* from the *blocks* overlapping it."""
+    rows = rows[:, 0]
+    cols = cols[0, :]
+    res = np.full((rows.size, cols.size), np.nan)
+    for first_line, first_pixel, last_pixel, line_values in blocks:
+        row_mask = (rows >= first_line) & (rows < first_line + line_values.size)
+        col_mask = (cols >= first_pixel) & (cols <= last_pixel)
+        if row_mask.any() and col_mask.any():
+            res[np.ix_(row_mask, col_mask)] = line_values[rows[row_mask] - first_line, np.newaxis]
+    return res
 
 
 class _AzimuthBlock:
@@ -400,8 +365,9 @@ class _AzimuthBlock:
         """Set up the block from an XML element."""
         self.element = xml_element
 
-    def expand(self, chunks):
-        """Build an azimuth block from xml data."""
+    @property
+    def line_values(self):
+        """Interpolate the noise of the block to all its lines."""
         corr = 1
         # This isn't needed with newer data (> 2020). When was the change operated?
         #
@@ -425,16 +391,8 @@ class _AzimuthBlock:
         #     corr = 1.5
         data = self.lut * corr
 
-        x_coord = np.arange(self.first_pixel, self.last_pixel + 1)
         y_coord = np.arange(self.first_line, self.last_line + 1)
-
-        new_arr = (da.ones((len(y_coord), len(x_coord)), chunks=chunks) *
-                   np.interp(y_coord, self.lines, data)[:, np.newaxis])
-        new_arr = xr.DataArray(new_arr,
-                               dims=["y", "x"],
-                               coords={"x": x_coord,
-                                       "y": y_coord})
-        return new_arr
+        return np.interp(y_coord, self.lines, data)
 
     @property
     def first_pixel(self):
@@ -454,13 +412,11 @@ class _AzimuthBlock:
 
     @property
     def lines(self):
-        lines = self.element.find("line").text.split()
-        return np.array(lines).astype(int)
+        return _text_to_array(self.element.find("line").text, dtype=int)
 
     @property
     def lut(self):
-        lut = self.element.find("noiseAzimuthLut").text.split()
-        return np.array(lut).astype(float)
+        return _text_to_array(self.element.find("noiseAzimuthLut").text)
 
 
 class XMLArray:
@@ -484,13 +440,12 @@ class XMLArray:
         x = []
         data = []
         for elt in elements:
-            new_x = elt.find("pixel").text.split()
-            y += [int(elt.find("line").text)] * len(new_x)
-            x += [int(val) for val in new_x]
-            data += [float(val)
-                     for val in elt.find(self.element_tag).text.split()]
+            new_x = _text_to_array(elt.find("pixel").text, dtype=int)
+            y.append(np.full(new_x.size, int(elt.find("line").text)))
+            x.append(new_x)
+            data.append(_text_to_array(elt.find(self.element_tag).text))
 
-        return np.asarray(data), (x, y)
+        return np.concatenate(data), (np.concatenate(x), np.concatenate(y))
 
     def get_data_items(self):
         """Get the data items for this array."""
@@ -505,27 +460,94 @@ class XMLArray:
         return interpolate_xarray_linear(xpoints, ypoints, self.data, shape, chunks=chunks)
 
 
+def _text_to_array(text, dtype=np.float64):
+    """Convert a whitespace-separated list of numbers to an array."""
+    return np.fromstring(text, dtype=dtype, sep=" ")
+
+
 def intp(grid_x, grid_y, interpolator):
     """Interpolate."""
     return interpolator((grid_y, grid_x))
 
 
-def interpolate_xarray_linear(xpoints, ypoints, values, shape, chunks=CHUNK_SIZE):
-    """Interpolate linearly, generating a dask array."""
-    from scipy.interpolate.interpnd import LinearNDInterpolator, _ndim_coords_from_arrays
-
+def _get_row_and_column_indices(shape, chunks):
+    """Get the row indices as a column and the column indices as a row, chunked like the array of *shape*."""
     if isinstance(chunks, (list, tuple)):
         vchunks, hchunks = chunks
     else:
         vchunks, hchunks = chunks, chunks
+    rows = da.arange(shape[0], chunks=vchunks)[:, np.newaxis]
+    cols = da.arange(shape[1], chunks=hchunks)[np.newaxis, :]
+    return rows, cols
+
+
+def interpolate_xarray_linear(xpoints, ypoints, values, shape, chunks=CHUNK_SIZE):
+    """Interpolate linearly, generating a dask array.
+
+    Tie points on a rectilinear grid of lines and pixels, as the calibration
+    vectors and geolocation grid points usually are, are interpolated
+    bilinearly, every chunk from the tie points around it only. Other tie
+    points are triangulated and interpolated linearly in the triangles.
+    Outside of the tie points, the values are NaN.
+    """
+    grid = _get_rectilinear_grid(xpoints, ypoints, values)
+    if grid is not None:
+        return _interpolate_rectilinear_grid(*grid, shape, chunks)
+    return _interpolate_triangulated(xpoints, ypoints, values, shape, chunks)
+
+
+def _get_rectilinear_grid(xpoints, ypoints, values):
+    """Get the pixels, lines and values on a grid of the tie points, None if they are not on a rectilinear grid."""
+    xpoints = np.asarray(xpoints)
+    ypoints = np.asarray(ypoints)
+    pixels = np.unique(xpoints)
+    lines = np.unique(ypoints)
+    if pixels.size < 2 or lines.size < 2 or pixels.size * lines.size != xpoints.size:
+        return None
+    order = np.lexsort((xpoints, ypoints))
+    if not (np.array_equal(xpoints[order], np.tile(pixels, lines.size)) and
+            np.array_equal(ypoints[order], np.repeat(lines, pixels.size))):
+        return None
+    return pixels, lines, np.asarray(values, dtype=np.float64)[order].reshape(lines.size, pixels.size)
+
+
+def _interpolate_rectilinear_grid(pixels, lines, values, shape, chunks):
+    rows, cols = _get_row_and_column_indices(shape, chunks)
+    res = da.map_blocks(_interpolate_grid_block, rows, cols, pixels=pixels, lines=lines, values=values,
+                        dtype=np.float64, chunks=(rows.chunks[0], cols.chunks[1]))
+    return DataArray(res, dims=("y", "x"))
+
+
+def _interpolate_grid_block(rows, cols, pixels, lines, values):
+    """Interpolate bilinearly from the tie point *values* around the block, along the pixels then the lines."""
+    line_idx, line_weights = _get_interpolation_weights(lines, rows[:, 0])
+    pixel_idx, pixel_weights = _get_interpolation_weights(pixels, cols[0, :])
+    first_line, first_pixel = line_idx.min(initial=0), pixel_idx.min(initial=0)
+    values = values[first_line:line_idx.max(initial=0) + 2, first_pixel:pixel_idx.max(initial=0) + 2]
+    line_idx = line_idx - first_line
+    pixel_idx = pixel_idx - first_pixel
+    along_pixels = values[:, pixel_idx] * (1 - pixel_weights) + values[:, pixel_idx + 1] * pixel_weights
+    return (along_pixels[line_idx] * (1 - line_weights[:, np.newaxis]) +
+            along_pixels[line_idx + 1] * line_weights[:, np.newaxis])
+
+
+def _get_interpolation_weights(ticks, coords):
+    """Get the index of the tick before every coordinate and the weight of the tick after it, NaN outside the ticks."""
+    idx = np.clip(np.searchsorted(ticks, coords, side="right") - 1, 0, ticks.size - 2)
+    weights = (coords - ticks[idx]) / (ticks[idx + 1] - ticks[idx])
+    weights[(coords < ticks[0]) | (coords > ticks[-1])] = np.nan
+    return idx, weights
+
+
+def _interpolate_triangulated(xpoints, ypoints, values, shape, chunks):
+    from scipy.interpolate import LinearNDInterpolator
 
-    points = _ndim_coords_from_arrays(np.vstack((np.asarray(ypoints),
-                                                 np.asarray(xpoints))).T)
+    points = np.column_stack((np.asarray(ypoints), np.asarray(xpoints)))
 
     interpolator = LinearNDInterpolator(points, values)
 
-    grid_x, grid_y = da.meshgrid(da.arange(shape[1], chunks=hchunks),
-                                 da.arange(shape[0], chunks=vchunks))
+    rows, cols = _get_row_and_column_indices(shape, chunks)
+    grid_x, grid_y = da.broadcast_arrays(cols, rows)
 
     # workaround for non-thread-safe first call of the interpolator:
     interpolator((0, 0))
@@ -716,6 +738,8 @@ class SAFESARReader(GenericYAMLReader):
 
     def load(self, dataset_keys, **kwargs):
         """Load some data."""
+        # the data are on swaths, there is no region of interest to push down
+        kwargs.pop("roi", None)
         if kwargs:
             warnings.warn(f"Don't know how to handle kwargs {kwargs}")
         datasets = DatasetDict()
@@ -200,6 +200,7 @@ References:
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import warnings
 
 import dask.array as da
@@ -208,7 +209,7 @@ import pyproj
 from numpy.polynomial.chebyshev import Chebyshev
 
 from satpy.readers.eum_base import issue_revision, time_cds_short
-from satpy.readers.utils import apply_earthsun_distance_correction
+from satpy.readers.utils import apply_earthsun_distance_correction, calibrate_with_lut
 from satpy.utils import get_legacy_chunk_size
 
 CHUNK_SIZE = get_legacy_chunk_size()
@@ -525,26 +526,54 @@ def dec10216(inbuf):
         op[2] = (ip[2] & 0x0F)*64 + ip[3]/4;
         op[3] = (ip[3] & 0x03)*256 +ip[4];
 
+    The words are unpacked along the last dimension of ``inbuf``, so that
+    2D arrays of packed lines give 2D arrays of unpacked lines. Trailing bytes
+    not making up a full group of 5 bytes are ignored. Dask arrays are unpacked
+    lazily, block by block.
+
     """
-    arr10 = inbuf.astype(np.uint16)
-    arr16_len = int(len(arr10) * 4 / 5)
-    arr10_len = int((arr16_len * 5) / 4)
-    arr10 = arr10[:arr10_len]  # adjust size
+    if isinstance(inbuf, da.Array):
+        return _dec10216_dask(inbuf)
+    return _dec10216_numpy(np.asarray(inbuf))
 
-    # dask is slow with indexing
-    arr10_0 = arr10[::5]
-    arr10_1 = arr10[1::5]
-    arr10_2 = arr10[2::5]
-    arr10_3 = arr10[3::5]
-    arr10_4 = arr10[4::5]
 
-    arr16_0 = (arr10_0 << 2) + (arr10_1 >> 6)
-    arr16_1 = ((arr10_1 & 63) << 4) + (arr10_2 >> 4)
-    arr16_2 = ((arr10_2 & 15) << 6) + (arr10_3 >> 2)
-    arr16_3 = ((arr10_3 & 3) << 8) + arr10_4
-    arr16 = np.stack([arr16_0, arr16_1, arr16_2, arr16_3], axis=-1).ravel()
+def _dec10216_numpy(inbuf):
+    """Unpack 10 bits data into a single preallocated array of 16 bits words.
 
-    return arr16
+    Each 10 bits word is contained in a pair of consecutive bytes, so the
+    packed buffer is viewed as four strided arrays of big endian 16 bits
+    integers, one for each word position in the groups of 5 bytes, that only
+    need to be shifted and masked.
+    """
+    inbuf = np.ascontiguousarray(inbuf, dtype=np.uint8)
+    groups_count = inbuf.shape[-1] // 5
+    rows = inbuf.reshape(int(np.prod(inbuf.shape[:-1])), inbuf.shape[-1])
+    arr16 = np.empty((rows.shape[0], groups_count, 4), dtype=np.uint16)
+    if arr16.size == 0:
+        return arr16.reshape(inbuf.shape[:-1] + (0,))
+    for idx, shift in enumerate((6, 4, 2, 0)):
+        byte_pairs = np.ndarray((rows.shape[0], groups_count), dtype=">u2", buffer=rows,
+                                offset=idx, strides=(rows.strides[0], 5))
+        word = arr16[..., idx]
+        np.right_shift(byte_pairs, shift, out=word)
+        word &= 1023
+    return arr16.reshape(inbuf.shape[:-1] + (groups_count * 4,))
+
+
+def _dec10216_dask(inbuf):
+    """Unpack 10 bits data block by block."""
+    last_axis = inbuf.ndim - 1
+    groups_count = inbuf.shape[-1] // 5
+    if inbuf.ndim == 1:
+        # blocks need to be made of full groups of 5 bytes
+        inbuf = inbuf[:groups_count * 5]
+        block_size = max(5, inbuf.chunksize[0] // 5 * 5)
+        inbuf = inbuf.rechunk(block_size)
+    else:
+        inbuf = inbuf.rechunk({last_axis: -1})
+    out_chunks = inbuf.chunks[:-1] + (tuple(size // 5 * 4 for size in inbuf.chunks[-1]),)
+    return da.map_blocks(_dec10216_numpy, inbuf, chunks=out_chunks, dtype=np.uint16,
+                         meta=np.array((), dtype=np.uint16))
 
 
 class MpefProductHeader(object):
@@ -691,22 +720,27 @@ class SEVIRICalibrationHandler:
             )
 
     def calibrate(self, data, calibration):
-        """Calibrate the given data."""
+        """Calibrate the given data.
+
+        Integer counts are calibrated through a lookup table shared by all
+        segments of the channel and time slot.
+        """
         if calibration == "counts":
-            res = data
-        elif calibration in ["radiance", "reflectance",
-                             "brightness_temperature"]:
-            gain, offset = self.get_gain_offset()
-            res = self._algo.convert_to_radiance(
-                data.astype(np.float32), gain, offset
-            )
-        else:
+            return data
+        if calibration not in ["radiance", "reflectance", "brightness_temperature"]:
             raise ValueError(
                 "Invalid calibration {} for channel {}".format(
                     calibration, self._channel_name
                 )
             )
-
+        gain, offset = self.get_gain_offset()
+        key = (self._platform_id, self._channel_name, calibration, gain, offset,
+               self._coefs["radiance_type"], self._scan_time)
+        return calibrate_with_lut(data, functools.partial(self._calibrate, calibration=calibration,
+                                                          gain=gain, offset=offset), key=key)
+
+    def _calibrate(self, data, calibration, gain, offset):
+        res = self._algo.convert_to_radiance(data.astype(np.float32), gain, offset)
         if calibration == "reflectance":
             solar_irradiance = CALIB[self._platform_id][self._channel_name]["F"]
             res = self._algo.vis_calibrate(res, solar_irradiance)
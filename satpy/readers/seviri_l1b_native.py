@@ -100,6 +100,7 @@ References:
 
 import datetime as dt
 import logging
+import os
 import warnings
 
 import dask.array as da
@@ -108,6 +109,7 @@ import xarray as xr
 from pyresample import geometry
 
 from satpy._compat import cached_property
+from satpy.readers import FSFile
 from satpy.readers._geos_area import get_area_definition, get_geos_area_naming
 from satpy.readers.eum_base import get_service_mode, recarray2dict, time_cds_short
 from satpy.readers.file_handlers import BaseFileHandler
@@ -138,7 +140,7 @@ from satpy.readers.seviri_l1b_native_hdr import (
     get_native_header,
     native_trailer,
 )
-from satpy.readers.utils import fromfile, generic_open, reduce_mda
+from satpy.readers.utils import cached_file_metadata, fromfile, generic_open, reduce_mda
 from satpy.utils import get_legacy_chunk_size
 
 logger = logging.getLogger("native_msg")
@@ -191,19 +193,31 @@ class NativeMSGFileHandler(BaseFileHandler):
 
         # Read header, prepare dask-array, read trailer and initialize image boundaries
         # Available channels are known only after the header has been read
-        self.header_type = get_native_header(has_archive_header(self.filename))
+        self.header_type = get_native_header(
+            cached_file_metadata(self.filename, has_archive_header, self.filename))
         self._read_header()
         self._make_dask_array_with_map_blocks()
         self._read_trailer()
         self.image_boundaries = ImageBoundaries(self.header, self.trailer, self.mda)
 
     def _make_dask_array_with_map_blocks(self):
-        """Make the dask array using the ``da.map_blocks()`` functionality."""
+        """Make the dask array of the data records.
+
+        Local uncompressed files are memory-mapped, so that each chunk is a
+        view of the file and only the lines that are actually used are read.
+        Other files are read chunk by chunk using the ``da.map_blocks()``
+        functionality.
+        """
         dtype = self._get_data_dtype()
         chunks = da.core.normalize_chunks(
             "auto",
             shape=(self.mda["number_of_lines"],),
             dtype=dtype)
+        if _can_be_memory_mapped(self.filename):
+            data = MemmappedRecords(self.filename, dtype, self.header_type.itemsize,
+                                    (self.mda["number_of_lines"],))
+            self._dask_array = da.from_array(data, chunks=chunks, meta=np.array([], dtype=dtype))
+            return
         self._dask_array = da.map_blocks(
             _get_array,
             dtype=dtype,
@@ -297,7 +311,7 @@ class NativeMSGFileHandler(BaseFileHandler):
 
     def _read_header(self):
         """Read the header info."""
-        self.header.update(read_header(self.filename))
+        self.header.update(cached_file_metadata(self.filename, read_header, self.filename))
 
         if "15_SECONDARY_PRODUCT_HEADER" not in self.header:
             # No archive header, that means we have a complete file
@@ -396,9 +410,8 @@ class NativeMSGFileHandler(BaseFileHandler):
         data_size = (self._get_data_dtype().itemsize *
                      self.mda["number_of_lines"])
 
-        data = fromfile(self.filename, dtype=native_trailer, count=1, offset=hdr_size + data_size)
-
-        self.trailer.update(recarray2dict(data))
+        self.trailer.update(cached_file_metadata(self.filename, read_trailer, self.filename,
+                                                 hdr_size + data_size))
 
     def get_area_def(self, dataset_id):
         """Get the area definition of the band.
@@ -572,7 +585,9 @@ class NativeMSGFileHandler(BaseFileHandler):
         else:
             data = self._get_hrv_channel()
 
-        xarr = xr.DataArray(data, dims=["y", "x"]).where(data != 0).astype(np.float32)
+        xarr = xr.DataArray(data, dims=["y", "x"])
+        if dataset_id["calibration"] == "counts":
+            xarr = xarr.where(data != 0).astype(np.float32)
 
         if xarr is None:
             return None
@@ -598,7 +613,7 @@ class NativeMSGFileHandler(BaseFileHandler):
         else:
             i = self.mda["channel_list"].index(dataset_id["name"])
             raw = self._dask_array["visir"]["line_data"][:, i, :]
-        data = dec10216(raw.flatten())
+        data = dec10216(raw)
         data = data.reshape(shape)
         return data
 
@@ -609,7 +624,7 @@ class NativeMSGFileHandler(BaseFileHandler):
         data_list = []
         for i in range(3):
             raw = self._dask_array["hrv"]["line_data"][:, i, :]
-            data = dec10216(raw.flatten())
+            data = dec10216(raw)
             data = data.reshape(shape_layer)
             data_list.append(data)
 
@@ -906,6 +921,55 @@ def read_header(filename):
     return recarray2dict(hdr)
 
 
+def read_trailer(filename, offset):
+    """Read SEVIRI L1.5 native trailer starting at *offset*."""
+    trailer = fromfile(filename, dtype=native_trailer, count=1, offset=offset)
+    return recarray2dict(trailer)
+
+
+def _can_be_memory_mapped(filename):
+    """Check if *filename* is an uncompressed file on the local file system."""
+    if not isinstance(filename, (str, os.PathLike)) or isinstance(filename, FSFile):
+        return False
+    return not os.fspath(filename).endswith(".bz2")
+
+
+class MemmappedRecords:
+    """Records of a file, lazily memory-mapped and usable with :func:`dask.array.from_array`.
+
+    The memory map is created on first access and shared by all the chunks,
+    slicing it returns views of the file content without copying it. Only the
+    description of the records is pickled, so that the memory map is created
+    again by each process using it.
+    """
+
+    def __init__(self, filename, dtype, offset, shape):
+        """Describe the records."""
+        self.filename = os.fspath(filename)
+        self.dtype = np.dtype(dtype)
+        self.offset = offset
+        self.shape = shape
+        self.ndim = len(shape)
+        self._memmap = None
+
+    def __getitem__(self, key):
+        """Get a view of some records."""
+        if self._memmap is None:
+            self._memmap = np.memmap(self.filename, dtype=self.dtype, mode="r",
+                                     offset=self.offset, shape=self.shape)
+        return np.asarray(self._memmap[key])
+
+    def __getstate__(self):
+        """Get the state to pickle, without the memory map."""
+        state = self.__dict__.copy()
+        state["_memmap"] = None
+        return state
+
+    def __dask_tokenize__(self):
+        """Get a deterministic token for dask."""
+        return (self.filename, self.dtype.descr, self.offset, self.shape)
+
+
 def _get_array(filename=None, hdr_size=None, block_info=None):
     """Get the numpy array for the SEVIRI data."""
     output_block_info = block_info[None]
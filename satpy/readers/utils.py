@@ -19,16 +19,21 @@
 from __future__ import annotations
 
 import bz2
+import hashlib
 import logging
 import os
+import pickle  # nosec
 import shutil
 import tempfile
+import threading
 import warnings
-from contextlib import closing, contextmanager
+from collections import OrderedDict
+from contextlib import closing, contextmanager, suppress
 from io import BytesIO
 from shutil import which
 from subprocess import PIPE, Popen  # nosec
 
+import dask.array as da
 import numpy as np
 import pyproj
 import xarray as xr
@@ -40,6 +45,10 @@ from satpy.utils import get_legacy_chunk_size
 
 LOGGER = logging.getLogger(__name__)
 CHUNK_SIZE = get_legacy_chunk_size()
+CALIBRATION_LUT_CACHE_SIZE = 64
+
+_calibration_luts: OrderedDict = OrderedDict()
+_calibration_luts_lock = threading.Lock()
 
 
 def np2str(value):
@@ -342,6 +351,264 @@ def unzip_context(filename):
         yield filename
 
 
+def cached_file_metadata(filename, func, *args, to_cache=None):
+    """Get the metadata of a file read by ``func(*args)``, cached on disk if configured.
+
+    When the ``cache_file_metadata`` option of ``satpy.config`` is set, the
+    result is pickled to the ``file_metadata`` subdirectory of the
+    ``cache_dir`` and read from there the next time the same file is opened.
+    The cache entry is identified by the absolute path, size and modification
+    time of *filename*, along with the function and its arguments, so a
+    modified file is read again. When the total size of the cache exceeds
+    ``cache_file_metadata_max_size`` bytes, the least recently used entries
+    are removed.
+
+    Args:
+        filename: The file the metadata is read from. Remote files are never cached.
+        func: The callable reading the metadata.
+        *args: Arguments to pass to ``func``.
+        to_cache (callable, optional): Converts the result of ``func`` to the
+            picklable object to store in the cache. When the cache is hit,
+            this converted object is returned.
+
+    """
+    if not config.get("cache_file_metadata", False):
+        return func(*args)
+    cache_file = _get_file_metadata_cache_path(filename, func, args)
+    if cache_file is None:
+        return func(*args)
+
+    try:
+        with open(cache_file, "rb") as fd:
+            metadata = pickle.load(fd)  # nosec
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+    else:
+        LOGGER.debug("Using cached metadata for %s", str(filename))
+        _touch_if_exists(cache_file)
+        return metadata
+
+    metadata = func(*args)
+    _write_file_metadata_cache(cache_file, metadata if to_cache is None else to_cache(metadata))
+    return metadata
+
+
+def _get_file_metadata_cache_path(filename, func, args):
+    try:
+        path = os.path.abspath(os.fspath(filename))
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    key = repr((func.__module__, func.__qualname__, path, stat.st_size, stat.st_mtime_ns, args))
+    key_hash = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+    return os.path.join(config["cache_dir"], "file_metadata", key_hash + ".pkl")
+
+
+def _touch_if_exists(filename):
+    try:
+        os.utime(filename)
+    except OSError:
+        # removed by another process in between
+        pass
+
+
+def _write_file_metadata_cache(cache_file, metadata):
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file first so that concurrent readers never see partial entries
+    fdn, tmpfilepath = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fdn, "wb") as fd:
+            pickle.dump(metadata, fd, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfilepath, cache_file)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as err:
+        LOGGER.debug("Could not cache file metadata to %s: %s", cache_file, str(err))
+        with suppress(OSError):
+            os.remove(tmpfilepath)
+        return
+    _evict_file_metadata_cache(cache_dir, config.get("cache_file_metadata_max_size"))
+
+
+def _evict_file_metadata_cache(cache_dir, max_size):
+    """Remove the least recently used cache entries until the cache fits in *max_size* bytes."""
+    if max_size is None:
+        return
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if not entry.name.endswith(".pkl"):
+            continue
+        with suppress(OSError):
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= int(max_size):
+            break
+        with suppress(OSError):
+            os.remove(path)
+        total_size -= size
+
+
+class _PooledHandle:
+    """Open file handle of the pool and the number of its current users."""
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.users = 0
+
+    def close(self):
+        close = getattr(self.handle, "close", None) or self.handle.end
+        try:
+            close()
+        except RuntimeError:  # presumably closed already
+            pass
+
+
+class FileHandlePool:
+    """Pool of open file handles shared by the file handlers of a process.
+
+    Files are opened when they are first used and kept open for later reads,
+    but at most ``max_open_files`` handles are kept open: the least recently
+    used handles are closed and transparently reopened when they are needed
+    again. Handles in use are never closed, so the limit may be exceeded
+    temporarily.
+
+    The pool is used by the netCDF, HDF5 and HDF4 file handlers when the
+    ``readers.max_open_files`` option of ``satpy.config`` is set, see
+    :data:`FILE_HANDLE_POOL`.
+    """
+
+    def __init__(self, max_open_files=None):
+        """Initialize the pool, taking the maximum number of open files from the config if not provided."""
+        self._max_open_files = max_open_files
+        self._handles = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_open_files(self):
+        """Get the maximum number of open files, None if the pool is disabled."""
+        if self._max_open_files is not None:
+            return self._max_open_files
+        return config.get("readers.max_open_files", None)
+
+    @property
+    def enabled(self):
+        """Check if file handlers should use the pool."""
+        return self.max_open_files is not None
+
+    def __len__(self):
+        """Get the number of open files."""
+        return len(self._handles)
+
+    @contextmanager
+    def open(self, filename, opener, *args):
+        """Get the open handle of ``opener(filename, *args)`` for the duration of the context.
+
+        *opener* and *args* are part of the key of the handle in the pool, so
+        they need to be hashable. The handle must not be used after the context
+        is left, as it may be closed any time.
+        """
+        entry = self._acquire((filename, opener, args), lambda: opener(filename, *args))
+        try:
+            yield entry.handle
+        finally:
+            with self._lock:
+                entry.users -= 1
+                self._close_least_recently_used()
+
+    def add(self, handle, filename, opener, *args):
+        """Add an already open *handle* as if it was opened with ``opener(filename, *args)``."""
+        entry = self._acquire((filename, opener, args), lambda: handle)
+        with self._lock:
+            entry.users -= 1
+            self._close_least_recently_used()
+        if entry.handle is not handle:
+            _PooledHandle(handle).close()
+
+    def _acquire(self, key, open_handle):
+        with self._lock:
+            entry = self._handles.pop(key, None)
+            if entry is None:
+                entry = _PooledHandle(open_handle())
+            self._handles[key] = entry
+            entry.users += 1
+            self._close_least_recently_used()
+        return entry
+
+    def _close_least_recently_used(self):
+        max_open_files = self.max_open_files
+        if max_open_files is None:
+            return
+        excess = len(self._handles) - max_open_files
+        for key, entry in list(self._handles.items()):
+            if excess <= 0:
+                break
+            if entry.users:
+                continue
+            del self._handles[key]
+            entry.close()
+            excess -= 1
+
+    def clear(self):
+        """Close all the handles not in use."""
+        with self._lock:
+            for key, entry in list(self._handles.items()):
+                if not entry.users:
+                    del self._handles[key]
+                    entry.close()
+
+
+#: Pool of open files of the process
+FILE_HANDLE_POOL = FileHandlePool()
+
+
+class PooledVariable:
+    """Array-like variable of a file that is read through the :data:`FILE_HANDLE_POOL`.
+
+    The variable can be wrapped in a dask array with :func:`dask.array.from_array`:
+    the file is opened (again) when data are read, not when the variable is created.
+
+    Args:
+        filename: File the variable is in.
+        opener (callable): Picklable function opening the file, called as
+            ``opener(filename, *open_args)``.
+        path (str): Path of the variable in the file.
+        shape (tuple): Shape of the variable.
+        dtype: Data type of the variable.
+        attrs (dict): Attributes of the variable.
+        open_args (tuple): Extra arguments to *opener*.
+        getter (callable): Function getting the variable as ``getter(handle, path)``,
+            item access by default.
+
+    """
+
+    def __init__(self, filename, opener, path, shape, dtype, attrs=None, open_args=(), getter=None):
+        """Describe the variable."""
+        self.filename = filename
+        self.opener = opener
+        self.path = path
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.attrs = attrs or {}
+        self.open_args = tuple(open_args)
+        self.getter = getter
+
+    @property
+    def ndim(self):
+        """Get the number of dimensions."""
+        return len(self.shape)
+
+    def __getitem__(self, key):
+        """Read the data of the variable at *key*."""
+        with FILE_HANDLE_POOL.open(self.filename, self.opener, *self.open_args) as handle:
+            variable = self.getter(handle, self.path) if self.getter else handle[self.path]
+            return variable[key]
+
+    def __dask_tokenize__(self):
+        """Tokenize the variable by its location."""
+        return os.fspath(self.filename), self.opener.__qualname__, self.open_args, self.path
+
+
 @contextmanager
 def generic_open(filename, *args, **kwargs):
     """Context manager for opening either a regular file or a bzip2 file.
@@ -497,6 +764,85 @@ def remove_earthsun_distance_correction(reflectance, utc_date=None):
     return reflectance
 
 
+def calibrate_with_lut(data, calibrate, key=None):
+    """Calibrate integer counts through a lookup table of all possible counts.
+
+    Instead of evaluating *calibrate* for every pixel, it is evaluated once for
+    every value the integer type of *data* can hold and the resulting table is
+    applied with a single gather per dask block. The last
+    :data:`CALIBRATION_LUT_CACHE_SIZE` tables are kept in memory under *key*,
+    which should identify the channel, time slot and calibration coefficients,
+    so that for example all segments of a channel share the same table.
+
+    Data of other types than integers of at most 16 bits is passed to
+    *calibrate* directly.
+
+    Args:
+        data (xarray.DataArray or dask.array.Array): Counts to calibrate.
+        calibrate (callable): Function calibrating counts of the same kind of
+            array as *data*, pixel by pixel. The table is computed from a
+            one-dimensional array of counts without attributes; attributes set
+            by *calibrate* are added to the attributes of *data*.
+        key (hashable, optional): Key to cache the table under. If None or not
+            hashable, the table is not cached.
+
+    Returns:
+        The calibrated data, of the same kind of array as *data*.
+
+    """
+    if not _is_lut_compatible(data.dtype):
+        return calibrate(data)
+    table, table_attrs = _get_calibration_lut(key, calibrate, data.dtype, isinstance(data, xr.DataArray))
+    offset = int(np.iinfo(data.dtype).min)
+    arr = data.data if isinstance(data, xr.DataArray) else data
+    if isinstance(arr, da.Array):
+        res = arr.map_blocks(_apply_lut, table, offset, dtype=table.dtype, meta=np.array((), dtype=table.dtype))
+    else:
+        res = _apply_lut(np.asarray(arr), table, offset)
+    if not isinstance(data, xr.DataArray):
+        return res
+    return xr.DataArray(res, dims=data.dims, coords=data.coords, attrs=dict(data.attrs, **table_attrs))
+
+
+def _is_lut_compatible(dtype):
+    return np.issubdtype(dtype, np.integer) and np.dtype(dtype).itemsize <= 2
+
+
+def _get_calibration_lut(key, calibrate, dtype, as_data_array):
+    cache_key = (key, np.dtype(dtype).str, as_data_array)
+    try:
+        with _calibration_luts_lock:
+            _calibration_luts.move_to_end(cache_key)
+            return _calibration_luts[cache_key]
+    except (KeyError, TypeError):
+        pass
+    lut = _build_calibration_lut(calibrate, dtype, as_data_array)
+    if key is None:
+        return lut
+    with suppress(TypeError), _calibration_luts_lock:
+        _calibration_luts[cache_key] = lut
+        while len(_calibration_luts) > CALIBRATION_LUT_CACHE_SIZE:
+            _calibration_luts.popitem(last=False)
+    return lut
+
+
+def _build_calibration_lut(calibrate, dtype, as_data_array):
+    iinfo = np.iinfo(dtype)
+    LOGGER.debug("Building calibration lookup table for %d counts", int(iinfo.max) - int(iinfo.min) + 1)
+    counts = da.arange(int(iinfo.min), int(iinfo.max) + 1, dtype=dtype, chunks=-1)
+    if as_data_array:
+        counts = xr.DataArray(counts, dims=("counts",))
+    res = calibrate(counts)
+    attrs = dict(res.attrs) if isinstance(res, xr.DataArray) else {}
+    return np.asarray(res), attrs
+
+
+def _apply_lut(block, table, offset):
+    if offset:
+        block = block.astype(np.intp) - offset
+    return table[block]
+
+
 class _CalibrationCoefficientParser:
     """Parse user-defined calibration coefficients."""
 
@@ -21,16 +21,17 @@ import glob
 import itertools
 import logging
 import os
+import re
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from fnmatch import fnmatch
+from fnmatch import translate
 from weakref import WeakValueDictionary
 
 import numpy as np
 import xarray as xr
-import yaml
 from pyresample.boundary import AreaDefBoundary, Boundary
 from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefinition
 from trollsift.parser import globify, parse
@@ -42,14 +43,19 @@ except ImportError:
 
 from satpy import DatasetDict
 from satpy._compat import cache
+from satpy._config import load_yaml_config
 from satpy.aux_download import DataDownloadMixin
 from satpy.dataset import DataID, DataQuery, get_key
+from satpy.dataset.data_dict import DataIDDict
 from satpy.dataset.dataid import default_co_keys_config, default_id_keys_config, get_keys_from_config
-from satpy.resample import add_crs_xy_coords, get_area_def
-from satpy.utils import recursive_dict_update
+from satpy.resample import add_crs_xy_coords, get_area_def, get_area_slices
+from satpy.utils import get_nbytes, profile_step, recursive_dict_update
 
 logger = logging.getLogger(__name__)
 
+# fraction of the full height around a region of interest of which the segments are read too
+ROI_SEGMENT_MARGIN = 0.01
+
 
 def listify_string(something):
     """Take *something* and make it a list.
@@ -67,22 +73,86 @@ def listify_string(something):
 
 def _get_filebase(path, pattern):
     """Get the end of *path* of same length as *pattern*."""
+    # A pattern can include directories
+    return _get_path_tail(path, len(pattern.split(os.path.sep)))
+
+
+def _get_path_tail(path, tail_len):
+    """Get the last *tail_len* components of *path*."""
     # convert any `/` on Windows to `\\`
     path = os.path.normpath(path)
-    # A pattern can include directories
-    tail_len = len(pattern.split(os.path.sep))
     return os.path.join(*str(path).split(os.path.sep)[-tail_len:])
 
 
 def _match_filenames(filenames, pattern):
     """Get the filenames matching *pattern*."""
-    matching = set()
-    glob_pat = globify(pattern)
-    for filename in filenames:
-        if fnmatch(_get_filebase(filename, pattern), glob_pat):
-            matching.add(filename)
+    return _get_pattern_index((pattern,)).classify(filenames)[pattern]
+
+
+_GLOB_WILDCARDS = re.compile(r"[*?[]")
 
-    return matching
+
+def _get_literal_prefix(glob_pattern):
+    """Get the part of *glob_pattern* before its first wildcard."""
+    match = _GLOB_WILDCARDS.search(glob_pattern)
+    return glob_pattern if match is None else glob_pattern[:match.start()]
+
+
+class FilenamePatternIndex:
+    """Index of filename patterns to match many files against many patterns.
+
+    Matching each filename against each pattern of each file type gets slow
+    for directories holding many files and when many readers are tried. The
+    index compiles the patterns once and groups them by the number of path
+    components they span and by the literal prefix of their glob, so that a
+    filename is only compared to the patterns it can match. Matching follows
+    the :func:`fnmatch.fnmatch` rules, applied to the patterns globified with
+    :func:`trollsift.parser.globify`.
+    """
+
+    def __init__(self, patterns):
+        """Compile the *patterns*, duplicates are ignored."""
+        self.patterns = tuple(dict.fromkeys(patterns))
+        self._buckets = {}
+        for position, pattern in enumerate(self.patterns):
+            glob_pattern = os.path.normcase(globify(pattern))
+            tail_len = len(pattern.split(os.path.sep))
+            prefix = _get_literal_prefix(glob_pattern)
+            regex = re.compile(translate(glob_pattern))
+            prefixes = self._buckets.setdefault(tail_len, {})
+            prefixes.setdefault(prefix, []).append((position, regex))
+        self._prefix_lengths = {tail_len: sorted({len(prefix) for prefix in prefixes})
+                                for tail_len, prefixes in self._buckets.items()}
+
+    def match(self, filename):
+        """Get the patterns matching *filename*, in the order they were given."""
+        positions = []
+        for tail_len, prefixes in self._buckets.items():
+            filebase = os.path.normcase(_get_path_tail(filename, tail_len))
+            for prefix_len in self._prefix_lengths[tail_len]:
+                if prefix_len > len(filebase):
+                    break
+                for position, regex in prefixes.get(filebase[:prefix_len], ()):
+                    if regex.match(filebase):
+                        positions.append(position)
+        return [self.patterns[position] for position in sorted(positions)]
+
+    def classify(self, filenames):
+        """Match all *filenames* to the patterns in a single pass.
+
+        Returns: dict mapping each pattern to the set of filenames matching it.
+        """
+        matches = {pattern: set() for pattern in self.patterns}
+        for filename in filenames:
+            for pattern in self.match(filename):
+                matches[pattern].add(filename)
+        return matches
+
+
+@cache
+def _get_pattern_index(patterns):
+    """Get the index of the *patterns* tuple, compiling it only once."""
+    return FilenamePatternIndex(patterns)
 
 
 def _verify_reader_info_assign_config_files(config, config_files):
@@ -115,8 +185,7 @@ def load_yaml_configs(*config_files, loader=Loader):
     config = {}
     logger.debug("Reading %s", str(config_files))
     for config_file in config_files:
-        with open(config_file, "r", encoding="utf-8") as fd:
-            config = recursive_dict_update(config, yaml.load(fd, Loader=loader))
+        config = recursive_dict_update(config, load_yaml_config(config_file, loader=loader))
     _verify_reader_info_assign_config_files(config, config_files)
     return config
 
@@ -153,7 +222,7 @@ class AbstractYAMLReader(metaclass=ABCMeta):
         self._id_keys = self.info.get("data_identification_keys", default_id_keys_config)
         self._co_keys = self.info.get("coord_identification_keys", default_co_keys_config)
         self.info["filenames"] = []
-        self.all_ids = {}
+        self.all_ids = DataIDDict()
         self.load_ds_ids_from_config()
 
     @classmethod
@@ -223,7 +292,7 @@ class AbstractYAMLReader(metaclass=ABCMeta):
         return True
 
     def select_files_from_directory(
-            self, directory=None, fs=None):
+            self, directory=None, fs=None, pattern_matches=None):
         """Find files for this reader in *directory*.
 
         If directory is None or '', look in the current directory.
@@ -237,6 +306,10 @@ class AbstractYAMLReader(metaclass=ABCMeta):
             fs (Optional[FileSystem]): fsspec FileSystem implementation to use.
                                        Defaults to None, using local file
                                        system.
+            pattern_matches (Optional[Mapping[str, Set[str]]]): Files of
+                *directory* already matched to file patterns, as returned by
+                :meth:`FilenamePatternIndex.classify`. The patterns found in
+                it are not globbed again.
 
         Returns:
             list of strings describing matching files
@@ -244,9 +317,14 @@ class AbstractYAMLReader(metaclass=ABCMeta):
         filenames = set()
         if directory is None:
             directory = ""
+        pattern_matches = pattern_matches or {}
         # all the glob patterns that we are going to look at
-        all_globs = {os.path.join(directory, globify(pattern))
-                     for pattern in self.file_patterns}
+        all_globs = set()
+        for pattern in self.file_patterns:
+            if pattern in pattern_matches:
+                filenames.update(pattern_matches[pattern])
+            else:
+                all_globs.add(os.path.join(directory, globify(pattern)))
         # custom filesystem or not
         if fs is None:
             matcher = glob.iglob
@@ -259,15 +337,10 @@ class AbstractYAMLReader(metaclass=ABCMeta):
 
     def select_files_from_pathnames(self, filenames):
         """Select the files from *filenames* this reader can handle."""
-        selected_filenames = []
-        filenames = set(filenames)  # make a copy of the inputs
-
-        for pattern in self.file_patterns:
-            matching = _match_filenames(filenames, pattern)
-            filenames -= matching
-            for fname in matching:
-                if fname not in selected_filenames:
-                    selected_filenames.append(fname)
+        pattern_index = _get_pattern_index(tuple(self.file_patterns))
+        matches = pattern_index.classify(filenames)
+        selected_filenames = list(dict.fromkeys(fname for pattern in pattern_index.patterns
+                                                for fname in matches[pattern]))
         if len(selected_filenames) == 0:
             logger.warning("No filenames found for reader: %s", self.name)
         return selected_filenames
@@ -278,7 +351,7 @@ class AbstractYAMLReader(metaclass=ABCMeta):
         See `satpy.readers.get_key` for more information about kwargs.
 
         """
-        return get_key(key, self.all_ids.keys(), **kwargs)
+        return get_key(key, self.all_ids, **kwargs)
 
     def load_ds_ids_from_config(self):
         """Get the dataset ids from the config."""
@@ -385,9 +458,12 @@ class GenericYAMLReader(AbstractYAMLReader):
         if not isinstance(filenames, set):
             # we perform set operations later on to improve performance
             filenames = set(filenames)
-        for pattern in filetype_info["file_patterns"]:
+        pattern_index = _get_pattern_index(tuple(filetype_info["file_patterns"]))
+        all_matches = pattern_index.classify(filenames)
+        for pattern in pattern_index.patterns:
             matched_files = set()
-            matches = _match_filenames(filenames, pattern)
+            # files parsed with an earlier pattern are already removed
+            matches = all_matches[pattern] & filenames
             for filename in matches:
                 try:
                     filename_info = parse(
@@ -465,6 +541,21 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
     its base class and can be used as a reader by itself and requires no
     subclassing.
 
+    File handlers are created one after the other by default. Formats split
+    into many files (e.g. full disk segments of geostationary imagers) may
+    benefit from creating the file handlers on a pool of threads by passing
+    ``fh_workers`` in ``reader_kwargs``::
+
+        scn = Scene(filenames=filenames, reader="ahi_hsd",
+                    reader_kwargs={"fh_workers": 8})
+
+    The order of the created file handlers is the same whatever the number
+    of workers. Only file handler classes with
+    :attr:`~satpy.readers.file_handlers.BaseFileHandler.concurrent_creation`
+    set to ``True`` are created concurrently, the others (for example those
+    using netCDF4-python, which is not thread-safe) are still created one
+    after the other.
+
     """
 
     # WeakValueDictionary objects must be created at the class level or else
@@ -475,12 +566,17 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
                  config_dict,
                  filter_parameters=None,
                  filter_filenames=True,
+                 fh_workers=None,
                  **kwargs):
         """Set up initial internal storage for loading file data."""
         super().__init__(config_dict, filter_parameters, filter_filenames)
 
+        if fh_workers is not None and (isinstance(fh_workers, bool) or not isinstance(fh_workers, int)
+                                       or fh_workers < 1):
+            raise ValueError(f"'fh_workers' must be a positive integer, got {fh_workers!r}")
+        self.fh_workers = fh_workers
         self.file_handlers = {}
-        self.available_ids = {}
+        self.available_ids = DataIDDict()
         self.register_data_files()
 
     @property
@@ -526,6 +622,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
         If the file doesn't provide any bounding box information or 'area'
         was not provided in `filter_parameters`, the check returns True.
+        *check_area* can be an area name or an area definition.
         """
         try:
             gbb = Boundary(*file_handler.get_bounding_box())
@@ -533,7 +630,9 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
             logger.debug("Bounding box computation not implemented: %s",
                          str(err))
         else:
-            abb = AreaDefBoundary(get_area_def(check_area), frequency=1000)
+            if isinstance(check_area, str):
+                check_area = get_area_def(check_area)
+            abb = AreaDefBoundary(check_area, frequency=1000)
 
             intersection = gbb.contour_poly.intersection(abb.contour_poly)
             if not intersection:
@@ -568,12 +667,36 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
     def _new_filehandler_instances(self, filetype_info, filename_items, fh_kwargs=None):
         """Generate new filehandler instances."""
-        requirements = filetype_info.get("requires")
         filetype_cls = filetype_info["file_reader"]
 
         if fh_kwargs is None:
             fh_kwargs = {}
 
+        fh_args = self._filehandler_args_with_requirements(filetype_info, filename_items)
+        if not self._create_filehandlers_concurrently(filetype_cls):
+            for args in fh_args:
+                yield filetype_cls(*args, **fh_kwargs)
+            return
+
+        # resolve requirements (and warn about missing ones) in the main thread
+        # so that only the opening of the files is done concurrently
+        fh_args = list(fh_args)
+        with ThreadPoolExecutor(max_workers=self.fh_workers) as executor:
+            yield from executor.map(lambda args: filetype_cls(*args, **fh_kwargs), fh_args)
+
+    def _create_filehandlers_concurrently(self, filetype_cls):
+        """Check if file handlers of class *filetype_cls* can be created on a thread pool."""
+        if self.fh_workers is None or self.fh_workers == 1:
+            return False
+        if not filetype_cls.concurrent_creation:
+            logger.debug("%s does not support concurrent creation, ignoring 'fh_workers'",
+                         filetype_cls.__name__)
+            return False
+        return True
+
+    def _filehandler_args_with_requirements(self, filetype_info, filename_items):
+        """Generate the positional arguments of the file handlers to create."""
+        requirements = filetype_info.get("requires")
         for filename, filename_info in filename_items:
             try:
                 req_fh = self.find_required_filehandlers(requirements,
@@ -581,13 +704,13 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
             except KeyError as req:
                 msg = "No handler for reading requirement {} for {}".format(
                     req, filename)
-                warnings.warn(msg, stacklevel=4)
+                warnings.warn(msg, stacklevel=5)
                 continue
             except RuntimeError as err:
-                warnings.warn(str(err) + " for {}".format(filename), stacklevel=4)
+                warnings.warn(str(err) + " for {}".format(filename), stacklevel=5)
                 continue
 
-            yield filetype_cls(filename, filename_info, filetype_info, *req_fh, **fh_kwargs)
+            yield (filename, filename_info, filetype_info, *req_fh)
 
     def filter_fh_by_metadata(self, filehandlers):
         """Filter out filehandlers using provide filter parameters."""
@@ -626,9 +749,10 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         created_fhs = {}
         # load files that we know about by creating the file handlers
         for filetype, filetype_info in self.sorted_filetype_items():
-            filehandlers = self._new_filehandlers_for_filetype(filetype_info,
-                                                               filename_set,
-                                                               fh_kwargs=fh_kwargs)
+            with profile_step("file_handlers", "{}/{}".format(self.name, filetype)):
+                filehandlers = self._new_filehandlers_for_filetype(filetype_info,
+                                                                   filename_set,
+                                                                   fh_kwargs=fh_kwargs)
 
             if filehandlers:
                 created_fhs[filetype] = filehandlers
@@ -680,7 +804,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
         """
         avail_datasets = self._file_handlers_available_datasets()
-        new_ids = {}
+        new_ids = DataIDDict()
         for is_avail, ds_info in avail_datasets:
             # especially from the yaml config
             coordinates = ds_info.get("coordinates")
@@ -733,7 +857,9 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
     def _load_dataset_data(self, file_handlers, dsid, **kwargs):
         ds_info = self.all_ids[dsid]
-        proj = self._load_dataset(dsid, ds_info, file_handlers, **kwargs)
+        with profile_step("load", dsid) as step:
+            proj = self._load_dataset(dsid, ds_info, file_handlers, **kwargs)
+            step["nbytes"] = get_nbytes(proj)
         # FIXME: areas could be concatenated here
         # Update the metadata
         proj.attrs["start_time"] = file_handlers[0].start_time
@@ -826,11 +952,20 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
                 FileYAMLReader._coords_cache[key] = sdef
         return sdef
 
-    def _load_dataset_with_area(self, dsid, coords, **kwargs):
+    def _filter_file_handlers_by_roi(self, dsid, file_handlers, roi, **kwargs):
+        """Get the file handlers of *dsid* with data in the region of interest *roi*."""
+        return [fh for fh in file_handlers if self.check_file_covers_area(fh, roi)]
+
+    def _load_dataset_with_area(self, dsid, coords, roi=None, **kwargs):
         """Load *dsid* and its area if available."""
         file_handlers = self._get_file_handlers(dsid)
         if not file_handlers:
             return
+        if roi is not None:
+            file_handlers = self._filter_file_handlers_by_roi(dsid, file_handlers, roi, **kwargs)
+            if not file_handlers:
+                logger.warning("No data for '%s' in the region of interest", dsid["name"])
+                return None
 
         try:
             ds = self._load_dataset_data(file_handlers, dsid, **kwargs)
@@ -922,16 +1057,19 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
         """
         try:
-            return get_key(key, self.available_dataset_ids, **kwargs)
+            return get_key(key, self.available_ids, **kwargs)
         except KeyError:
             if available_only:
                 raise
-            return get_key(key, self.all_dataset_ids, **kwargs)
+            return get_key(key, self.all_ids, **kwargs)
 
-    def load(self, dataset_keys, previous_datasets=None, **kwargs):
+    def load(self, dataset_keys, previous_datasets=None, roi=None, **kwargs):
         """Load `dataset_keys`.
 
-        If `previous_datasets` is provided, do not reload those.
+        If `previous_datasets` is provided, do not reload those. If a region
+        of interest `roi` (an area definition) is provided, files and segments
+        without data in that region are not read. The loaded data still needs
+        to be cropped to the region.
         """
         all_datasets = previous_datasets or DatasetDict()
         datasets = DatasetDict()
@@ -945,12 +1083,12 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
                 continue
             coords = [all_datasets.get(cid, None)
                       for cid in coordinates.get(dsid, [])]
-            ds = self._load_dataset_with_area(dsid, coords, **kwargs)
+            ds = self._load_dataset_with_area(dsid, coords, roi=roi, **kwargs)
             if ds is not None:
                 all_datasets[dsid] = ds
                 if dsid in dsids:
                     datasets[dsid] = ds
-        self._load_ancillary_variables(all_datasets, **kwargs)
+        self._load_ancillary_variables(all_datasets, roi=roi, **kwargs)
 
         return datasets
 
@@ -1244,16 +1382,44 @@ class GEOSegmentYAMLReader(GEOFlippableFileYAMLReader):
 
     def _load_area_def_with_padding(self, dsid, file_handlers):
         """Load the area definition of *dsid* with padding."""
+        area_defs = self._get_padded_segment_area_defs(dsid, file_handlers)
+
+        # Stack the area definitions
+        area_def = _stack_area_defs(area_defs)
+
+        return area_def
+
+    def _get_padded_segment_area_defs(self, dsid, file_handlers):
+        """Get the area definitions of all segments of *dsid* by segment number."""
         # Pad missing segments between the first available and expected
         area_defs = self._pad_later_segments_area(file_handlers, dsid)
 
         # Add missing start segments
-        area_defs = self._pad_earlier_segments_area(file_handlers, dsid, area_defs)
+        return self._pad_earlier_segments_area(file_handlers, dsid, area_defs)
 
-        # Stack the area definitions
-        area_def = _stack_area_defs(area_defs)
+    def _filter_file_handlers_by_roi(self, dsid, file_handlers, roi, pad_data=True, **kwargs):
+        """Get the file handlers of the segments of *dsid* with lines in the region of interest *roi*.
 
-        return area_def
+        The segments are selected from the lines of the padded full area covering *roi*, widened by
+        :data:`ROI_SEGMENT_MARGIN` of the full height, so cropping other resolutions to the same region
+        doesn't need lines of skipped segments. Skipped segments are padded like missing ones.
+        Without padding, all segments are kept.
+        """
+        if not pad_data:
+            return file_handlers
+        area_defs = self._get_padded_segment_area_defs(dsid, file_handlers)
+        try:
+            x_slice, y_slice = get_area_slices(_stack_area_defs(area_defs), roi)
+        except (AttributeError, NotImplementedError, ValueError):
+            return file_handlers
+        if x_slice.stop <= x_slice.start or y_slice.stop <= y_slice.start:
+            # no overlap, let the cropping fail like without filtering
+            return file_handlers
+        segment_lines = _get_segment_lines(area_defs)
+        margin = int(np.ceil(sum(stop - start for start, stop in segment_lines.values()) * ROI_SEGMENT_MARGIN))
+        first_line, last_line = y_slice.start - margin, y_slice.stop + margin
+        return [fh for fh in file_handlers
+                if _overlaps(segment_lines[int(fh.filename_info.get("segment", 1))], first_line, last_line)]
 
     def _pad_later_segments_area(self, file_handlers, dsid):
         """Pad area definitions for missing segments that are later in sequence than the first available."""
@@ -1343,6 +1509,21 @@ def _stack_area_defs(area_def_dict):
     return area_def
 
 
+def _get_segment_lines(area_defs):
+    """Get the first and last (excluded) lines of each segment in the stacked area."""
+    segment_lines = {}
+    first_line = 0
+    for segment in sorted(area_defs):
+        last_line = first_line + area_defs[segment].shape[0]
+        segment_lines[segment] = (first_line, last_line)
+        first_line = last_line
+    return segment_lines
+
+
+def _overlaps(lines, first_line, last_line):
+    return lines[0] < last_line and lines[1] > first_line
+
+
 def _find_missing_segments(file_handlers, ds_info, dsid):
     """Find missing segments."""
     slice_list = []
@@ -34,7 +34,7 @@ Resampling algorithms
 
     "Resampler", "Description", "Related"
     "nearest", "Nearest Neighbor", :class:`~satpy.resample.KDTreeResampler`
-    "ewa", "Elliptical Weighted Averaging", :class:`~pyresample.ewa.DaskEWAResampler`
+    "ewa", "Elliptical Weighted Averaging", :class:`~satpy.resample.DaskEWAResampler`
     "ewa_legacy", "Elliptical Weighted Averaging (Legacy)", :class:`~pyresample.ewa.LegacyDaskEWAResampler`
     "native", "Native", :class:`~satpy.resample.NativeResampler`
     "bilinear", "Bilinear", :class:`~satpy.resample.BilinearResampler`
@@ -42,7 +42,7 @@ Resampling algorithms
     "bucket_sum", "Sum Bucket Resampling", :class:`~satpy.resample.BucketSum`
     "bucket_count", "Count Bucket Resampling", :class:`~satpy.resample.BucketCount`
     "bucket_fraction", "Fraction Bucket Resampling", :class:`~satpy.resample.BucketFraction`
-    "gradient_search", "Gradient Search Resampling", :meth:`~pyresample.gradient.create_gradient_search_resampler`
+    "gradient_search", "Gradient Search Resampling", :meth:`~satpy.resample.create_gradient_search_resampler`
 
 The resampling algorithm used can be specified with the ``resampler`` keyword
 argument and defaults to ``nearest``:
@@ -96,6 +96,17 @@ target pixels don't change over time.
 
     >>> new_scn = scn.resample('euro4', cache_dir='/path/to/cache_dir')
 
+The ``nearest``, ``bilinear``, ``ewa`` and ``gradient_search`` resamplers
+store their precomputed lookup tables in this directory. The name of each
+cache entry is derived from a hash of the source and target geometries and of
+the resampling parameters, so the same directory can be used for any number of
+areas and can be shared by several processes running at the same time: entries
+are first written to a temporary name and then moved in place, so other
+processes never see incomplete entries. The total size of the entries can be
+bounded with the ``resample_cache_max_size`` setting of ``satpy.config``
+(see :ref:`config_resample_cache_max_size_setting`), in which case the least
+recently used entries are removed first.
+
 See the documentation for specific algorithms to see availability and
 limitations of caching for that algorithm.
 
@@ -163,20 +174,31 @@ Area definitions included in Satpy
 import hashlib
 import json
 import os
+import shutil
+import uuid
 import warnings
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from logging import getLogger
 from math import lcm  # type: ignore
 from weakref import WeakValueDictionary
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
-import zarr
-from pyresample.ewa import DaskEWAResampler, LegacyDaskEWAResampler
-from pyresample.geometry import SwathDefinition
-from pyresample.gradient import create_gradient_search_resampler
+from pyresample.ewa import DaskEWAResampler as PRDaskEWAResampler
+from pyresample.ewa import LegacyDaskEWAResampler
+from pyresample.geometry import AreaDefinition, SwathDefinition
+from pyresample.gradient import (
+    ResampleBlocksGradientSearchResampler,
+    is_area_to_area,
+    is_area_to_swath,
+    is_swath_to_area,
+)
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
+import satpy
 from satpy._config import config_search_paths, get_config_path
 from satpy.utils import PerformanceWarning, get_legacy_chunk_size
 
@@ -194,6 +216,8 @@ BIL_COORDINATES = {"bilinear_s": ("x1", ),
                    "mask_slices": ("x1", "n"),
                    "out_coords_x": ("x2", ),
                    "out_coords_y": ("y2", )}
+RESAMPLE_CACHE_PREFIXES = ("nn_lut-", "bil_lut-", "ewa_lut-", "gs_lut-")
+AREA_SLICES_CACHE_SIZE = 128
 
 resamplers_cache: "WeakValueDictionary[tuple, object]" = WeakValueDictionary()
 
@@ -231,6 +255,66 @@ def get_area_def(area_name):
     return parse_area_file(get_area_file(), area_name)[0]
 
 
+def get_area_slices(source_area, destination_area, shape_divisible_by=None):
+    """Get the slices of *source_area* covering *destination_area*.
+
+    The slices of the last :data:`AREA_SLICES_CACHE_SIZE` pairs of area
+    definitions are kept in memory, so that resampling data from the same
+    source area to the same destination again, even in another
+    :class:`~satpy.scene.Scene`, does not need to intersect the areas again.
+    If the ``cache_area_slices`` setting of ``satpy.config`` is True, the
+    slices are also stored in the ``area_slices`` subdirectory of the
+    ``cache_dir``, to be reused by other processes. Slices involving other
+    kinds of geometries are never cached.
+
+    Args:
+        source_area (AreaDefinition): Area to get the slices of.
+        destination_area: Area the slices of *source_area* should cover.
+        shape_divisible_by (int, optional): Make the shape of the sliced area
+            divisible by this number.
+
+    Returns:
+        The x and y slices of *source_area*.
+
+    """
+    if not isinstance(source_area, AreaDefinition) or not isinstance(destination_area, AreaDefinition):
+        return _compute_area_slices(source_area, destination_area, shape_divisible_by)
+    return _get_cached_area_slices(source_area, destination_area, shape_divisible_by)
+
+
+@lru_cache(maxsize=AREA_SLICES_CACHE_SIZE)
+def _get_cached_area_slices(source_area, destination_area, shape_divisible_by):
+    if not satpy.config.get("cache_area_slices", False):
+        return _compute_area_slices(source_area, destination_area, shape_divisible_by)
+    the_hash = source_area.update_hash()
+    destination_area.update_hash(the_hash)
+    hash_dict({"shape_divisible_by": shape_divisible_by}, the_hash)
+    cache_file = os.path.join(satpy.config["cache_dir"], "area_slices", the_hash.hexdigest() + ".json")
+    try:
+        with open(cache_file) as fid:
+            return tuple(slice(*bounds) for bounds in json.load(fid))
+    except (OSError, ValueError, TypeError):
+        pass
+    slices = _compute_area_slices(source_area, destination_area, shape_divisible_by)
+    _write_area_slices(cache_file, slices)
+    return slices
+
+
+def _compute_area_slices(source_area, destination_area, shape_divisible_by):
+    try:
+        return source_area.get_area_slices(destination_area, shape_divisible_by=shape_divisible_by)
+    except TypeError:
+        return source_area.get_area_slices(destination_area)
+
+
+def _write_area_slices(cache_file, slices):
+    bounds = [[None if bound is None else int(bound) for bound in (slc.start, slc.stop, slc.step)]
+              for slc in slices]
+    with _atomic_cache_entry(cache_file) as tmp_filename:
+        with open(tmp_filename, "w") as fid:
+            json.dump(bounds, fid)
+
+
 def add_xy_coords(data_arr, area, crs=None):
     """Assign x/y coordinates to DataArray from provided area.
 
@@ -463,11 +547,15 @@ class KDTreeResampler(PRBaseResampler):
                 cached[idx_name] = self._apply_cached_index(
                     self._index_caches[mask_name][idx_name], idx_name)
             elif cache_dir:
+                # zarr is only needed for the disk cache, don't import it with satpy
+                import zarr
+
                 try:
                     filename = self._create_cache_filename(
                         cache_dir, prefix="nn_lut-",
                         mask=mask_name, **kwargs)
                     fid = zarr.open(filename, "r")
+                    _touch_cache_entry(filename)
                     cache = np.array(fid[idx_name])
                     if idx_name == "valid_input_index":
                         # valid input index array needs to be boolean
@@ -497,7 +585,8 @@ class KDTreeResampler(PRBaseResampler):
                 zarr_out[idx_name] = (coord, cache[idx_name])
 
             # Write indices to Zarr file
-            zarr_out.to_zarr(filename)
+            with _atomic_cache_entry(filename) as tmp_filename:
+                zarr_out.to_zarr(tmp_filename)
 
             self._index_caches[mask_name] = cache
             # Delete the kdtree, it's not needed anymore
@@ -576,6 +665,7 @@ class BilinearResampler(PRBaseResampler):
                                                    **kwargs)
             try:
                 self.resampler.load_resampling_info(filename)
+                _touch_cache_entry(filename)
             except AttributeError:
                 warnings.warn(
                     "Bilinear resampler can't handle caching, "
@@ -597,7 +687,8 @@ class BilinearResampler(PRBaseResampler):
                 _move_existing_caches(cache_dir, filename)
             LOG.info("Saving BIL neighbour info to %s", filename)
             try:
-                self.resampler.save_resampling_info(filename)
+                with _atomic_cache_entry(filename) as tmp_filename:
+                    self.resampler.save_resampling_info(tmp_filename)
             except AttributeError:
                 warnings.warn(
                     "Bilinear resampler can't handle caching, "
@@ -638,6 +729,193 @@ def _move_existing_caches(cache_dir, filename):
     LOG.warning("Old cache file was moved to %s", old_cache_dir)
 
 
+@contextmanager
+def _atomic_cache_entry(filename):
+    """Write a resampling cache entry to a temporary path and move it to *filename* when done.
+
+    Writing errors are logged and ignored, and when another process already
+    moved the same entry in place, the newly written one is dropped.
+    """
+    cache_dir = os.path.dirname(filename) or "."
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_filename = os.path.join(cache_dir, ".{}.{}.tmp".format(os.path.basename(filename), uuid.uuid4().hex))
+    try:
+        yield tmp_filename
+        os.replace(tmp_filename, filename)
+    except OSError as err:
+        LOG.debug("Could not write resampling cache entry %s: %s", filename, str(err))
+    finally:
+        _remove_cache_entry(tmp_filename)
+    _evict_resample_cache(cache_dir, satpy.config.get("resample_cache_max_size"))
+
+
+def _touch_cache_entry(filename):
+    """Mark a cache entry as recently used."""
+    with suppress(OSError):
+        os.utime(filename)
+
+
+def _remove_cache_entry(filename):
+    if os.path.isdir(filename):
+        shutil.rmtree(filename, ignore_errors=True)
+    else:
+        with suppress(OSError):
+            os.remove(filename)
+
+
+def _get_cache_entry_size(entry):
+    if not entry.is_dir():
+        return entry.stat().st_size
+    size = 0
+    for root, _, files in os.walk(entry.path):
+        for fname in files:
+            with suppress(OSError):
+                size += os.path.getsize(os.path.join(root, fname))
+    return size
+
+
+def _evict_resample_cache(cache_dir, max_size):
+    """Remove the least recently used resampling cache entries until they fit in *max_size* bytes."""
+    if max_size is None:
+        return
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if not entry.name.startswith(RESAMPLE_CACHE_PREFIXES):
+            continue
+        with suppress(OSError):
+            entries.append((entry.stat().st_mtime_ns, _get_cache_entry_size(entry), entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= int(max_size):
+            break
+        _remove_cache_entry(path)
+        total_size -= size
+
+
+def _load_cached_arrays(filename):
+    """Load the arrays of a ``.npz`` resampling cache entry, or None if there is none."""
+    try:
+        with np.load(filename) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+    except (OSError, ValueError, EOFError):
+        return None
+    _touch_cache_entry(filename)
+    return arrays
+
+
+def _save_cached_arrays(filename, arrays):
+    """Save *arrays* to a ``.npz`` resampling cache entry."""
+    LOG.info("Saving resampling lookup tables to %s", filename)
+    with _atomic_cache_entry(filename) as tmp_filename:
+        with open(tmp_filename, "wb") as fid:
+            np.savez(fid, **arrays)
+
+
+class DaskEWAResampler(PRDaskEWAResampler):
+    """Resample using elliptical weighted averaging.
+
+    In addition to :class:`pyresample.ewa.DaskEWAResampler`, this resampler
+    caches the column and row indices computed by ``ll2cr`` on disk when the
+    `cache_dir` argument is provided to the `resample` method.
+    """
+
+    def precompute(self, cache_dir=None, rows_per_scan=None, persist=False, **kwargs):
+        """Generate row and column arrays, or read them from `cache_dir`, and store them for later use."""
+        if self.cache or not cache_dir:
+            return super().precompute(rows_per_scan=rows_per_scan, persist=persist, **kwargs)
+        rows_per_scan = self._get_rows_per_scan(rows_per_scan)
+        hash_str = self.get_hash(rows_per_scan=rows_per_scan)
+        filename = os.path.join(cache_dir, "ewa_lut-" + hash_str + ".npz")
+        arrays = _load_cached_arrays(filename)
+        if arrays is None:
+            LOG.debug("Computing ll2cr results")
+            super().precompute(rows_per_scan=rows_per_scan, **kwargs)
+            arrays = _ll2cr_result_to_arrays(self.cache["ll2cr_result"])
+            _save_cached_arrays(filename, arrays)
+        else:
+            LOG.debug("Read pre-computed ll2cr results")
+        self.cache = _ll2cr_cache_from_arrays(arrays, "ll2cr-cached-" + hash_str)
+        return None
+
+
+def _ll2cr_result_to_arrays(ll2cr_result):
+    """Compute the blocks of *ll2cr_result* and collect the ones overlapping the target area."""
+    delayeds = ll2cr_result.to_delayed()
+    blocks = dask.compute(*delayeds.ravel().tolist())
+    arrays = {"row_chunks": np.array(ll2cr_result.chunks[0]),
+              "col_chunks": np.array(ll2cr_result.chunks[1]),
+              "dtype": np.array([], dtype=ll2cr_result.dtype)}
+    for block_idx, block in enumerate(blocks):
+        if isinstance(block, np.ndarray):
+            arrays["block_{}".format(block_idx)] = block
+    return arrays
+
+
+def _ll2cr_cache_from_arrays(arrays, name):
+    """Create the ll2cr cache of the EWA resampler from cached arrays."""
+    row_chunks = tuple(int(nrows) for nrows in arrays["row_chunks"])
+    col_chunks = tuple(int(ncols) for ncols in arrays["col_chunks"])
+    dtype = arrays["dtype"].dtype
+    dsk = {}
+    block_cache = {}
+    for row_idx, nrows in enumerate(row_chunks):
+        for col_idx, ncols in enumerate(col_chunks):
+            key = (name, row_idx, col_idx)
+            block = arrays.get("block_{}".format(row_idx * len(col_chunks) + col_idx))
+            if block is None:
+                dsk[key] = (_empty_ll2cr_block, (nrows, ncols), dtype)
+            else:
+                dsk[key] = block
+                block_cache[key] = key
+    ll2cr_result = da.Array(dsk, name, chunks=(row_chunks, col_chunks), dtype=dtype)
+    return {"ll2cr_result": ll2cr_result, "ll2cr_blocks": block_cache}
+
+
+def _empty_ll2cr_block(shape, dtype):
+    """Get the ll2cr result of a block not overlapping the target area."""
+    return (shape, np.nan, dtype), (shape, np.nan, dtype)
+
+
+class GradientSearchResampler(ResampleBlocksGradientSearchResampler):
+    """Resample using gradient search.
+
+    In addition to
+    :class:`pyresample.gradient.ResampleBlocksGradientSearchResampler`, this
+    resampler caches the source indices of the target pixels on disk when the
+    `cache_dir` argument is provided to the `resample` method.
+    """
+
+    def precompute(self, cache_dir=None, **kwargs):
+        """Precompute resampling parameters, or read them from `cache_dir`."""
+        if self.indices_xy is not None or not cache_dir:
+            return super().precompute(**kwargs)
+        filename = os.path.join(cache_dir, "gs_lut-" + self.get_hash() + ".npz")
+        arrays = _load_cached_arrays(filename)
+        if arrays is not None:
+            LOG.debug("Read pre-computed gradient search indices")
+            chunks = ((2, ), tuple(int(size) for size in arrays["y_chunks"]),
+                      tuple(int(size) for size in arrays["x_chunks"]))
+            self.indices_xy = da.from_array(arrays["indices_xy"], chunks=chunks)
+            return None
+        LOG.debug("Computing gradient search indices")
+        super().precompute(**kwargs)
+        indices_xy = self.indices_xy.compute()
+        _save_cached_arrays(filename, {"indices_xy": indices_xy,
+                                       "y_chunks": np.array(self.indices_xy.chunks[1]),
+                                       "x_chunks": np.array(self.indices_xy.chunks[2])})
+        self.indices_xy = da.from_array(indices_xy, chunks=self.indices_xy.chunks)
+        return None
+
+
+def create_gradient_search_resampler(source_geo_def, target_geo_def):
+    """Create a gradient search resampler."""
+    if (is_area_to_area(source_geo_def, target_geo_def) or
+            is_swath_to_area(source_geo_def, target_geo_def) or
+            is_area_to_swath(source_geo_def, target_geo_def)):
+        return GradientSearchResampler(source_geo_def, target_geo_def)
+    raise NotImplementedError
+
+
 def _mean(data, y_size, x_size):
     rows, cols = data.shape
     new_shape = (int(rows / y_size), int(y_size),
@@ -34,8 +34,13 @@ from satpy.dataset import DataID, DataQuery, DatasetDict, combine_metadata, data
 from satpy.dependency_tree import DependencyTree
 from satpy.node import CompositorNode, MissingDependencies, ReaderNode
 from satpy.readers import load_readers
-from satpy.resample import get_area_def, prepare_resampler, resample_dataset
-from satpy.utils import convert_remote_files_to_fsspec, get_storage_options_from_reader_kwargs
+from satpy.resample import get_area_def, get_area_slices, prepare_resampler, resample_dataset
+from satpy.utils import (
+    convert_remote_files_to_fsspec,
+    get_nbytes,
+    get_storage_options_from_reader_kwargs,
+    profile_step,
+)
 from satpy.writers import load_writer
 
 LOG = logging.getLogger(__name__)
@@ -60,6 +65,23 @@ def _aggregate_data_array(data_array, func, **coarsen_kwargs):
     return out
 
 
+def _get_ll_bbox_area(ll_bbox):
+    """Create a lon/lat area definition covering the *ll_bbox* extent."""
+    return AreaDefinition("crop_area", "crop_area", "crop_latlong",
+                          {"proj": "latlong"}, 100, 100, ll_bbox)
+
+
+def _get_region_of_interest(area, ll_bbox):
+    """Get the area definition of the region of interest to load, if any."""
+    if area is not None and ll_bbox is not None:
+        raise ValueError("Only one of 'area' or 'll_bbox' can be specified.")
+    if ll_bbox is not None:
+        return _get_ll_bbox_area(ll_bbox)
+    if isinstance(area, str):
+        return get_area_def(area)
+    return area
+
+
 class DelayedGeneration(KeyError):
     """Mark that a dataset can't be generated without further modification."""
 
@@ -130,6 +152,11 @@ class Scene:
                 sub-dictionaries to pass different arguments to different
                 reader instances.
 
+                Besides ``filter_parameters``, file based readers accept
+                ``fh_workers`` to create their file handlers on a pool of
+                threads of this size, see
+                :class:`~satpy.readers.yaml_reader.FileYAMLReader`.
+
                 Keyword arguments for remote file access are also given in this dictionary.
                 See `documentation <https://satpy.readthedocs.io/en/stable/remote_reading.html>`_
                 for usage examples.
@@ -616,15 +643,13 @@ class Scene:
                               xy_bbox=None):
         """Slice the provided area using the bounds provided."""
         if ll_bbox is not None:
-            dst_area = AreaDefinition(
-                "crop_area", "crop_area", "crop_latlong",
-                {"proj": "latlong"}, 100, 100, ll_bbox)
+            dst_area = _get_ll_bbox_area(ll_bbox)
         elif xy_bbox is not None:
             dst_area = AreaDefinition(
                 "crop_area", "crop_area", "crop_xy",
                 src_area.crs, src_area.width, src_area.height,
                 xy_bbox)
-        x_slice, y_slice = src_area.get_area_slices(dst_area)
+        x_slice, y_slice = get_area_slices(src_area, dst_area)
         return src_area[y_slice, x_slice], y_slice, x_slice
 
     def _slice_datasets(self, dataset_ids, slice_key, new_area, area_only=True):
@@ -893,7 +918,9 @@ class Scene:
             self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
             kwargs = resample_kwargs.copy()
             kwargs["resampler"] = resamplers[source_area]
-            res = resample_dataset(dataset, destination_area, **kwargs)
+            with profile_step("resample", ds_id) as step:
+                res = resample_dataset(dataset, destination_area, **kwargs)
+                step["nbytes"] = get_nbytes(res)
             new_datasets[ds_id] = res
             if ds_id in new_scn._datasets:
                 new_scn._datasets[ds_id] = res
@@ -930,12 +957,8 @@ class Scene:
                         factor = resample_kwargs.get("shape_divisible_by", 2)
                     else:
                         factor = None
-                    try:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area, shape_divisible_by=factor)
-                    except TypeError:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area)
+                    slice_x, slice_y = get_area_slices(
+                        source_area, destination_area, shape_divisible_by=factor)
                     source_area = source_area[slice_y, slice_x]
                     reductions[key] = (slice_x, slice_y), source_area
                 dataset = self._slice_data(source_area, (slice_x, slice_y), dataset)
@@ -1231,9 +1254,10 @@ class Scene:
         writer, save_kwargs = load_writer(writer,
                                           filename=filename,
                                           **kwargs)
-        return writer.save_dataset(self[dataset_id],
-                                   overlay=overlay, decorate=decorate,
-                                   compute=compute, **save_kwargs)
+        with profile_step("save", writer.name):
+            return writer.save_dataset(self[dataset_id],
+                                       overlay=overlay, decorate=decorate,
+                                       compute=compute, **save_kwargs)
 
     def save_datasets(self, writer=None, filename=None, datasets=None, compute=True,
                       **kwargs):
@@ -1293,7 +1317,8 @@ class Scene:
         writer, save_kwargs = load_writer(writer,
                                           filename=filename,
                                           **kwargs)
-        return writer.save_datasets(dataarrays, compute=compute, **save_kwargs)
+        with profile_step("save", writer.name):
+            return writer.save_datasets(dataarrays, compute=compute, **save_kwargs)
 
     def compute(self, **kwargs):
         """Call `compute` on all Scene data arrays.
@@ -1399,7 +1424,7 @@ class Scene:
 
     def load(self, wishlist, calibration="*", resolution="*",  # noqa: D417
              polarization="*", level="*", modifiers="*", generate=True, unload=True,
-             **kwargs):
+             area=None, ll_bbox=None, **kwargs):
         """Read and generate requested datasets.
 
         When the `wishlist` contains `DataQuery` objects they can either be
@@ -1438,6 +1463,13 @@ class Scene:
             unload (bool): Unload datasets that were required to generate the
                 requested datasets (composite dependencies) but are no longer
                 needed.
+            area (AreaDefinition | str): Region of interest to crop the loaded
+                datasets to, before generating composites. Readers don't read
+                the files and segments without data in this region. Datasets
+                on swath geometries are not cropped. See :meth:`crop`.
+            ll_bbox (tuple, list): Region of interest as a
+                ``(xmin, ymin, xmax, ymax)`` bounding box in lon/lat degrees,
+                instead of ``area``.
 
         """
         if isinstance(wishlist, str):
@@ -1453,10 +1485,27 @@ class Scene:
 
         self._wishlist |= needed_datasets
 
-        self._read_datasets_from_storage(**kwargs)
+        roi = _get_region_of_interest(area, ll_bbox)
+        if roi is not None:
+            kwargs["roi"] = roi
+        loaded_datasets = self._read_datasets_from_storage(**kwargs)
+        if roi is not None:
+            self._crop_to_region_of_interest(loaded_datasets, roi)
         if generate:
             self.generate_possible_composites(unload)
 
+    def _crop_to_region_of_interest(self, datasets, roi):
+        """Crop the *datasets* on area definitions in place, per projection."""
+        dataset_ids_by_crs = {}
+        for ds_id, ds in datasets.items():
+            area = ds.attrs.get("area")
+            if isinstance(area, AreaDefinition):
+                dataset_ids_by_crs.setdefault(area.crs, []).append(ds_id)
+        for dataset_ids in dataset_ids_by_crs.values():
+            cropped_scn = self.crop(area=roi, dataset_ids=dataset_ids)
+            for ds_id in dataset_ids:
+                self._datasets[ds_id] = cropped_scn[ds_id]
+
     def _update_dependency_tree(self, needed_datasets, query):
         try:
             comps, mods = load_compositor_configs_for_sensors(self.sensor_names)
@@ -1601,9 +1650,11 @@ class Scene:
             return
 
         try:
-            composite = compositor(prereq_datasets,
-                                   optional_datasets=optional_datasets,
-                                   **comp_node.name.to_dict())
+            with profile_step("composite", comp_node.name) as step:
+                composite = compositor(prereq_datasets,
+                                       optional_datasets=optional_datasets,
+                                       **comp_node.name.to_dict())
+                step["nbytes"] = get_nbytes(composite)
             cid = DataID.new_id_from_dataarray(composite)
             self._datasets[cid] = composite
 
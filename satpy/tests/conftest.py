@@ -47,7 +47,9 @@ def _reset_satpy_config(tmpdir):
 def _clear_function_caches():
     """Clear out global function-level caches that may cause conflicts between tests."""
     from satpy.composites.config_loader import load_compositor_configs_for_sensor
+    from satpy.resample import _get_cached_area_slices
     load_compositor_configs_for_sensor.cache_clear()
+    _get_cached_area_slices.cache_clear()
 
 
 @pytest.fixture
@@ -358,6 +358,36 @@ class TestAngleGeneration:
                 satpy.config.set(cache_lonlats=True, cache_sensor_angles=True, cache_dir=None):
             _get_sensor_angles_from_sat_pos.cache_clear()
 
+    def test_swath_angles_computed_once(self):
+        """Test that the angles of a swath are only computed once."""
+        import gc
+
+        from pyresample.geometry import SwathDefinition
+
+        from satpy.modifiers.angles import _get_valid_lonlats, get_angles, get_cos_sza
+        lons = xr.DataArray(da.linspace(-5, 5, 25, chunks=5).reshape((5, 5)), dims=("y", "x"))
+        lats = xr.DataArray(da.linspace(40, 50, 25, chunks=5).reshape((5, 5)), dims=("y", "x"))
+        data = _get_angle_test_data(area_def=SwathDefinition(lons, lats))
+        other_data = data.copy(deep=False)
+        other_data.attrs["start_time"] = data.attrs["start_time"] + dt.timedelta(minutes=5)
+
+        with mock.patch.object(SwathDefinition, "get_lonlats", autospec=True,
+                               side_effect=SwathDefinition.get_lonlats) as get_lonlats:
+            angles = get_angles(data)
+            angles2 = get_angles(data.copy(deep=False))
+            assert all(angle is angle2 or angle.data is angle2.data for angle, angle2 in zip(angles, angles2))
+            other_angles = get_angles(other_data)
+            get_cos_sza(data)
+        assert get_lonlats.call_count == 1
+        assert other_angles[3].data is not angles[3].data
+        np.testing.assert_allclose(angles[3], get_angles(_get_angle_test_data(
+            area_def=SwathDefinition(lons.copy(), lats.copy())))[3])
+
+        assert len(_get_valid_lonlats._caches) == 1
+        del data, other_data, get_lonlats
+        gc.collect()
+        assert len(_get_valid_lonlats._caches) == 0
+
     def test_relative_azimuth_calculation(self):
         """Test relative azimuth calculation."""
         from satpy.modifiers.angles import compute_relative_azimuth
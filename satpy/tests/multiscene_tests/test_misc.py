@@ -18,6 +18,7 @@
 
 """Unit tests for the Multiscene object."""
 
+import time
 import unittest
 from unittest import mock
 
@@ -201,3 +202,71 @@ class TestMultiSceneGrouping:
         multi_scene.group(groups)
         with pytest.raises(ValueError, match="Cannot add multiple datasets from a scene to the same group"):
             next(multi_scene.scenes)
+
+
+class TestStreamingMultiScene:
+    """Test the streaming mode of the MultiScene."""
+
+    @staticmethod
+    def _scene_gen(scenes, created):
+        for scn in scenes:
+            created.append(scn)
+            yield scn
+
+    def test_scenes_not_kept(self):
+        """Test that a streaming MultiScene only keeps its first scene."""
+        from satpy import MultiScene
+        scenes = _create_test_scenes(num_scenes=4)
+        mscn = MultiScene(iter(scenes), streaming=True)
+        assert mscn.first_scene is scenes[0]
+        assert list(mscn) == scenes
+        assert mscn._scene_gen._scene_cache == [scenes[0]]
+
+    def test_scenes_iterated_once(self):
+        """Test that the scenes of a streaming MultiScene can't be iterated over twice."""
+        from satpy import MultiScene
+        mscn = MultiScene(iter(_create_test_scenes(num_scenes=3)), streaming=True)
+        with pytest.raises(RuntimeError, match="streaming"):
+            mscn.scenes
+        list(mscn)
+        with pytest.raises(RuntimeError, match="only be iterated over once"):
+            list(mscn._scene_gen)
+
+    def test_save_datasets_prefetches_scenes(self):
+        """Test that the next scene is created while the current one is saved."""
+        from satpy import MultiScene
+        scenes = _create_test_scenes(num_scenes=4, area=_create_test_area())
+        created = []
+        created_when_saving = []
+        mscn = MultiScene(self._scene_gen(scenes, created), streaming=True, prefetch=1)
+        new_mscn = mscn.crop(xy_bbox=(-1e6, -1e6, 1e6, 1e6))
+        assert new_mscn._streaming
+        def _save_datasets(**kwargs):
+            # give the background thread some time to create the next scene
+            expected = min(len(created_when_saving) + 2, len(scenes))
+            for _ in range(100):
+                if len(created) >= expected:
+                    break
+                time.sleep(0.05)
+            created_when_saving.append(len(created))
+
+        with mock.patch("satpy.multiscene._multiscene.Scene.save_datasets") as save_datasets:
+            save_datasets.side_effect = _save_datasets
+            new_mscn.save_datasets(client=False, writer="simple_image")
+        assert save_datasets.call_count == 4
+        # the scene after the one being saved is already created, maybe along with the one after that
+        for idx, nb_created in enumerate(created_when_saving):
+            assert min(idx + 2, 4) <= nb_created <= idx + 3
+
+    def test_prefetch_errors_are_raised(self):
+        """Test that errors raised in the prefetching thread are raised when iterating."""
+        from satpy.multiscene._multiscene import _prefetch
+
+        def _failing_gen():
+            yield 1
+            raise ValueError("bad scene")
+
+        prefetched = _prefetch(_failing_gen(), 2)
+        assert next(prefetched) == 1
+        with pytest.raises(ValueError, match="bad scene"):
+            next(prefetched)
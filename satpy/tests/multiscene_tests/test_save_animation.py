@@ -371,3 +371,36 @@ def test_save_mp4(smg, tmp_path):
     assert writer_mock.append_data.call_count == 2 + 2
     assert ("2018-01-02" in smg.call_args_list[-1][1]
             ["decorate"]["decorate"][0]["text"]["txt"])
+
+
+@mock.patch("satpy.multiscene._multiscene.get_enhanced_image", _fake_get_enhanced_image)
+def test_save_mp4_streaming(tmp_path):
+    """Save the scenes of a streaming MultiScene to mp4 videos."""
+    from satpy import MultiScene
+    area = _create_test_area()
+    scenes = _create_test_scenes(num_scenes=3, area=area)
+    for idx, scn in enumerate(scenes):
+        for ds_id in ["ds1", "ds2"]:
+            scn[ds_id].attrs["start_time"] = dt.datetime(2018, 1, 1 + idx)
+
+    mscn = MultiScene(iter(scenes), streaming=True)
+    fn = str(tmp_path / "test_save_mp4_{name}_{start_time:%Y%m%d_%H}.mp4")
+    writer_mock = mock.MagicMock()
+    with mock.patch("satpy.multiscene._multiscene.imageio") as imageio_mock:
+        imageio_mock.get_writer.return_value = writer_mock
+        mscn.save_animation(fn, datasets=["ds1", "ds2"], client=False)
+
+    # 3 frames for each dataset
+    assert writer_mock.append_data.call_count == 3 + 3
+    assert mscn._scene_gen._scene_cache == [scenes[0]]
+
+
+def test_save_mp4_streaming_end_time_in_filename(tmp_path):
+    """Test that the end time can't be used in the filename when streaming."""
+    from satpy import MultiScene
+    scenes = _create_test_scenes(num_scenes=3, area=_create_test_area())
+    mscn = MultiScene(iter(scenes), streaming=True)
+    fn = str(tmp_path / "test_save_mp4_{name}_{end_time:%Y%m%d_%H}.mp4")
+    with mock.patch("satpy.multiscene._multiscene.imageio"), \
+            pytest.raises(ValueError, match="can't contain 'end_time'"):
+        mscn.save_animation(fn, datasets=["ds1"], client=False)
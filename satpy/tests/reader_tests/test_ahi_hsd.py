@@ -384,6 +384,23 @@ class TestAHIHSDFileHandler:
             assert data.dtype == data.compute().dtype
             assert data.dtype == np.float32
 
+    def test_read_band_with_cached_metadata(self, hsd_file_jp01, tmp_path):
+        """Test that the headers are not read again when the file metadata are cached."""
+        import satpy
+        filename_info = {"segment": 1, "total_segments": 1}
+        filetype_info = {"file_type": "blahB01"}
+        key = {"name": "B01", "calibration": "counts", "resolution": 1000}
+        ds_info = {"units": "%", "standard_name": "toa_bidirectional_reflectance",
+                   "wavelength": 2, "resolution": 1000}
+        with satpy.config.set(cache_dir=tmp_path, cache_file_metadata=True), warnings.catch_warnings():
+            # The header isn't valid
+            warnings.filterwarnings("ignore", category=UserWarning, message=r"Actual .* header size")
+            expected = AHIHSDFileHandler(hsd_file_jp01, filename_info, filetype_info).read_band(key, ds_info)
+            with mock.patch("satpy.readers.ahi_hsd.open", side_effect=OSError, create=True):
+                fh = AHIHSDFileHandler(hsd_file_jp01, filename_info, filetype_info)
+                data = fh.read_band(key, ds_info)
+        np.testing.assert_array_equal(data.compute(), expected.compute())
+
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler._read_data")
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler._mask_invalid")
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler.calibrate")
@@ -462,7 +479,9 @@ class TestAHICalibration(unittest.TestCase):
             "block5": {"band_number": [5],
                        "gain_count2rad_conversion": [self.def_cali[0]],
                        "offset_count2rad_conversion": [self.def_cali[1]],
-                       "central_wave_length": [10.4073], },
+                       "central_wave_length": [10.4073],
+                       "count_value_error_pixels": [65535],
+                       "count_value_outside_scan_pixels": [65534], },
             "calibration": {"coeff_rad2albedo_conversion": [0.0019255],
                             "speed_of_light": [299792458.0],
                             "planck_constant": [6.62606957e-34],
@@ -519,7 +538,9 @@ class TestAHICalibration(unittest.TestCase):
             "block5": {"band_number": [5],
                        "gain_count2rad_conversion": [self.def_cali[0]],
                        "offset_count2rad_conversion": [self.def_cali[1]],
-                       "central_wave_length": [10.4073], },
+                       "central_wave_length": [10.4073],
+                       "count_value_error_pixels": [65535],
+                       "count_value_outside_scan_pixels": [65534], },
             "calibration": {"coeff_rad2albedo_conversion": [0.0019255],
                             "speed_of_light": [299792458.0],
                             "planck_constant": [6.62606957e-34],
@@ -151,6 +151,23 @@ class TestHDF5FileHandler(unittest.TestCase):
 
         assert isinstance(file_handler["ds2_f/attr/test_ref"], np.ndarray)
 
+    def test_pooled_file(self):
+        """Test reading the datasets through the pool of open files."""
+        import satpy
+        from satpy.readers.hdf5_utils import HDF5FileHandler
+        from satpy.readers.utils import FILE_HANDLE_POOL
+        try:
+            with satpy.config.set({"readers.max_open_files": 1}):
+                file_handler = HDF5FileHandler("test.h5", {}, {})
+                assert len(FILE_HANDLE_POOL) == 1
+                data = file_handler["test_group/ds1_i"]
+                FILE_HANDLE_POOL.clear()
+                assert data.attrs["test_attr_str"] == "test_string"
+                np.testing.assert_array_equal(data, np.arange(10 * 100).reshape((10, 100)))
+                assert len(FILE_HANDLE_POOL) == 1
+        finally:
+            FILE_HANDLE_POOL.clear()
+
     def test_array_name_uniqueness(self):
         """Test the dask array generated from an hdf5 dataset stay constant and unique."""
         from satpy.readers.hdf5_utils import HDF5FileHandler
@@ -28,6 +28,7 @@ import pytest
 
 from satpy.readers import FSFile
 from satpy.readers.hrit_base import HRITFileHandler
+from satpy.readers.seviri_base import dec10216
 from satpy.tests.utils import RANDOM_GEN
 
 # NOTE:
@@ -209,6 +210,27 @@ class TestHRITFileHandler:
         res = self.reader.read_band("VIS006", None)
         assert res.compute().shape == (464, 3712)
 
+    def test_read_band_bzipped2_filepath_in_memory(self, stub_bzipped_hrit_file):
+        """Test that bzipped files are decompressed without temporary files."""
+        self.reader.filename = stub_bzipped_hrit_file
+        with bz2.open(stub_bzipped_hrit_file) as fd:
+            expected = np.frombuffer(fd.read(), dtype=np.uint8, offset=mda["total_header_length"])
+
+        with mock.patch("satpy.readers.utils.unzip_file", side_effect=AssertionError), \
+                mock.patch("tempfile.mkstemp", side_effect=AssertionError):
+            res = self.reader.read_band("VIS006", None).compute()
+        np.testing.assert_array_equal(res, dec10216(expected).reshape((464, 3712)))
+
+    def test_read_band_truncated_file(self, tmp_path):
+        """Test that reading a truncated file fails."""
+        filename = tmp_path / "some_hrit_file"
+        with open(filename, mode="wb") as fd:
+            fd.write(create_stub_hrit_data(mda)[:-10])
+        self.reader.filename = filename
+
+        with pytest.raises(ValueError, match="Expected 2152960 bytes of data"):
+            self.reader.read_band("VIS006", None).compute()
+
     def test_read_band_gzip_stream(self, stub_gzipped_hrit_file):
         """Test reading a single band from a gzip stream."""
         import fsspec
@@ -255,3 +277,24 @@ class TestHRITFileHandlerCompressed:
                 assert mock_decompress.call_count == 0
                 assert res.compute().shape == (464, 3712)
                 assert mock_decompress.call_count == 1
+
+    def test_read_band_bzipped2_filepath(self, tmp_path):
+        """Test reading a single band from a compressed and bzipped file."""
+        filename = tmp_path / "some_hrit_file.C_.bz2"
+        create_stub_hrit(filename, open_fun=bz2.open, meta=mda_compressed)
+
+        with mock.patch("satpy.readers.hrit_base.decompress_buffer", side_effect=fake_decompress) as mock_decompress:
+            with mock.patch.object(HRITFileHandler, "_get_hd", side_effect=new_get_hd_compressed,
+                                   autospec=True):
+                self.reader = HRITFileHandler(filename,
+                                              {"platform_shortname": "MSG3",
+                                               "start_time": dt.datetime(2016, 3, 3, 0, 0)},
+                                              {"filetype": "info"},
+                                              [mock.MagicMock(), mock.MagicMock(),
+                                               mock.MagicMock()])
+
+                res = self.reader.read_band("VIS006", None)
+                assert res.compute().shape == (464, 3712)
+                assert mock_decompress.call_count == 1
+                with bz2.open(filename) as fd:
+                    assert mock_decompress.call_args[0][0] == fd.read()
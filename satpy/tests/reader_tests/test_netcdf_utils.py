@@ -18,7 +18,10 @@
 """Module for testing the satpy.readers.netcdf_utils module."""
 
 import os
+import shutil
 import unittest
+from tempfile import mkdtemp
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -229,6 +232,52 @@ class TestNetCDF4FileHandler(unittest.TestCase):
         h.__del__()
         assert not h.file_handle.isopen()
 
+    def test_caching_handle_in_pool(self):
+        """Test that cached handles are kept in the pool of open files when configured."""
+        import satpy
+        from satpy.readers.netcdf_utils import NetCDF4FileHandler, VariablePlaceholder
+        from satpy.readers.utils import FILE_HANDLE_POOL
+        shutil.copy("test.nc", "test2.nc")
+        try:
+            with satpy.config.set({"readers.max_open_files": 1}):
+                handlers = [NetCDF4FileHandler(filename, {}, {}, cache_handle=True)
+                            for filename in ("test.nc", "test2.nc")]
+                assert len(FILE_HANDLE_POOL) == 1
+                for h in handlers + handlers:
+                    assert h.file_handle is None
+                    assert isinstance(h.file_content["test_group/ds1_i"], VariablePlaceholder)
+                    data = h["test_group/ds1_i"]
+                    assert data.dims == ("rows", "cols")
+                    assert data.attrs["test_attr_str"] == "test_string"
+                    np.testing.assert_array_equal(data, np.arange(10 * 100).reshape((10, 100)))
+                    np.testing.assert_array_equal(h.get_and_cache_npxr("ds2_s"), np.arange(10))
+                    assert len(FILE_HANDLE_POOL) == 1
+        finally:
+            FILE_HANDLE_POOL.clear()
+            os.remove("test2.nc")
+
+    def test_file_metadata_caching(self):
+        """Test that the file content is cached on disk when configured."""
+        import satpy
+        from satpy.readers.netcdf_utils import NetCDF4FileHandler, VariablePlaceholder
+        cache_dir = mkdtemp()
+        try:
+            with satpy.config.set(cache_dir=cache_dir, cache_file_metadata=True):
+                NetCDF4FileHandler("test.nc", {}, {})
+                with mock.patch("satpy.readers.netcdf_utils.netCDF4.Dataset") as dataset:
+                    file_handler = NetCDF4FileHandler("test.nc", {}, {})
+                dataset.assert_not_called()
+        finally:
+            shutil.rmtree(cache_dir)
+
+        assert isinstance(file_handler.file_content["test_group/ds1_f"], VariablePlaceholder)
+        assert file_handler["/attr/test_attr_str"] == "test_string"
+        assert file_handler["ds2_f/attr/test_attr_float"] == 1.2
+        assert file_handler["test_group/ds1_i/shape"] == (10, 100)
+        np.testing.assert_array_equal(file_handler["test_group/ds1_i"],
+                                      np.arange(10 * 100).reshape((10, 100)))
+        np.testing.assert_array_equal(file_handler.get_and_cache_npxr("ds2_s"), np.arange(10))
+
     def test_filenotfound(self):
         """Test that error is raised when file not found."""
         from satpy.readers.netcdf_utils import NetCDF4FileHandler
@@ -22,6 +22,7 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+import dask.array as da
 import numpy as np
 import pytest
 import yaml
@@ -839,6 +840,24 @@ class TestSAFEXMLCalibration:
         assert res == 1
 
 
+@pytest.mark.parametrize("chunks", [3, (4, 7)])
+def test_interpolate_rectilinear_tie_points(chunks):
+  """Test that tie points on a grid are interpolated bilinearly, and are NaN outside of the grid."""
+  from satpy.readers.sar_c_safe import interpolate_xarray_linear
+  pixels, lines = np.meshgrid([0, 4, 5, 11], [-2, 3, 9])
+
+  def func(x, y):
+    return 2 * x - 3 * y + 0.5 * x * y + 1
+
+  res = interpolate_xarray_linear(pixels.ravel()[::-1], lines.ravel()[::-1], func(pixels, lines).ravel()[::-1],
+                                  (12, 14), chunks=chunks)
+  assert res.dims == ("y", "x")
+  assert res.chunks == da.zeros((12, 14), chunks=chunks).chunks
+  x, y = np.meshgrid(np.arange(14), np.arange(12))
+  expected = np.where((x <= 11) & (y <= 9), func(x, y), np.nan)
+  np.testing.assert_allclose(res, expected)
+
+
 def test_incidence_angle(annotation_filehandler):
   """Test reading the incidence angle in an annotation file."""
   query = DataQuery(name="incidence_angle", polarization="vv")
@@ -846,6 +865,13 @@ def test_incidence_angle(annotation_filehandler):
   np.testing.assert_allclose(res, 19.18318046)
 
 
+def test_annotation_keeps_only_needed_elements(annotation_filehandler):
+  """Test that only the needed elements of the annotation file are kept in memory."""
+  assert {elt.tag for elt in annotation_filehandler.root} == {"imageInformation", "geolocationGridPoint"}
+  assert annotation_filehandler.image_shape == (10, 10)
+  assert annotation_filehandler.hdr["product"]["imageAnnotation"]["imageInformation"]["numberOfLines"] == 10
+
+
 def test_reading_from_reader(measurement_file, calibration_file, noise_file, annotation_file):
   """Test reading using the reader defined in the config."""
   with open(Path(PACKAGE_CONFIG_PATH) / "readers" / "sar-c_safe.yaml") as fd:
@@ -65,6 +65,35 @@ class SeviriBaseTest(unittest.TestCase):
         exp = np.array([4,  16,  64, 257], dtype=np.uint16)
         np.testing.assert_equal(res, exp)
 
+    def test_dec10216_trailing_bytes(self):
+        """Test that incomplete groups of bytes are ignored by dec10216."""
+        res = dec10216(np.array([1, 1, 1, 1, 1, 255, 255], dtype=np.uint8))
+        np.testing.assert_equal(res, np.array([4, 16, 64, 257], dtype=np.uint16))
+
+    def test_dec10216_2d(self):
+        """Test that dec10216 unpacks 2D arrays line by line."""
+        packed = np.array([[255] * 5 + [1] * 5,
+                           [1] * 5 + [255] * 5], dtype=np.uint8)
+        res = dec10216(packed)
+        exp = np.array([[1023] * 4 + [4, 16, 64, 257],
+                        [4, 16, 64, 257] + [1023] * 4], dtype=np.uint16)
+        np.testing.assert_equal(res, exp)
+
+    def test_dec10216_dask(self):
+        """Test that dec10216 unpacks dask arrays lazily, whatever their chunks."""
+        packed = np.random.default_rng(42).integers(0, 256, size=(12, 40), dtype=np.uint8)
+        expected = dec10216(packed.ravel())
+
+        res = dec10216(da.from_array(packed.ravel(), chunks=37))
+        assert isinstance(res, da.Array)
+        assert all(chunk % 4 == 0 for chunk in res.chunks[0])
+        np.testing.assert_equal(res.compute(), expected)
+
+        res = dec10216(da.from_array(packed, chunks=(5, 7)))
+        assert isinstance(res, da.Array)
+        assert res.chunks == ((5, 5, 2), (32,))
+        np.testing.assert_equal(res.compute(), expected.reshape((12, 32)))
+
     def test_chebyshev(self):
         """Test the chebyshev function."""
         coefs = [1, 2, 3, 4]
@@ -20,6 +20,7 @@
 import datetime as dt
 import unittest
 
+import dask.array as da
 import numpy as np
 import pytest
 import xarray as xr
@@ -201,6 +202,17 @@ class TestSeviriCalibrationHandler:
         coefs = calib.get_gain_offset()
         assert coefs == expected
 
+    @pytest.mark.parametrize("calibration", ["radiance", "brightness_temperature"])
+    def test_calibrate_integer_counts(self, calibration):
+        """Test that integer counts calibrated through a lookup table match float counts."""
+        calib = self._get_calibration_handler()
+        counts = xr.DataArray(da.from_array(np.array([[0, 10], [100, 1023]], dtype=np.uint16), chunks=1),
+                              dims=("y", "x"))
+        res = calib.calibrate(counts, calibration)
+        expected = calib.calibrate(counts.astype(np.float32), calibration)
+        assert res.chunks == counts.chunks
+        np.testing.assert_allclose(res.values, expected.values, rtol=1e-6)
+
 
 class TestFileHandlerCalibrationBase:
     """Base class for file handler calibration tests."""
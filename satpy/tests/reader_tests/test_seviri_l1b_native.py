@@ -36,8 +36,10 @@ from satpy.readers.eum_base import recarray2dict, time_cds_short
 from satpy.readers.seviri_l1b_native import (
     ASCII_STARTSWITH,
     ImageBoundaries,
+    MemmappedRecords,
     NativeMSGFileHandler,
     Padder,
+    _can_be_memory_mapped,
     get_available_channels,
     has_archive_header,
 )
@@ -1406,3 +1408,41 @@ def append_data_and_trailer_content_to_seviri_native_header(filename, hdr_null_n
     hdr_null_numpy.tofile(filename)
     with open(filename, "ab") as f:
         f.write(bytes_data)
+
+
+def test_memmapped_records(tmp_path):
+    """Test that memory-mapped records are sliced and pickled correctly."""
+    import pickle
+
+    dtype = np.dtype([("a", "<u2"), ("b", "u1", (3,))])
+    records = np.zeros(10, dtype=dtype)
+    records["a"] = np.arange(10)
+    filename = tmp_path / "records.bin"
+    with open(filename, "wb") as fh:
+        fh.write(b"\0" * 7)
+        fh.write(records.tobytes())
+
+    data = MemmappedRecords(filename, dtype, 7, (10,))
+    np.testing.assert_array_equal(data[2:5]["a"], [2, 3, 4])
+
+    restored = pickle.loads(pickle.dumps(data))
+    assert restored._memmap is None
+    np.testing.assert_array_equal(da.from_array(restored, chunks=4)["a"].compute(), np.arange(10))
+
+
+@pytest.mark.parametrize(("filename", "expected"), [
+    ("file.nat", True),
+    ("file.nat.bz2", False),
+    (None, False),
+])
+def test_can_be_memory_mapped(filename, expected):
+    """Test which files are memory-mapped."""
+    assert _can_be_memory_mapped(filename) is expected
+
+
+def test_physical_seviri_nat_file_is_memory_mapped(tmp_seviri_nat_filename):
+    """Test that the data of a local file are memory-mapped."""
+    scene = scene_from_physical_seviri_nat_file(tmp_seviri_nat_filename)
+    file_handler = scene._readers["seviri_l1b_native"].file_handlers["native_msg"][0]
+    assert any(isinstance(value, MemmappedRecords)
+               for value in file_handler._dask_array.dask.values())
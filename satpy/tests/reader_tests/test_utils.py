@@ -514,6 +514,271 @@ def test_generic_open_binary(tmp_path, data, filename, mode):
     assert read_binary_data == dummy_data
 
 
+class TestCachedFileMetadata:
+    """Test the on-disk cache of file metadata."""
+
+    def setup_method(self):
+        """Prepare a function counting its calls."""
+        self.calls = []
+
+    def _read_metadata(self, filename):
+        self.calls.append(filename)
+        with open(filename, "rb") as fd:
+            return {"header": fd.read()}
+
+    def test_not_cached_by_default(self, tmp_path):
+        """Test that metadata are read every time when caching is not configured."""
+        filename = tmp_path / "file.dat"
+        filename.write_bytes(b"header")
+        for _ in range(2):
+            res = hf.cached_file_metadata(filename, self._read_metadata, filename)
+        assert res == {"header": b"header"}
+        assert len(self.calls) == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_cached(self, tmp_path):
+        """Test that metadata are read only once when caching is configured."""
+        import satpy
+        filename = tmp_path / "file.dat"
+        filename.write_bytes(b"header")
+        with satpy.config.set(cache_dir=tmp_path / "cache", cache_file_metadata=True):
+            for _ in range(2):
+                res = hf.cached_file_metadata(filename, self._read_metadata, filename)
+        assert res == {"header": b"header"}
+        assert len(self.calls) == 1
+        assert len(list((tmp_path / "cache" / "file_metadata").glob("*.pkl"))) == 1
+
+    def test_cache_invalidated_by_modified_file(self, tmp_path):
+        """Test that a modified file is read again."""
+        import satpy
+        filename = tmp_path / "file.dat"
+        filename.write_bytes(b"header")
+        with satpy.config.set(cache_dir=tmp_path / "cache", cache_file_metadata=True):
+            hf.cached_file_metadata(filename, self._read_metadata, filename)
+            filename.write_bytes(b"new header")
+            res = hf.cached_file_metadata(filename, self._read_metadata, filename)
+        assert res == {"header": b"new header"}
+        assert len(self.calls) == 2
+
+    def test_to_cache(self, tmp_path):
+        """Test that the converted metadata are returned from the cache."""
+        import satpy
+        filename = tmp_path / "file.dat"
+        filename.write_bytes(b"header")
+        with satpy.config.set(cache_dir=tmp_path / "cache", cache_file_metadata=True):
+            first = hf.cached_file_metadata(filename, self._read_metadata, filename, to_cache=len)
+            second = hf.cached_file_metadata(filename, self._read_metadata, filename, to_cache=len)
+        assert first == {"header": b"header"}
+        assert second == 1
+
+    def test_remote_file_not_cached(self, tmp_path):
+        """Test that files not available locally are not cached."""
+        import satpy
+        with satpy.config.set(cache_dir=tmp_path / "cache", cache_file_metadata=True):
+            for _ in range(2):
+                hf.cached_file_metadata("s3://bucket/file.dat", self.calls.append, "s3://bucket/file.dat")
+        assert len(self.calls) == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        """Test that the least recently used entries are removed when the cache is full."""
+        import satpy
+        filenames = []
+        for idx in range(3):
+            filename = tmp_path / f"file{idx}.dat"
+            filename.write_bytes(b"x" * 1000)
+            filenames.append(filename)
+        cache_dir = tmp_path / "cache"
+        with satpy.config.set(cache_dir=cache_dir, cache_file_metadata=True,
+                              cache_file_metadata_max_size=2500):
+            hf.cached_file_metadata(filenames[0], self._read_metadata, filenames[0])
+            hf.cached_file_metadata(filenames[1], self._read_metadata, filenames[1])
+            entries = sorted((cache_dir / "file_metadata").glob("*.pkl"), key=os.path.getmtime)
+            # make sure the first file is the most recently used one
+            os.utime(entries[1], ns=(0, 0))
+            hf.cached_file_metadata(filenames[0], self._read_metadata, filenames[0])
+            hf.cached_file_metadata(filenames[2], self._read_metadata, filenames[2])
+            assert len(list((cache_dir / "file_metadata").glob("*.pkl"))) == 2
+            hf.cached_file_metadata(filenames[0], self._read_metadata, filenames[0])
+            hf.cached_file_metadata(filenames[1], self._read_metadata, filenames[1])
+        assert self.calls == [filenames[0], filenames[1], filenames[2], filenames[1]]
+
+
+class TestCalibrateWithLUT:
+    """Test calibrating integer counts through lookup tables."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_luts(self):
+        hf._calibration_luts.clear()
+        yield
+        hf._calibration_luts.clear()
+
+    def setup_method(self):
+        """Reset the calls of the fake calibration."""
+        self.calls = 0
+
+    def _calibrate(self, data):
+        self.calls += 1
+        res = np.log(data.where(data > 0).astype(np.float32)) * np.float32(2.0)
+        res.attrs["units"] = "K"
+        return res
+
+    def _counts(self, dtype=np.uint16):
+        counts = np.array([[0, 1, 2, 1023], [5, 65535, 400, 7]]).astype(dtype)
+        return xr.DataArray(da.from_array(counts, chunks=1), dims=("y", "x"),
+                            coords={"y": [1, 2]}, attrs={"name": "ch1"})
+
+    def test_same_as_direct_calibration(self):
+        """Test that the table gives the same result as calibrating every pixel."""
+        counts = self._counts()
+        res = hf.calibrate_with_lut(counts, self._calibrate, key="ch1")
+        expected = self._calibrate(counts)
+
+        assert isinstance(res.data, da.Array)
+        assert res.chunks == counts.chunks
+        assert res.dtype == expected.dtype
+        np.testing.assert_array_equal(res.values, expected.values)
+        assert res.attrs == {"name": "ch1", "units": "K"}
+        np.testing.assert_array_equal(res["y"], [1, 2])
+
+    def test_signed_counts(self):
+        """Test calibrating signed integer counts."""
+        counts = self._counts(np.int16) - 10
+        res = hf.calibrate_with_lut(counts, lambda data: data * 2.0)
+        np.testing.assert_array_equal(res.values, counts.values * 2.0)
+
+    def test_dask_array(self):
+        """Test calibrating plain dask arrays."""
+        counts = self._counts().data
+        res = hf.calibrate_with_lut(counts, lambda data: da.where(data == 0, np.nan, data * np.float32(0.5)))
+        assert isinstance(res, da.Array)
+        np.testing.assert_array_equal(res.compute(), np.where(counts == 0, np.nan, counts * np.float32(0.5)))
+
+    def test_non_integer_data_is_calibrated_directly(self):
+        """Test that float data is passed to the calibration function."""
+        counts = self._counts().astype(np.float32)
+        res = hf.calibrate_with_lut(counts, self._calibrate, key="ch1")
+        np.testing.assert_array_equal(res.values, self._calibrate(counts).values)
+        assert not hf._calibration_luts
+
+    def test_table_is_cached(self):
+        """Test that tables are only built once for the same key."""
+        hf.calibrate_with_lut(self._counts(), self._calibrate, key="ch1")
+        hf.calibrate_with_lut(self._counts(), self._calibrate, key="ch1")
+        assert self.calls == 1
+        hf.calibrate_with_lut(self._counts(), self._calibrate, key="ch2")
+        assert self.calls == 2
+
+    @pytest.mark.parametrize("key", [None, ["unhashable"]])
+    def test_table_is_not_cached(self, key):
+        """Test that tables without a usable key are built for every call."""
+        hf.calibrate_with_lut(self._counts(), self._calibrate, key=key)
+        hf.calibrate_with_lut(self._counts(), self._calibrate, key=key)
+        assert self.calls == 2
+        assert not hf._calibration_luts
+
+    def test_cache_size(self, monkeypatch):
+        """Test that the least recently used tables are dropped."""
+        monkeypatch.setattr(hf, "CALIBRATION_LUT_CACHE_SIZE", 2)
+        for key in ["ch1", "ch2", "ch1", "ch3"]:
+            hf.calibrate_with_lut(self._counts(), self._calibrate, key=key)
+        assert [cache_key[0] for cache_key in hf._calibration_luts] == ["ch1", "ch3"]
+
+
+def _open_fake_file(filename, mode="r"):
+    handle = mock.MagicMock(name=filename)
+    handle.__getitem__.return_value = np.arange(10)
+    return handle
+
+
+class TestFileHandlePool:
+    """Test the pool of open file handles."""
+
+    def setup_method(self):
+        """Count the opened files."""
+        self.opener = mock.MagicMock(side_effect=_open_fake_file)
+
+    def _open(self, pool, filename, *args):
+        with pool.open(filename, self.opener, *args) as handle:
+            return handle
+
+    def test_handles_are_reused(self):
+        """Test that files are only opened once."""
+        pool = hf.FileHandlePool(max_open_files=2)
+        handle = self._open(pool, "a")
+        assert self._open(pool, "a") is handle
+        self.opener.assert_called_once_with("a")
+        assert self._open(pool, "a", "rb") is not handle
+        assert self.opener.call_count == 2
+        handle.close.assert_not_called()
+
+    def test_least_recently_used_handles_are_closed(self):
+        """Test that the least recently used handles are closed and reopened when needed."""
+        pool = hf.FileHandlePool(max_open_files=2)
+        handles = {filename: self._open(pool, filename) for filename in ["a", "b"]}
+        self._open(pool, "a")
+        handles["c"] = self._open(pool, "c")
+        handles["b"].close.assert_called_once_with()
+        handles["a"].close.assert_not_called()
+        assert len(pool) == 2
+
+        assert self._open(pool, "b") is not handles["b"]
+        handles["a"].close.assert_called_once_with()
+        assert self.opener.call_count == 4
+
+    def test_handles_in_use_are_not_closed(self):
+        """Test that the limit is exceeded while the handles are used."""
+        pool = hf.FileHandlePool(max_open_files=1)
+        with pool.open("a", self.opener) as handle_a:
+            with pool.open("b", self.opener) as handle_b:
+                assert len(pool) == 2
+            handle_b.close.assert_called_once_with()
+            handle_a.close.assert_not_called()
+        assert len(pool) == 1
+
+    def test_add(self):
+        """Test adding handles that are already open."""
+        pool = hf.FileHandlePool(max_open_files=2)
+        handle = _open_fake_file("a")
+        pool.add(handle, "a", self.opener)
+        assert self._open(pool, "a") is handle
+        self.opener.assert_not_called()
+
+        other_handle = _open_fake_file("a")
+        pool.add(other_handle, "a", self.opener)
+        other_handle.close.assert_called_once_with()
+        assert self._open(pool, "a") is handle
+
+    def test_clear(self):
+        """Test closing all handles."""
+        pool = hf.FileHandlePool(max_open_files=2)
+        handle = self._open(pool, "a")
+        pool.clear()
+        handle.close.assert_called_once_with()
+        assert len(pool) == 0
+
+    def test_max_open_files_from_config(self):
+        """Test that the pool is disabled unless configured."""
+        import satpy
+        pool = hf.FileHandlePool()
+        assert not pool.enabled
+        with satpy.config.set({"readers.max_open_files": 3}):
+            assert pool.enabled
+            assert pool.max_open_files == 3
+
+    def test_pooled_variable(self):
+        """Test reading variables through the pool with dask."""
+        try:
+            var = hf.PooledVariable("a", _open_fake_file, "var", (10,), np.int64)
+            arr = da.from_array(var, chunks=5)
+            np.testing.assert_array_equal(arr.compute(), np.arange(10))
+            assert len(hf.FILE_HANDLE_POOL) == 1
+            assert arr.name == da.from_array(hf.PooledVariable("a", _open_fake_file, "var", (10,), np.int64),
+                                             chunks=5).name
+        finally:
+            hf.FILE_HANDLE_POOL.clear()
+
+
 class TestCalibrationCoefficientPicker:
     """Unit tests for calibration coefficient selection."""
 
@@ -277,6 +277,36 @@ class TestLoadingReaderDatasets:
         loaded_ids = list(scene._datasets.keys())
         assert len(loaded_ids) == 0
 
+    @pytest.mark.parametrize(("roi_kwargs", "exp_shape"), [({"ll_bbox": (2, 3, 6, 7)}, (8, 8)),
+                                                           ({"area": "roi"}, (9, 9))])
+    def test_load_region_of_interest(self, roi_kwargs, exp_shape):
+        """Test that the region of interest is passed to the readers and the datasets cropped to it."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy.readers.yaml_reader import FileYAMLReader
+        from satpy.tests.utils import FakeFileHandler
+        area = AreaDefinition("test", "test", "test", "EPSG:4326", 20, 20, (0, 0, 10, 10))
+        roi = AreaDefinition("roi", "roi", "roi", "EPSG:4326", 4, 4, (2, 3, 6, 7))
+        load_mock = spy_decorator(FileYAMLReader.load)
+        with mock.patch.object(FileYAMLReader, "load", load_mock), \
+                mock.patch.object(FakeFileHandler, "get_area_def", return_value=area, create=True), \
+                mock.patch("satpy.scene.get_area_def", return_value=roi):
+            scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+            scene.load(["ds1"], **roi_kwargs)
+        assert load_mock.mock.call_args.kwargs["roi"].area_extent == roi.area_extent
+        assert scene["ds1"].shape == exp_shape
+        xmin, ymin, xmax, ymax = scene["ds1"].attrs["area"].area_extent
+        assert xmin <= 2
+        assert ymin <= 3
+        assert xmax >= 6
+        assert ymax >= 7
+
+    def test_load_region_of_interest_twice(self):
+        """Test that only one region of interest can be given."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        with pytest.raises(ValueError, match="Only one of"):
+            scene.load(["ds1"], area="roi", ll_bbox=(2, 3, 6, 7))
+
 
 @pytest.mark.usefixtures("include_test_etc")
 class TestLoadingComposites:
@@ -517,6 +547,22 @@ class TestLoadingComposites:
             loaded_ids = list(scene._datasets.keys())
             assert len(loaded_ids) == 2
 
+    def test_load_reuses_resolved_keys(self):
+        """Test that keys resolved by a previous load aren't searched for in the readers again."""
+        from satpy.readers.yaml_reader import FileYAMLReader
+        key_mock = spy_decorator(FileYAMLReader.get_dataset_key)
+        with mock.patch.object(FileYAMLReader, "get_dataset_key", key_mock):
+            scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+            scene.load(["comp2"], generate=False)
+            key_mock.mock.reset_mock()
+            scene.load(["comp3"], generate=False)
+        # ds1 and ds2 were resolved when loading comp2
+        searched_keys = [call.args[0] for call in key_mock.mock.call_args_list]
+        searched_names = {key["name"] for key in searched_keys}
+        assert {"comp3", "ds3"} <= searched_names
+        assert not {"ds1", "ds2"} & searched_names
+        assert scene.missing_datasets == {make_cid(name="comp2"), make_cid(name="comp3")}
+
     def test_load_dataset_after_composite2(self):
         """Test load complex composite followed by other datasets."""
         from satpy.readers.yaml_reader import FileYAMLReader
@@ -327,9 +327,9 @@ class TestSceneResampling:
             # once for default (reduce_data=True)
             # once for kwarg forced to `True`
             assert slice_data.call_count == 2 * 3
-            # get area slices is called again, once per area
-            assert get_area_slices.call_count == 2
-            assert get_area_slices_big.call_count == 2
+            # get area slices results are reused for the same areas
+            assert get_area_slices.call_count == 1
+            assert get_area_slices_big.call_count == 1
 
     def test_resample_ancillary(self):
         """Test that the Scene reducing data does not affect final output."""
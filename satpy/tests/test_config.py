@@ -31,7 +31,7 @@ import pytest
 
 import satpy
 from satpy import DatasetDict
-from satpy._config import cached_entry_point
+from satpy._config import cached_entry_point, load_yaml_config
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 
 # NOTE:
@@ -489,6 +489,36 @@ class TestConfigObject:
         assert _is_writable(satpy.config["tmp_dir"])
 
 
+class TestLoadYamlConfig:
+    """Test the loading of YAML configuration files."""
+
+    def test_not_cached_by_default(self, tmp_path):
+        """Test that nothing is written to the cache by default."""
+        conf_file = tmp_path / "conf.yaml"
+        conf_file.write_text("a: 1\n")
+        with satpy.config.set(cache_dir=str(tmp_path / "cache")):
+            assert load_yaml_config(conf_file) == {"a": 1}
+        assert not (tmp_path / "cache").exists()
+
+    def test_cached(self, tmp_path):
+        """Test that the parsed configuration is reused until the file changes."""
+        conf_file = tmp_path / "conf.yaml"
+        conf_file.write_text("a: 1\nb: !!python/name:os.path.join\n")
+        with satpy.config.set(cache_yaml_configs=True, cache_dir=str(tmp_path / "cache")):
+            conf = load_yaml_config(conf_file)
+            assert conf == {"a": 1, "b": os.path.join}
+            assert len(os.listdir(tmp_path / "cache" / "yaml_configs")) == 1
+            conf["a"] = 2
+
+            with mock.patch("satpy._config.yaml.load") as yaml_load:
+                assert load_yaml_config(conf_file) == {"a": 1, "b": os.path.join}
+            yaml_load.assert_not_called()
+
+            conf_file.write_text("a: 3\n")
+            assert load_yaml_config(conf_file) == {"a": 3}
+            assert len(os.listdir(tmp_path / "cache" / "yaml_configs")) == 1
+
+
 def test_is_writable():
     """Test writable directory check."""
     assert _is_writable(os.getcwd())
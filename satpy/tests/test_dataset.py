@@ -999,3 +999,87 @@ def test_wavelength_range_cf_roundtrip():
 
     assert WavelengthRange.from_cf(wr.to_cf()) == wr
     assert WavelengthRange.from_cf([str(item) for item in wr]) == wr
+
+
+class TestDataIDDict:
+    """Test the DataIDDict and its index."""
+
+    def setup_method(self):
+        """Create DataIDs for multiple channels, resolutions and calibrations."""
+        self.dataids = []
+        for idx, central in enumerate((0.47, 0.64, 0.86, 3.9, 10.8)):
+            for resolution in (500, 1000):
+                for calibration in ("reflectance", "radiance"):
+                    self.dataids.append(make_dataid(name=f"C{idx:02d}",
+                                                    wavelength=(central - 0.05, central, central + 0.05),
+                                                    resolution=resolution, calibration=calibration))
+        self.dataids.append(make_dataid(name="solar_zenith_angle", resolution=1000))
+
+    def _make_dict(self):
+        from satpy.dataset.data_dict import DataIDDict
+        return DataIDDict((dataid, str(dataid)) for dataid in self.dataids)
+
+    @pytest.mark.parametrize("query",
+                             ["C01", 0.64, 0.62, 11.5, "solar_zenith_angle",
+                              make_dsq(name=["C01", "C03"]), make_dsq(wavelength=[0.47, 10.8]),
+                              make_dsq(name="C02", resolution=500),
+                              make_dsq(name="C02", wavelength=0.86, calibration="radiance"),
+                              make_dsq(name="C02", wavelength=0.47),
+                              make_dsq(name="*", resolution=1000),
+                              make_dsq(wavelength=3.9, resolution=1000)])
+    @pytest.mark.parametrize("best", [True, False])
+    def test_get_key_same_as_linear_search(self, query, best):
+        """Test that the index gives the same results as going through all the keys."""
+        from satpy.dataset.data_dict import get_key
+
+        def _get_key(container):
+            try:
+                return get_key(query, container, num_results=0, best=best)
+            except KeyError:
+                return None
+
+        assert _get_key(self._make_dict()) == _get_key(list(self.dataids))
+
+    def test_candidates_only_with_query_name(self):
+        """Test that the index only gives the DataIDs with the queried name."""
+        candidates = self._make_dict().dataid_index.get_candidates(make_dsq(name="C01"))
+        assert candidates == [dataid for dataid in self.dataids if dataid["name"] == "C01"]
+
+    def test_candidates_with_unindexable_query(self):
+        """Test that queries without name or wavelength aren't looked up in the index."""
+        assert self._make_dict().dataid_index.get_candidates(make_dsq(resolution=500)) is None
+
+    def test_index_follows_dict_changes(self):
+        """Test that the index is updated when the dictionary changes."""
+        from satpy.dataset.data_dict import get_key
+
+        dataid_dict = self._make_dict()
+        c01 = [dataid for dataid in self.dataids if dataid["name"] == "C01"]
+        del dataid_dict[c01[0]]
+        dataid_dict.pop(c01[1])
+        assert get_key("C01", dataid_dict, num_results=0, best=False) == c01[2:]
+
+        new_id = make_dataid(name="C01", wavelength=(0.6, 0.65, 0.7), resolution=250, calibration="reflectance")
+        dataid_dict[new_id] = "new"
+        assert get_key("C01", dataid_dict) == new_id
+
+        dataid_dict.update({make_dataid(name="C99", resolution=1000): "other"})
+        assert get_key("C99", dataid_dict)["name"] == "C99"
+
+        dataid_dict.clear()
+        with pytest.raises(KeyError):
+            get_key("C99", dataid_dict)
+
+    def test_copy_and_pickle(self):
+        """Test that copies and unpickled dictionaries have their own index."""
+        import copy
+        import pickle
+
+        from satpy.dataset.data_dict import get_key
+
+        dataid_dict = self._make_dict()
+        assert len(dataid_dict.dataid_index) == len(self.dataids)
+        for other in (copy.copy(dataid_dict), copy.deepcopy(dataid_dict), pickle.loads(pickle.dumps(dataid_dict))):
+            del other[get_key("C00", other, resolution=500, calibration="radiance")]
+            assert len(other.dataid_index) == len(self.dataids) - 1
+        assert len(dataid_dict.dataid_index) == len(self.dataids)
@@ -90,6 +90,30 @@ class TestDependencyTree(unittest.TestCase):
         assert self.dependency_tree._root.children[0].children[0].children[1] is self.dependency_tree.empty_node
         assert new_dependency_tree._root.children[0].children[0].children[1] is self.dependency_tree.empty_node
 
+    def test_copy_shares_nodes_until_modified(self):
+        """Test that dependency tree copies share the nodes until the original is modified."""
+        new_dependency_tree = self.dependency_tree.copy()
+        assert new_dependency_tree._all_nodes is self.dependency_tree._all_nodes
+
+        new_id = make_dataid(name="ds6", resolution=250)
+        self.dependency_tree.add_leaf(new_id)
+        assert new_dependency_tree._all_nodes is not self.dependency_tree._all_nodes
+        assert self.dependency_tree.contains(new_id)
+        assert not new_dependency_tree.contains(new_id)
+        assert self._nodes_equal(new_dependency_tree.trunk(), self.dependency_tree.trunk())
+
+    def test_copy_uses_own_nodes(self):
+        """Test that dependency tree copies copy the nodes before handing them out."""
+        new_dependency_tree = self.dependency_tree.copy()
+        c19_id = make_cid(name="comp19")
+        new_c19 = new_dependency_tree[c19_id]
+        assert new_c19 is not self.dependency_tree[c19_id]
+
+        new_id = make_dataid(name="ds6", resolution=250)
+        new_dependency_tree.add_leaf(new_id, new_c19)
+        assert new_dependency_tree.contains(new_id)
+        assert not self.dependency_tree.contains(new_id)
+
     def test_new_dependency_tree_preserves_unique_empty_node(self):
         """Test that dependency tree instantiation preserves the uniqueness of the empty node."""
         new_dependency_tree = DependencyTree(None, None, None)
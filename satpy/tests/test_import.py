@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Test the import of the satpy package."""
+
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+
+def _get_imported_modules(code):
+    """Get the modules imported by running *code* in a new interpreter."""
+    code += "; import sys; print(' '.join(sys.modules))"
+    return set(subprocess.check_output([sys.executable, "-c", code], text=True).split())  # nosec B603
+
+
+def test_import_satpy_is_lazy():
+    """Test that importing satpy doesn't import the readers, writers and resamplers."""
+    modules = _get_imported_modules("import satpy")
+    assert not modules & {"satpy.scene", "satpy.readers", "satpy.writers", "satpy.resample",
+                          "satpy.multiscene", "zarr", "distributed"}
+
+
+def test_scene_imports_no_optional_backends():
+    """Test that creating a scene doesn't import the backends used only by some resamplers and writers."""
+    modules = _get_imported_modules("from satpy import Scene; Scene()")
+    assert "satpy.scene" in modules
+    assert not modules & {"zarr", "distributed"}
+
+
+@pytest.mark.parametrize("name", ["Scene", "MultiScene", "available_readers", "available_writers",
+                                  "find_files_and_readers"])
+def test_lazy_attributes(name):
+    """Test that the lazily imported attributes are available."""
+    import satpy
+    assert name in dir(satpy)
+    assert getattr(satpy, name).__name__ == name
+
+
+def test_unknown_attribute():
+    """Test that unknown attributes still raise an AttributeError."""
+    import satpy
+    with pytest.raises(AttributeError, match="has no attribute 'NotAScene'"):
+        satpy.NotAScene
@@ -21,6 +21,7 @@
 import builtins
 import contextlib
 import datetime as dt
+import glob
 import os
 import sys
 import unittest
@@ -294,6 +295,15 @@ class TestReaderLoader(unittest.TestCase):
                           filenames=["SVI01_npp_d20120225_t1801245_e1802487_b01708_c20120226002130255476_noaa_ops.h5"])
         assert list(ri.keys()) == ["viirs_sdr"]
 
+    def test_filenames_and_reader_with_fh_workers(self):
+        """Test with filenames, reader and file handler workers specified."""
+        from satpy.readers import load_readers
+        ri = load_readers(reader="viirs_sdr",
+                          filenames=["SVI01_npp_d20120225_t1801245_e1802487_b01708_c20120226002130255476_noaa_ops.h5"],
+                          reader_kwargs={"fh_workers": 2})
+        assert ri["viirs_sdr"].fh_workers == 2
+        assert len(ri["viirs_sdr"].file_handlers["generic_file"]) == 1
+
     def test_bad_reader_name_with_filenames(self):
         """Test bad reader name with filenames provided."""
         from satpy.readers import load_readers
@@ -463,6 +473,13 @@ class TestFindFilesAndReaders:
         assert list(ri.keys()) == ["viirs_sdr"]
         assert ri["viirs_sdr"] == [viirs_file]
 
+    def test_directory_listed_once(self, viirs_file):
+        """Test that the files are matched to the patterns of all the readers from a single listing."""
+        with mock.patch("glob.iglob", wraps=glob.iglob) as iglob:
+            ri = find_files_and_readers(reader=["viirs_sdr", "nwcsaf-pps_nc"])
+        assert ri == {"viirs_sdr": [viirs_file]}
+        iglob.assert_called_once_with("*")
+
     def test_reader_other_name(self, monkeypatch, tmp_path):
         """Test with default base_dir and reader specified."""
         filename = "S_NWC_CPP_npp_32505_20180204T1114116Z_20180204T1128227Z.nc"
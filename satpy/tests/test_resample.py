@@ -132,7 +132,7 @@ class TestKDTreeResampler(unittest.TestCase):
     """Test the kd-tree resampler."""
 
     @mock.patch("satpy.resample.xr.Dataset")
-    @mock.patch("satpy.resample.zarr.open")
+    @mock.patch("zarr.open")
     @mock.patch("satpy.resample.KDTreeResampler._create_cache_filename")
     @mock.patch("pyresample.kd_tree.XArrayResamplerNN")
     def test_kd_resampling(self, xr_resampler, create_filename, zarr_open,
@@ -425,6 +425,135 @@ class TestBilinearResampler(unittest.TestCase):
             shutil.rmtree(the_dir)
 
 
+def _get_swath_and_lonlat_area():
+    """Get a swath DataArray and a lon/lat target area covering its western part."""
+    from pyresample.geometry import AreaDefinition, SwathDefinition
+    lons, lats = np.meshgrid(np.linspace(0., 20., 40), np.linspace(50., 40., 20))
+    lons = xr.DataArray(da.from_array(lons, chunks=10), dims=("y", "x"), attrs={"rows_per_scan": 5})
+    lats = xr.DataArray(da.from_array(lats, chunks=10), dims=("y", "x"), attrs={"rows_per_scan": 5})
+    swath_def = SwathDefinition(lons, lats)
+    data = xr.DataArray(da.from_array(np.arange(800.).reshape(20, 40), chunks=10), dims=("y", "x"),
+                        attrs={"area": swath_def, "name": "test"})
+    target = AreaDefinition("test_target", "test_target", "test_target", "EPSG:4326",
+                            20, 10, (0., 40., 8., 50.))
+    return data, target
+
+
+class TestResamplingCache:
+    """Test the on-disk cache of the resampling lookup tables."""
+
+    def test_ewa_cache(self, tmp_path):
+        """Test that the ll2cr results of EWA are cached and reused."""
+        from satpy.resample import resample_dataset
+        data, target = _get_swath_and_lonlat_area()
+        expected = resample_dataset(data, target, resampler="ewa").compute()
+
+        res = resample_dataset(data, target, resampler="ewa", cache_dir=str(tmp_path)).compute()
+        cache_files = list(tmp_path.glob("ewa_lut-*.npz"))
+        assert len(cache_files) == 1
+        np.testing.assert_allclose(res, expected)
+
+        with mock.patch("pyresample.ewa.dask_ewa._call_ll2cr") as call_ll2cr:
+            res = resample_dataset(data, target, resampler="ewa", cache_dir=str(tmp_path),
+                                   weight_delta_max=40.0).compute()
+        call_ll2cr.assert_not_called()
+        np.testing.assert_allclose(
+            res, resample_dataset(data, target, resampler="ewa", weight_delta_max=40.0).compute())
+
+    def test_gradient_search_cache(self, tmp_path):
+        """Test that the indices of the gradient search are cached and reused."""
+        from satpy.resample import resample_dataset
+        data, source_area, _, _, target_area = get_test_data()
+        data = data.copy(data=da.random.random(data.shape, chunks=85))
+        expected = resample_dataset(data, target_area, resampler="gradient_search").compute()
+
+        res = resample_dataset(data, target_area, resampler="gradient_search", cache_dir=str(tmp_path))
+        np.testing.assert_allclose(res, expected)
+        assert len(list(tmp_path.glob("gs_lut-*.npz"))) == 1
+
+        with mock.patch("pyresample.gradient.gradient_resampler_indices_block") as indices_block:
+            res = resample_dataset(data, target_area, resampler="gradient_search", cache_dir=str(tmp_path))
+            np.testing.assert_allclose(res, expected)
+        indices_block.assert_not_called()
+
+    def test_eviction(self, tmp_path):
+        """Test that the least recently used entries are removed."""
+        from satpy import config
+        from satpy.resample import _save_cached_arrays
+        unrelated = tmp_path / "unrelated.npz"
+        unrelated.write_bytes(b"\0" * 10000)
+        zarr_entry = tmp_path / "nn_lut-old.zarr"
+        zarr_entry.mkdir()
+        (zarr_entry / "data").write_bytes(b"\0" * 4000)
+        os.utime(zarr_entry, ns=(0, 0))
+        with config.set(resample_cache_max_size=6000):
+            _save_cached_arrays(str(tmp_path / "gs_lut-new.npz"), {"a": np.zeros(100)})
+            assert zarr_entry.exists()
+            _save_cached_arrays(str(tmp_path / "gs_lut-newer.npz"), {"a": np.zeros(300)})
+        assert not zarr_entry.exists()
+        assert unrelated.exists()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["gs_lut-new.npz", "gs_lut-newer.npz",
+                                                                     "unrelated.npz"]
+
+    def test_concurrent_write_keeps_existing_entry(self, tmp_path):
+        """Test that an entry written by another process in the meantime is kept."""
+        from satpy.resample import _atomic_cache_entry
+        filename = tmp_path / "nn_lut-abc.zarr"
+        filename.mkdir()
+        (filename / "data").write_text("first")
+        with _atomic_cache_entry(str(filename)) as tmp_filename:
+            os.mkdir(tmp_filename)
+            with open(os.path.join(tmp_filename, "data"), "w") as fid:
+                fid.write("second")
+        assert (filename / "data").read_text() == "first"
+        assert os.listdir(tmp_path) == ["nn_lut-abc.zarr"]
+
+
+class TestGetAreaSlices:
+    """Test the memoised area slices."""
+
+    def test_slices_are_reused(self):
+        """Test that the slices of equal area pairs are only computed once."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy.resample import get_area_slices
+        _, source_area, _, _, target_area = get_test_data()
+        expected = (slice(2, 10, None), slice(0, 20, None))
+        with mock.patch.object(AreaDefinition, "get_area_slices", return_value=expected) as area_slices:
+            assert get_area_slices(source_area, target_area) == expected
+            assert get_area_slices(source_area.copy(), target_area.copy()) == expected
+            assert area_slices.call_count == 1
+            get_area_slices(source_area, target_area, shape_divisible_by=2)
+            assert area_slices.call_count == 2
+
+    def test_swath_slices_are_not_cached(self):
+        """Test that slices involving swaths are not cached."""
+        from satpy.resample import get_area_slices
+        _, _, _, source_swath, target_area = get_test_data()
+        with mock.patch.object(source_swath, "get_area_slices", create=True,
+                               return_value=(slice(0, 1), slice(0, 1))) as area_slices:
+            get_area_slices(source_swath, target_area)
+            get_area_slices(source_swath, target_area)
+        assert area_slices.call_count == 2
+
+    def test_slices_on_disk(self, tmp_path):
+        """Test that the slices are reused from disk when configured."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy import config
+        from satpy.resample import _get_cached_area_slices, get_area_slices
+        _, source_area, _, _, target_area = get_test_data()
+        expected = (slice(2, 10, None), slice(0, 20, None))
+        with config.set(cache_area_slices=True, cache_dir=str(tmp_path)):
+            with mock.patch.object(AreaDefinition, "get_area_slices", return_value=expected):
+                assert get_area_slices(source_area, target_area) == expected
+            assert len(list((tmp_path / "area_slices").glob("*.json"))) == 1
+            _get_cached_area_slices.cache_clear()
+            with mock.patch.object(AreaDefinition, "get_area_slices") as area_slices:
+                assert get_area_slices(source_area, target_area) == expected
+            area_slices.assert_not_called()
+
+
 class TestCoordinateHelpers(unittest.TestCase):
     """Test various utility functions for working with coordinates."""
 
@@ -36,6 +36,8 @@ from satpy.utils import (
     get_satpos,
     import_error_helper,
     lonlat2xyz,
+    profile,
+    profile_step,
     proj_units_to_meters,
     xyz2angle,
     xyz2lonlat,
@@ -631,3 +633,51 @@ def test_find_in_ancillary():
 def test_datetime64_to_pydatetime(dt64, expected):
     """Test conversion from datetime64 to Python datetime."""
     assert datetime64_to_pydatetime(dt64) == expected
+
+
+def test_profile_records_steps():
+    """Test that the profiler records the steps run in its context."""
+    import json
+
+    with profile_step("load", "before") as step:
+        step["nbytes"] = 1
+    with profile() as prof:
+        with profile_step("load", "ds1") as step:
+            step["nbytes"] = 8
+        with profile_step("save", "writer"):
+            pass
+        with pytest.raises(ValueError, match="composite failed"), profile_step("composite", "failing"):
+            raise ValueError("composite failed")
+    with profile_step("load", "after"):
+        pass
+
+    assert [(rec["category"], rec["name"], rec["nbytes"]) for rec in prof.records] == [
+        ("load", "ds1", 8), ("save", "writer", None)]
+    report = json.loads(prof.to_json())
+    assert report["duration"] >= report["records"][1]["end_time"] >= report["records"][0]["start_time"] >= 0
+    assert [result.key for result in prof.results] == ["load-ds1", "save-writer"]
+    assert prof.results[0].start_time == prof.records[0]["start_time"]
+
+
+@pytest.mark.usefixtures("include_test_etc")
+def test_profile_scene_processing(tmp_path):
+    """Test that the steps of a Scene processing chain are profiled."""
+    from pyresample.geometry import AreaDefinition
+
+    from satpy import Scene
+    proj_str = ("+proj=lcc +datum=WGS84 +ellps=WGS84 "
+                "+lon_0=-95. +lat_0=25 +lat_1=25 +units=m +no_defs")
+    area_def = AreaDefinition("test", "test", "test", proj_str, 20, 20, (-1000., -1500., 1000., 1500.))
+    with profile() as prof:
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        scene.load(["comp1"])
+        new_scene = scene.resample(area_def, resampler="native")
+        new_scene.save_datasets(base_dir=str(tmp_path), writer="simple_image", filename="{name}.png")
+    prof.to_json(tmp_path / "profile.json")
+
+    categories = {rec["category"] for rec in prof.records}
+    assert categories == {"file_handlers", "load", "composite", "resample", "enhance", "save"}
+    composite_records = [rec for rec in prof.records if rec["category"] == "composite"]
+    assert composite_records[0]["nbytes"] > 0
+    assert (tmp_path / "profile.json").exists()
+
@@ -18,9 +18,12 @@
 
 """Testing the yaml_reader module."""
 
+import copy
 import datetime as dt
 import os
 import random
+import threading
+import time
 import unittest
 from tempfile import mkdtemp
 from unittest.mock import MagicMock, call, patch
@@ -169,6 +172,27 @@ class TestUtils(unittest.TestCase):
         expected = os.path.join(base_dir, "geo_coordinates.nc").replace(os.sep, "/")
         assert yr._match_filenames(filenames, pattern) == {expected}
 
+    def test_filename_pattern_index(self):
+        """Check that the pattern index matches like fnmatch does."""
+        from fnmatch import fnmatch
+
+        from trollsift import globify
+        patterns = ["a{num:3d}.bla", "{name}.bla", "abc{x:1s}.bla", "a{num:3d}.bla",
+                    "abcd.bla", os.path.join("{dirname}", "b{num:3d}.bli")]
+        filenames = ["a001.bla", "abcd.bla", "abc.bla", "k001.bla", "a003.bli",
+                     os.path.join("some", "dir", "b001.bli"), "b001.bli", "a"]
+        index = yr.FilenamePatternIndex(patterns)
+        assert index.patterns == tuple(dict.fromkeys(patterns))
+        for filename in filenames:
+            expected = [pattern for pattern in index.patterns
+                        if fnmatch(yr._get_filebase(filename, pattern), globify(pattern))]
+            assert index.match(filename) == expected
+        matches = index.classify(filenames)
+        assert matches["a{num:3d}.bla"] == {"a001.bla", "abcd.bla"}
+        assert matches["{name}.bla"] == {"a001.bla", "abcd.bla", "abc.bla", "k001.bla"}
+        assert matches["abcd.bla"] == {"abcd.bla"}
+        assert matches[os.path.join("{dirname}", "b{num:3d}.bli")] == {os.path.join("some", "dir", "b001.bli")}
+
     def test_listify_string(self):
         """Check listify_string."""
         assert yr.listify_string(None) == []
@@ -198,6 +222,18 @@ class DummyReader(BaseFileHandler):
         return self._end_time
 
 
+class SlowDummyReader(DummyReader):
+    """Dummy reader taking some time to be created."""
+
+    concurrent_creation = True
+
+    def __init__(self, filename, filename_info, filetype_info):
+        """Initialize the dummy reader after sleeping for a while."""
+        time.sleep(filename_info["delay"])
+        super().__init__(filename, filename_info, filetype_info)
+        self.thread_name = threading.current_thread().name
+
+
 class TestFileFileYAMLReaderMultiplePatterns(unittest.TestCase):
     """Test units from FileYAMLReader with multiple readers."""
 
@@ -257,6 +293,49 @@ class TestFileFileYAMLReaderMultiplePatterns(unittest.TestCase):
         self.reader.create_filehandlers(filelist)
         assert len(self.reader.file_handlers["ftype1"]) == 3
 
+    def test_new_filehandler_instances_with_workers_keeps_order(self):
+        """Check creating file handlers on a thread pool keeps their order."""
+        reader = yr.FileYAMLReader(self.config, fh_workers=4)
+        filetype_info = dict(self.config["file_types"]["ftype1"], file_reader=SlowDummyReader)
+        filename_items = [("a{:03d}.bla".format(num), {"delay": delay})
+                          for num, delay in enumerate([0.2, 0.0, 0.1, 0.05, 0.15, 0.0])]
+
+        fhs = list(reader._new_filehandler_instances(filetype_info, filename_items))
+
+        assert [fh.filename for fh in fhs] == [fname for fname, _ in filename_items]
+        assert len(set(fh.thread_name for fh in fhs)) > 1
+
+    def test_new_filehandler_instances_with_workers_not_concurrent(self):
+        """Check that file handlers not supporting it are not created on a thread pool."""
+        reader = yr.FileYAMLReader(self.config, fh_workers=4)
+        filetype_info = dict(self.config["file_types"]["ftype1"], file_reader=SlowDummyReader)
+        filename_items = [("a001.bla", {"delay": 0}), ("a002.bla", {"delay": 0})]
+
+        with patch.object(SlowDummyReader, "concurrent_creation", False):
+            fhs = list(reader._new_filehandler_instances(filetype_info, filename_items))
+
+        assert set(fh.thread_name for fh in fhs) == {threading.current_thread().name}
+
+    def test_create_filehandlers_with_workers_missing_requirement(self):
+        """Check create_filehandlers on a thread pool warns about missing requirements."""
+        config = copy.deepcopy(self.config)
+        config["file_types"]["ftype1"]["requires"] = ["ftype2"]
+        config["file_types"]["ftype2"] = {"name": "ft2",
+                                          "file_patterns": ["b{something:3s}.bla"],
+                                          "file_reader": DummyReader}
+        reader = yr.FileYAMLReader(config,
+                                   filter_parameters=self.reader.filter_parameters,
+                                   fh_workers=4)
+        with pytest.warns(UserWarning, match="No handler for reading requirement"):
+            reader.create_filehandlers(["a001.bla", "a002.bla"])
+        assert "ftype1" not in reader.file_handlers
+
+    def test_bad_fh_workers(self):
+        """Check that invalid numbers of workers are refused."""
+        for fh_workers in (0, -2, 2.5, "4", True):
+            with pytest.raises(ValueError, match="fh_workers"):
+                yr.FileYAMLReader(self.config, fh_workers=fh_workers)
+
     def test_serializable(self):
         """Check that a reader is serializable by dask.
 
@@ -616,6 +695,16 @@ class TestFileYAMLReaderLoading(unittest.TestCase):
 
         self._check_area_for_ch01()
 
+    def test_load_dataset_outside_region_of_interest(self):
+        """Test that files without data in the region of interest are not read."""
+        self.data = xr.DataArray(np.ones((2, 2)), dims=["y", "x"])
+        roi = MagicMock()
+        with patch.object(self.reader, "check_file_covers_area", return_value=False) as covers:
+            res = self.reader.load(["ch01"], roi=roi)
+        covers.assert_called_once_with(self.reader.file_handlers["ftype1"][0], roi)
+        assert "ch01" not in res
+        self.reader.file_handlers["ftype1"][0].get_dataset.assert_not_called()
+
     def _check_area_for_ch01(self):
         res = self.reader.load(["ch01"])
         assert "area" in res["ch01"].attrs
@@ -1217,6 +1306,43 @@ class TestGEOSegmentYAMLReader(unittest.TestCase):
                          seg1_extent)
         AreaDefinition.assert_called_once_with(*expected_call)
 
+    @patch.object(yr.FileYAMLReader, "__init__", lambda x: None)
+    def test_filter_file_handlers_by_roi(self):
+        """Test that only the segments with lines in the region of interest are kept."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy.readers.yaml_reader import GEOSegmentYAMLReader
+        reader = GEOSegmentYAMLReader()
+
+        file_handlers = []
+        for segment in range(1, 5):
+            extent = (0, 40 - 10 * segment, 10, 50 - 10 * segment)
+            seg_area = AreaDefinition("seg", "seg", "seg", "EPSG:4326", 100, 100, extent)
+            fh, _ = _create_mocked_fh_and_areadef(extent, seg_area.shape, 4, segment, None)
+            fh.get_area_def.return_value = seg_area
+            file_handlers.append(fh)
+
+        roi = AreaDefinition("roi", "roi", "roi", "EPSG:4326", 10, 10, (2, 22, 8, 28))
+        res = reader._filter_file_handlers_by_roi("dataid", file_handlers, roi)
+        assert res == file_handlers[1:2]
+
+        roi = AreaDefinition("roi", "roi", "roi", "EPSG:4326", 10, 10, (2, 12, 8, 31))
+        res = reader._filter_file_handlers_by_roi("dataid", file_handlers, roi)
+        assert res == file_handlers[:3]
+
+        # segments close to the region are kept for the margin
+        roi = AreaDefinition("roi", "roi", "roi", "EPSG:4326", 10, 10, (2, 20.2, 8, 28))
+        res = reader._filter_file_handlers_by_roi("dataid", file_handlers, roi)
+        assert res == file_handlers[1:3]
+
+        res = reader._filter_file_handlers_by_roi("dataid", file_handlers, roi, pad_data=False)
+        assert res == file_handlers
+
+        # without overlap, nothing is filtered
+        roi = AreaDefinition("roi", "roi", "roi", "EPSG:4326", 10, 10, (20, 12, 28, 18))
+        res = reader._filter_file_handlers_by_roi("dataid", file_handlers, roi)
+        assert res == file_handlers
+
     def test_find_missing_segments(self):
         """Test _find_missing_segments()."""
         from satpy.readers.yaml_reader import _find_missing_segments as fms
@@ -518,3 +518,155 @@ class TestAWIPSTiledWriter:
         elif "environment_prefix" in extra_kwargs:
             return "AA*_GLM*.nc"
         return "DR*_GLM*.nc"
+
+
+class TestAWIPSTiledWriterStreaming:
+    """Test the AWIPS Tiled writer writing tiles as the input chunks are computed."""
+
+    @staticmethod
+    def _save_and_read_tiles(writer_kwargs, datasets, **save_kwargs):
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+        w = AWIPSTiledWriter(compress=True, **writer_kwargs)
+        w.save_datasets(datasets, **save_kwargs)
+        all_files = sorted(glob(os.path.join(writer_kwargs["base_dir"], "*.nc")))
+        return {os.path.basename(fn): xr.open_dataset(fn, mask_and_scale=False) for fn in all_files}
+
+    def _assert_same_tiles(self, tmp_path, datasets, **save_kwargs):
+        expected = self._save_and_read_tiles({"base_dir": str(tmp_path / "delayed")}, datasets, **save_kwargs)
+        streamed = self._save_and_read_tiles({"base_dir": str(tmp_path / "streamed")}, datasets,
+                                             streaming=True, **save_kwargs)
+        assert expected
+        assert streamed.keys() == expected.keys()
+        for fn, streamed_ds in streamed.items():
+            expected_ds = expected[fn]
+            for var_name, expected_var in expected_ds.variables.items():
+                np.testing.assert_array_equal(streamed_ds[var_name].values, expected_var.values)
+            # ignore attributes depending on the time of writing
+            time_attrs = ("creation_time", "dataset_name")
+            expected_attrs = {key: val for key, val in expected_ds.attrs.items() if key not in time_attrs}
+            streamed_attrs = {key: val for key, val in streamed_ds.attrs.items() if key not in time_attrs}
+            assert streamed_attrs == expected_attrs
+        return streamed
+
+    @pytest.mark.parametrize(
+        ("tile_count", "tile_size"),
+        [
+            ((3, 3), None),
+            (None, (67, 34)),
+        ]
+    )
+    def test_numbered_tiles(self, tile_count, tile_size, tmp_path):
+        """Test that streamed numbered tiles match the tiles written with dask delayed objects."""
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(_get_test_data(), area_def)
+        self._assert_same_tiles(tmp_path, [input_data_arr], sector_id="TEST", source_name="TESTS",
+                                tile_count=tile_count, tile_size=tile_size)
+
+    def test_lettered_tiles(self, tmp_path):
+        """Test that streamed lettered tiles match the tiles written with dask delayed objects."""
+        data = _get_test_data(shape=(2000, 1000), chunks=(300, 700))
+        area_def = _get_test_area(shape=(2000, 1000),
+                                  extents=(-1000000., -1500000., 1000000., 1500000.))
+        ds = _get_test_lcc_data(data, area_def)
+        streamed = self._assert_same_tiles(tmp_path, [ds], sector_id="LCC", source_name="TESTS",
+                                           lettered_grid=True)
+        assert len(streamed) == 16
+
+    def test_multivar_tiles(self, tmp_path, monkeypatch):
+        """Test streaming tiles with multiple variables chunked differently."""
+        monkeypatch.setenv("ORGANIZATION", "TEST")
+        area_def = _get_test_area()
+        ds1 = _get_test_lcc_data(_get_test_data(), area_def)
+        ds1.attrs.update(name="total_energy", platform_name="GOES-17", scan_mode="M3",
+                         scene_abbr="C", platform_shortname="G17")
+        ds2 = ds1.copy(data=_get_test_data(chunks=(30, 70)))
+        ds2.attrs["name"] = "flash_extent_density"
+        ds3 = ds1.copy()
+        ds3.attrs["name"] = "average_flash_area"
+        dqf = (ds1 * 255).astype(np.uint8)
+        dqf.attrs = dict(ds1.attrs, name="DQF", _FillValue=1)
+        streamed = self._assert_same_tiles(tmp_path, [ds1, ds2, ds3, dqf], sector_id="TEST",
+                                           source_name="TESTS", tile_count=(3, 3),
+                                           template="glm_l2_radc")
+        assert len(streamed) == 9
+
+    def test_computes_in_one_pass(self, tmp_path):
+        """Test that the valid range and all the tiles are computed in a single dask computation."""
+        from satpy.tests.utils import CustomScheduler
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(_get_test_data(chunks=50), area_def)
+        w = AWIPSTiledWriter(base_dir=str(tmp_path), compress=True)
+        with dask.config.set(scheduler=CustomScheduler(1)):
+            filenames = w.save_datasets([input_data_arr], sector_id="TEST", source_name="TESTS",
+                                        tile_count=(3, 3), streaming=True)
+        assert len(filenames) == 9
+        assert sorted(filenames) == sorted(glob(os.path.join(str(tmp_path), "TESTS_AII*.nc")))
+
+    def test_shared_tasks_computed_once(self, tmp_path):
+        """Test that the tasks shared by all the chunks are computed once."""
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+        calls = []
+
+        def _shared_offset():
+            calls.append(1)
+            return np.float32(0.5)
+
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(_get_test_data(chunks=25), area_def)
+        offset = da.from_delayed(dask.delayed(_shared_offset)(), shape=(), dtype=np.float32)
+        input_data_arr = input_data_arr.copy(data=input_data_arr.data + offset)
+        w = AWIPSTiledWriter(base_dir=str(tmp_path), compress=True)
+        w.save_datasets([input_data_arr], sector_id="TEST", source_name="TESTS",
+                        tile_count=(3, 3), streaming=True)
+        assert len(calls) == 1
+
+    def test_streaming_needs_local_scheduler(self):
+        """Test that the tiles being streamed can't be sent to other processes."""
+        import pickle
+        import threading
+
+        from satpy.writers.awips_tiled import _TileStreamer
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(_get_test_data(), area_def)
+        streamer = _TileStreamer([], [input_data_arr], None, threading.Lock())
+        with pytest.raises(TypeError, match="threaded or synchronous"):
+            pickle.dumps(streamer)
+
+    def test_delayed(self, tmp_path):
+        """Test that a single delayed object is returned when not computing."""
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(_get_test_data(), area_def)
+        w = AWIPSTiledWriter(base_dir=str(tmp_path), compress=True)
+        delayeds = w.save_datasets([input_data_arr], sector_id="TEST", source_name="TESTS",
+                                   tile_count=(3, 3), streaming=True, compute=False)
+        assert len(delayeds) == 1
+        assert not glob(os.path.join(str(tmp_path), "TESTS_AII*.nc"))
+        filenames = dask.compute(delayeds[0])[0]
+        assert len(filenames) == 9
+
+    def test_update_existing(self, tmp_path):
+        """Test that streamed tiles update the valid pixels of existing tiles."""
+        shape = (2000, 1000)
+        area_def = _get_test_area(shape, extents=(-1000000., -1500000., 1000000., 1500000.))
+        data = np.linspace(0., 1., shape[0] * shape[1], dtype=np.float32).reshape(shape)
+        first_data = data.copy()
+        first_data[:, -200:] = np.nan
+        second_data = data.copy()
+        second_data[:, :-200] = np.nan
+        save_kwargs = dict(sector_id="LCC", source_name="TESTS", lettered_grid=True, streaming=True)
+
+        def _get_dataset(arr):
+            ds = _get_test_lcc_data(da.from_array(arr, chunks=500), area_def)
+            ds.attrs["valid_range"] = (0., 1.)
+            return [ds]
+
+        expected = self._save_and_read_tiles({"base_dir": str(tmp_path / "full")}, _get_dataset(data), **save_kwargs)
+        self._save_and_read_tiles({"base_dir": str(tmp_path / "parts")}, _get_dataset(first_data), **save_kwargs)
+        updated = self._save_and_read_tiles({"base_dir": str(tmp_path / "parts")}, _get_dataset(second_data),
+                                            **save_kwargs)
+        assert updated.keys() == expected.keys()
+        for fn, updated_ds in updated.items():
+            # existing values are decoded and encoded again when updated
+            np.testing.assert_allclose(updated_ds["data"].values, expected[fn]["data"].values, atol=1)
@@ -23,6 +23,7 @@ from unittest import mock
 import dask.array as da
 import numpy as np
 import pytest
+import rasterio
 import xarray as xr
 
 # NOTE:
@@ -120,6 +121,23 @@ class TestGeoTIFFWriter:
             if hasattr(target, "close"):
                 target.close()
 
+    def test_process_safe_delayed_write(self, tmp_path):
+        """Test writing each file in a single delayed task that can run in another process."""
+        import dask
+        from dask.delayed import Delayed
+
+        from satpy.writers.geotiff import GeoTIFFWriter
+        datasets = _get_test_datasets_2d() + _get_test_datasets_3d()
+        datasets[1].attrs["name"] = "test_rgb"
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        res = w.save_datasets(datasets, compute=False, process_safe=True)
+        assert len(res) == 2
+        assert all(isinstance(delayed, Delayed) for delayed in res)
+        assert not list(tmp_path.iterdir())
+        with dask.config.set(scheduler="processes", num_workers=2):
+            filenames = dask.compute(*res)
+        assert sorted(filenames) == sorted(str(path) for path in tmp_path.iterdir())
+
     def test_colormap_write(self, tmp_path):
         """Test writing an image with a colormap."""
         from trollimage.colormap import spectral
@@ -241,3 +259,83 @@ class TestGeoTIFFWriter:
         ds = xr.open_dataset(filename, engine="rasterio")
         assert ds["band_data"].dtype == dtype
         np.testing.assert_allclose(ds["band_data"], -273.15)
+
+    def test_dask_overviews_write(self, tmp_path):
+        """Test writing overviews computed with dask."""
+        from satpy.writers.geotiff import GeoTIFFWriter
+        datasets = _get_test_datasets_2d()
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        filename = tmp_path / "overviews.tif"
+        w.save_dataset(datasets[0], filename=str(filename), overviews=[2, 4], dask_overviews=True)
+        with rasterio.open(filename) as src:
+            assert src.overviews(1) == [2, 4]
+
+    @pytest.mark.parametrize(
+        ("resampling", "expected_func"),
+        [
+            (None, lambda data, factor: data[:, ::factor, ::factor]),
+            ("average", lambda data, factor: np.round(
+                data.reshape(2, 400 // factor, factor, 300 // factor, factor).mean(axis=(2, 4)))),
+        ]
+    )
+    def test_dask_overviews_levels(self, resampling, expected_func, tmp_path):
+        """Test the overview levels computed with dask are written to the file."""
+        from trollimage._xrimage_rasterio import RIODataset, RIOFile
+
+        from satpy.writers.geotiff import GeoTIFFWriter
+        data = np.arange(2 * 400 * 300, dtype=np.uint16).reshape((2, 400, 300)) % 1000
+
+        def _save(tmp_filename, **kwargs):
+            r_file = RIOFile(tmp_filename, "w", driver="GTiff", width=300, height=400, count=2,
+                             dtype=np.uint16, tiled=True, blockxsize=64, blockysize=64)
+            r_file.open()
+            return [da.from_array(data, chunks=(2, 100, 100))], [RIODataset(r_file)]
+
+        filename = str(tmp_path / "overviews.tif")
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        with mock.patch("satpy.writers.XRImage.save", side_effect=_save) as save_method:
+            res = w.save_dataset(_get_test_datasets_2d()[0], filename=filename, overviews=[2, 4],
+                                 overviews_resampling=resampling, dask_overviews=True)
+        assert res == filename
+        assert save_method.call_args[0][0] != filename
+        assert save_method.call_args[1]["compute"] is False
+        assert "overviews" not in save_method.call_args[1]
+        assert list(tmp_path.iterdir()) == [tmp_path / "overviews.tif"]
+        with rasterio.open(filename) as src:
+            assert src.overviews(1) == [2, 4]
+            assert src.block_shapes[0] == (64, 64)
+            np.testing.assert_array_equal(src.read(), data)
+        for overview_level, factor in enumerate([2, 4]):
+            with rasterio.open(filename, overview_level=overview_level) as src:
+                np.testing.assert_array_equal(src.read(), expected_func(data, factor))
+
+    def test_dask_overviews_not_built_from_file(self, tmp_path):
+        """Test that the overviews computed with dask are copied as they are instead of resampling the image."""
+        from satpy.writers.geotiff import GeoTIFFWriter
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        filename = str(tmp_path / "overviews.tif")
+
+        def _fake_coarsen(data, factor, resampling):
+            return da.full_like(data[:, ::factor, ::factor], factor)
+
+        with mock.patch("satpy.writers.geotiff._coarsen", side_effect=_fake_coarsen), \
+                mock.patch("rasterio.io.DatasetWriter.build_overviews",
+                           side_effect=AssertionError("the overviews were built from the image")):
+            w.save_dataset(_get_test_datasets_2d()[0], filename=filename, overviews=[2, 4], dask_overviews=True)
+        for overview_level, factor in enumerate([2, 4]):
+            with rasterio.open(filename, overview_level=overview_level) as src:
+                assert (src.read() == factor).all()
+
+    def test_dask_overviews_cog_driver(self, tmp_path):
+        """Test that overviews computed with dask are used for a cloud optimized GeoTIFF."""
+        from satpy.writers.geotiff import GeoTIFFWriter
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        filename = str(tmp_path / "overviews.tif")
+        w.save_dataset(_get_test_datasets_2d()[0], filename=filename, overviews=[2], dask_overviews=True,
+                       driver="COG", blockxsize=32, tags={"test_tag": "test_value"})
+        with rasterio.open(filename) as src:
+            assert src.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+            assert src.overviews(1) == [2]
+            assert src.block_shapes[0] == (32, 32)
+            assert src.tags()["test_tag"] == "test_value"
+            assert src.crs is not None
@@ -75,3 +75,21 @@ class TestPillowWriter(unittest.TestCase):
             assert isinstance(r__, Delayed)
             r__.compute()
         compute_writer_results(res)
+
+    def test_process_safe_delayed_write(self):
+        """Test writing datasets in tasks computed by other processes."""
+        import os
+
+        import dask
+        from dask.delayed import Delayed
+
+        from satpy.writers.simple_image import PillowWriter
+        datasets = self._get_test_datasets() * 2
+        datasets[1] = datasets[1].copy()
+        datasets[1].attrs["name"] = "test2"
+        w = PillowWriter(base_dir=self.base_dir)
+        res = w.save_datasets(datasets, compute=False, process_safe=True)
+        assert all(isinstance(delayed, Delayed) for delayed in res)
+        with dask.config.set(scheduler="processes", num_workers=2):
+            dask.compute(*res)
+        assert len(os.listdir(self.base_dir)) == 2
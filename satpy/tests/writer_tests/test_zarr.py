@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the Zarr writer."""
+
+import datetime as dt
+
+import dask
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+
+from satpy import Scene
+from satpy.tests.utils import CustomScheduler
+
+
+def _create_scene(start_time, value=1.0, chunks=(3, 4)):
+    """Create a scene with one chunked dataset on an area."""
+    from pyresample.geometry import AreaDefinition
+    area = AreaDefinition("test", "test", "test", "EPSG:4326", 8, 6, (-10.0, -6.0, 10.0, 6.0))
+    scn = Scene()
+    attrs = dict(start_time=start_time, end_time=start_time + dt.timedelta(minutes=15),
+                 platform_name="tirosn", sensor="avhrr-3", area=area)
+    data = da.full((6, 8), value, dtype=np.float32, chunks=chunks)
+    scn["test-array"] = xr.DataArray(data, dims=("y", "x"), attrs=dict(attrs, name="test-array"))
+    scn["other-array"] = xr.DataArray(data + 1, dims=("y", "x"), attrs=dict(attrs, name="other-array"))
+    return scn
+
+
+class TestZarrWriter:
+    """Test the Zarr writer."""
+
+    def test_init(self):
+        """Test initializing the ZarrWriter class."""
+        from satpy.writers import configs_for_writer
+        from satpy.writers.zarr_writer import ZarrWriter
+
+        ZarrWriter(config_files=list(configs_for_writer("zarr"))[0])
+
+    def test_save_datasets(self, tmp_path):
+        """Test saving datasets with CF metadata."""
+        scn = _create_scene(dt.datetime(2018, 5, 30, 10, 0))
+        scn.save_datasets(writer="zarr", base_dir=str(tmp_path), include_lonlats=False)
+
+        store = tmp_path / "tirosn-avhrr-3-20180530100000-20180530101500.zarr"
+        with xr.open_zarr(store) as res:
+            np.testing.assert_array_equal(res["test-array"], 1.0)
+            np.testing.assert_array_equal(res["other-array"], 2.0)
+            assert res.attrs["Conventions"] == "CF-1.7"
+            assert res["test-array"].attrs["grid_mapping"] == "test"
+            assert "test" in res.variables
+
+    def test_chunks_are_aligned(self, tmp_path):
+        """Test that irregular dask chunks are written to uniform Zarr chunks in one pass."""
+        scn = _create_scene(dt.datetime(2018, 5, 30, 10, 0), chunks=((4, 2), (5, 3)))
+        filename = tmp_path / "test.zarr"
+        with dask.config.set(scheduler=CustomScheduler(max_computes=1)):
+            scn.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False)
+
+        with xr.open_zarr(filename) as res:
+            assert res["test-array"].encoding["chunks"] == (4, 5)
+            np.testing.assert_array_equal(res["test-array"], 1.0)
+
+    def test_encoding_chunks(self, tmp_path):
+        """Test that user provided chunks are used for the store and the dask data."""
+        scn = _create_scene(dt.datetime(2018, 5, 30, 10, 0))
+        filename = tmp_path / "test.zarr"
+        scn.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False,
+                          encoding={"test-array": {"chunks": (2, 2)}})
+
+        with xr.open_zarr(filename) as res:
+            assert res["test-array"].encoding["chunks"] == (2, 2)
+            assert res["other-array"].encoding["chunks"] == (3, 4)
+
+    def test_delayed(self, tmp_path):
+        """Test that nothing is written before the delayed results are computed."""
+        scn = _create_scene(dt.datetime(2018, 5, 30, 10, 0))
+        filename = tmp_path / "test.zarr"
+        res = scn.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False, compute=False)
+
+        dask.compute(res)
+        with xr.open_zarr(filename) as ds:
+            np.testing.assert_array_equal(ds["test-array"], 1.0)
+
+    def test_groups(self, tmp_path):
+        """Test saving datasets to groups of the store."""
+        scn = _create_scene(dt.datetime(2018, 5, 30, 10, 0))
+        filename = tmp_path / "test.zarr"
+        scn.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False,
+                          groups={"first": ["test-array"], "second": ["other-array"]})
+
+        with xr.open_zarr(filename, group="first") as first, xr.open_zarr(filename, group="second") as second:
+            assert sorted(first.data_vars) == ["test", "test-array"]
+            assert sorted(second.data_vars) == ["other-array", "test"]
+        assert "history" in xr.open_zarr(filename).attrs
+
+    @pytest.mark.parametrize("groups", [None, {"first": ["test-array", "other-array"]}])
+    def test_append_time_steps(self, tmp_path, groups):
+        """Test appending time steps to an existing store."""
+        filename = tmp_path / "test.zarr"
+        start_times = [dt.datetime(2018, 5, 30, 10, 0), dt.datetime(2018, 5, 30, 10, 15)]
+        for value, start_time in enumerate(start_times):
+            scn = _create_scene(start_time, value=value)
+            scn.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False,
+                              append_dim="time", groups=groups)
+
+        group = None if groups is None else "first"
+        with xr.open_zarr(filename, group=group) as res:
+            assert res["test-array"].dims == ("time", "y", "x")
+            np.testing.assert_array_equal(res["time"], np.array(start_times, dtype="datetime64[ns]"))
+            np.testing.assert_array_equal(res["test-array"].isel(time=0), 0.0)
+            np.testing.assert_array_equal(res["test-array"].isel(time=1), 1.0)
+            assert res["time_bnds"].shape == (2, 2)
@@ -20,12 +20,15 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import json
 import logging
 import os
 import pathlib
+import threading
 import warnings
 from contextlib import contextmanager
 from copy import deepcopy
+from timeit import default_timer
 from typing import Literal, Mapping, Optional
 from urllib.parse import urlparse
 
@@ -855,3 +858,152 @@ def datetime64_to_pydatetime(dt64):
         Converted timestamp
     """
     return dt64.astype("datetime64[us]").astype(datetime.datetime)
+
+
+_active_profilers: list[SatpyProfiler] = []
+
+
+class SatpyProfiler:
+    """Record the wall time and output size of the main Satpy processing steps.
+
+    Use :func:`profile` to create one. Each record holds the category of the
+    step, its name, its start and end time, the thread it ran in and, when
+    known, the size in bytes of the data it produced:
+
+    ========================  ===================================================
+    Category                  Step
+    ========================  ===================================================
+    ``file_handlers``         Creation of the file handlers of one file type
+    ``load``                  Loading of one dataset by a reader
+    ``composite``             Call of a compositor or modifier
+    ``resample``              Resampling of one dataset
+    ``enhance``               Enhancement of one dataset
+    ``save``                  Saving of the datasets by a writer
+    ========================  ===================================================
+
+    As dask arrays are lazy, the time of most steps is the time needed to
+    build the dask graph; the computation itself mostly happens when saving
+    with ``compute=True``. The records can be combined with the ones of
+    :class:`dask.diagnostics.Profiler` in a single plot, as both use the same
+    clock::
+
+        from dask.diagnostics import Profiler, visualize
+
+        with satpy.utils.profile() as satpy_prof, Profiler() as dask_prof:
+            scn.load(["overview"])
+            scn.save_datasets()
+        visualize([satpy_prof, dask_prof])
+
+    """
+
+    def __init__(self):
+        """Initialize the profiler with no records."""
+        self.records = []
+        self.start_time = None
+        self.end_time = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Start recording the processing steps."""
+        self.start_time = default_timer()
+        _active_profilers.append(self)
+        return self
+
+    def __exit__(self, *args):
+        """Stop recording the processing steps."""
+        self.end_time = default_timer()
+        _active_profilers.remove(self)
+
+    def add_record(self, record):
+        """Add the *record* of a processing step."""
+        with self._lock:
+            self.records.append(record)
+
+    @property
+    def results(self):
+        """Get the records like the results of :class:`dask.diagnostics.Profiler`."""
+        from dask.diagnostics.profile import TaskData
+        return [TaskData(record["category"] + "-" + record["name"], record["category"],
+                         record["start_time"], record["end_time"], record["thread"])
+                for record in self.records]
+
+    def to_dict(self):
+        """Get the records as a JSON-serializable dictionary.
+
+        The times are in seconds relative to the start of the profiling.
+        """
+        records = []
+        for record in self.records:
+            record = record.copy()
+            record["start_time"] -= self.start_time
+            record["end_time"] -= self.start_time
+            records.append(record)
+        end_time = self.end_time if self.end_time is not None else default_timer()
+        return {"duration": end_time - self.start_time, "records": records}
+
+    def to_json(self, filename=None):
+        """Get the records as a JSON string, or write them to *filename* if provided."""
+        content = json.dumps(self.to_dict(), indent=2)
+        if filename is None:
+            return content
+        with open(filename, "w") as fid:
+            fid.write(content)
+
+    def visualize(self, **kwargs):
+        """Plot the records with :func:`dask.diagnostics.visualize`."""
+        from dask.diagnostics import visualize
+        return visualize(self, **kwargs)
+
+    def _plot(self, **kwargs):
+        from dask.diagnostics.profile_visualize import plot_tasks
+        return plot_tasks(self.results, {}, self.start_time, self.end_time, **kwargs)
+
+
+def profile():
+    """Record the wall time and output size of the main Satpy processing steps.
+
+    Examples:
+        Write a JSON report of a processing chain::
+
+            with satpy.utils.profile() as prof:
+                scn = Scene(filenames, reader="ahi_hsd")
+                scn.load(["true_color"])
+                scn.save_datasets()
+            prof.to_json("profile.json")
+
+    Returns:
+        A :class:`SatpyProfiler` to use as a context manager.
+
+    """
+    return SatpyProfiler()
+
+
+@contextmanager
+def profile_step(category, name):
+    """Record the processing step *name* in the active profilers, if any.
+
+    The dictionary yielded is the record of the step, its ``"nbytes"`` item
+    can be set to the size of the data produced by the step. Nothing is
+    recorded if the step fails.
+    """
+    if not _active_profilers:
+        yield {}
+        return
+    record = {"category": category, "name": str(name), "nbytes": None,
+              "thread": threading.current_thread().name, "start_time": default_timer()}
+    yield record
+    record["end_time"] = default_timer()
+    for profiler in list(_active_profilers):
+        profiler.add_record(record)
+
+
+def get_nbytes(data):
+    """Get the size in bytes of a data array or of a collection of them, or None if unknown."""
+    if isinstance(data, dict):
+        data = list(data.values())
+    if isinstance(data, (list, tuple)):
+        sizes = [get_nbytes(item) for item in data]
+        if not sizes or any(size is None for size in sizes):
+            return None
+        return sum(sizes)
+    return getattr(data, "nbytes", None)
@@ -23,6 +23,7 @@ import os
 import warnings
 from typing import Optional
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
@@ -31,11 +32,11 @@ from trollimage.xrimage import XRImage
 from trollsift import parser
 from yaml import UnsafeLoader
 
-from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config, load_yaml_config
 from satpy.aux_download import DataDownloadMixin
 from satpy.plugin_base import Plugin
 from satpy.resample import get_area_def
-from satpy.utils import get_legacy_chunk_size, recursive_dict_update
+from satpy.utils import get_legacy_chunk_size, get_nbytes, profile_step, recursive_dict_update
 
 LOG = logging.getLogger(__name__)
 CHUNK_SIZE = get_legacy_chunk_size()
@@ -46,8 +47,7 @@ def read_writer_config(config_files, loader=UnsafeLoader):
     conf = {}
     LOG.debug("Reading %s", str(config_files))
     for config_file in config_files:
-        with open(config_file) as fd:
-            conf.update(yaml.load(fd.read(), Loader=loader))
+        conf.update(load_yaml_config(config_file, loader=loader))
 
     try:
         writer_info = conf["writer"]
@@ -433,16 +433,18 @@ def get_enhanced_image(dataset, enhance=None, overlay=None, decorate=None,
         # custom enhancer
         enhancer = enhance
 
-    # Create an image for enhancement
-    img = to_image(dataset)
+    with profile_step("enhance", dataset.attrs.get("name")) as step:
+        # Create an image for enhancement
+        img = to_image(dataset)
 
-    if enhancer is None or enhancer.enhancement_tree is None:
-        LOG.debug("No enhancement being applied to dataset")
-    else:
-        if dataset.attrs.get("sensor", None):
-            enhancer.add_sensor_enhancements(dataset.attrs["sensor"])
+        if enhancer is None or enhancer.enhancement_tree is None:
+            LOG.debug("No enhancement being applied to dataset")
+        else:
+            if dataset.attrs.get("sensor", None):
+                enhancer.add_sensor_enhancements(dataset.attrs["sensor"])
 
-        enhancer.apply(img, **dataset.attrs)
+            enhancer.apply(img, **dataset.attrs)
+        step["nbytes"] = get_nbytes(img.data)
 
     if overlay is not None:
         img = add_overlay(img, dataset.attrs["area"], fill_value=fill_value, **overlay)
@@ -481,6 +483,20 @@ def to_image(dataset):
     return XRImage(dataset)
 
 
+def _save_image_in_process(save_image, img_data, palette, save_kwargs):
+    """Save computed image data with a writer's ``save_image`` method.
+
+    The output file is opened, written, and closed by the process running
+    this function so no file handles or locks are shared between processes.
+
+    """
+    img = XRImage(img_data)
+    img.palette = palette
+    # the data is already computed so don't submit more work to a cluster
+    with dask.config.set(scheduler="synchronous"):
+        return save_image(img, compute=True, **save_kwargs)
+
+
 def split_results(results):
     """Split results.
 
@@ -869,19 +885,31 @@ class ImageWriter(Writer):
         return init_kwargs, kwargs
 
     def save_dataset(self, dataset, filename=None, fill_value=None,
-                     overlay=None, decorate=None, compute=True, units=None, **kwargs):
+                     overlay=None, decorate=None, compute=True, units=None,
+                     process_safe=False, **kwargs):
         """Save the ``dataset`` to a given ``filename``.
 
         This method creates an enhanced image using :func:`get_enhanced_image`.
         The image is then passed to :meth:`save_image`. See both of these
         functions for more details on the arguments passed to this method.
 
+        If ``process_safe`` is ``True`` and ``compute`` is ``False``, a single
+        :doc:`dask:delayed` object is returned instead of the usual results
+        of :meth:`save_image`. It gets the computed image and runs
+        :meth:`save_image` in whatever process executes it, so the output
+        file is only ever opened by that process. Use this to write many
+        images with a multi-process scheduler or a dask distributed cluster.
+
         """
         if units is not None:
             import pint_xarray  # noqa
             dataset = dataset.pint.quantify().pint.to(units).pint.dequantify()
         img = get_enhanced_image(dataset.squeeze(), enhance=self.enhancer, overlay=overlay,
                                  decorate=decorate, fill_value=fill_value)
+        if process_safe and not compute:
+            save_kwargs = dict(filename=filename, fill_value=fill_value, **kwargs)
+            return dask.delayed(_save_image_in_process, pure=False)(
+                self.save_image, img.data, img.palette, save_kwargs)
         return self.save_image(img, filename=filename, compute=compute, fill_value=fill_value, **kwargs)
 
     def save_image(
@@ -1130,18 +1158,17 @@ class EnhancementDecisionTree(DecisionTree):
         conf = {}
         for config_file in decision_dict:
             if os.path.isfile(config_file):
-                with open(config_file) as fd:
-                    enhancement_config = yaml.load(fd, Loader=UnsafeLoader)
-                    if enhancement_config is None:
-                        # empty file
-                        continue
-                    enhancement_section = enhancement_config.get(
-                        self.prefix, {})
-                    if not enhancement_section:
-                        LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
-                        continue
-                    LOG.debug(f"Adding enhancement configuration from file: {config_file}")
-                    conf = recursive_dict_update(conf, enhancement_section)
+                enhancement_config = load_yaml_config(config_file)
+                if enhancement_config is None:
+                    # empty file
+                    continue
+                enhancement_section = enhancement_config.get(
+                    self.prefix, {})
+                if not enhancement_section:
+                    LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
+                    continue
+                LOG.debug(f"Adding enhancement configuration from file: {config_file}")
+                conf = recursive_dict_update(conf, enhancement_section)
             elif isinstance(config_file, dict):
                 conf = recursive_dict_update(conf, config_file)
             else:
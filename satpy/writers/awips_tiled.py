@@ -190,6 +190,23 @@ in that empty space and should be allowed to write the "new" data to the file.
 This is the default behavior of the AWIPS tiled writer. In cases where data
 overlaps the existing data in the tile, the newer data has priority.
 
+Streaming tiles
+---------------
+
+By default a dask task graph is created for every tile, which for large
+lettered or numbered grids with thousands of tiles can take longer to build
+than the data takes to process. Passing ``streaming=True`` to
+``save_datasets`` instead computes the input data chunks in a single dask
+computation, copies each chunk's pixels to the tiles it overlaps, and writes
+every tile as soon as all of its pixels are available. Only the tiles
+overlapping the chunks computed so far are kept in memory and output files are
+written one at a time. Input chunks aligned with the tile boundaries minimize
+the number of tiles held in memory. If the data has no ``valid_range`` (or
+``valid_min`` and ``valid_max``) metadata, the tiles can only be written once
+the range of the whole data is computed, so they are all held in memory until
+then. The tiles are collected in the writing process, so the streaming mode
+only works with the threaded or synchronous dask schedulers.
+
 Shifting Lettered Grids
 -----------------------
 
@@ -215,10 +232,13 @@ lettered tile locations.
 """
 
 import datetime as dt
+import functools
 import logging
 import os
 import string
 import sys
+import threading
+import uuid
 import warnings
 from collections import namedtuple
 
@@ -1168,26 +1188,22 @@ def _copy_to_existing(dataset_to_save, output_filename):
     #   only sometimes. Limiting dask to 1 worker seems to fix this.
     #   I (David Hoese) was unable to make a script that reproduces this
     #   without using this writer (makes it difficult to file a bug report).
-    existing_dataset = xr.open_dataset(output_filename)
-    # the below used to trick xarray into working, but this doesn't work
-    # in newer versions. This was a hack in the first place so I'm keeping it
-    # here for reference.
-    # existing_dataset = existing_dataset.copy(deep=True)
-    # existing_dataset.close()
-
-    # update existing data with new valid data
-    for var_name, var_data_arr in dataset_to_save.data_vars.items():
-        if var_name not in existing_dataset:
-            continue
-        if var_data_arr.ndim != 2:
-            continue
-        existing_data_arr = existing_dataset[var_name]
-        valid_current = _notnull(var_data_arr)
-        new_data = existing_data_arr.data[:]
-        new_data[valid_current] = var_data_arr.data[valid_current]
-        var_data_arr.data[:] = new_data
-        var_data_arr.encoding.update(existing_data_arr.encoding)
-        var_data_arr.encoding.pop("source", None)
+    # Load what we need and close the file before it is reopened for
+    # appending so we never hold more than one handle on the file.
+    with xr.open_dataset(output_filename) as existing_dataset:
+        # update existing data with new valid data
+        for var_name, var_data_arr in dataset_to_save.data_vars.items():
+            if var_name not in existing_dataset:
+                continue
+            if var_data_arr.ndim != 2:
+                continue
+            existing_data_arr = existing_dataset[var_name]
+            valid_current = _notnull(var_data_arr)
+            new_data = existing_data_arr.values
+            new_data[valid_current] = var_data_arr.data[valid_current]
+            var_data_arr.data[:] = new_data
+            var_data_arr.encoding.update(existing_data_arr.encoding)
+            var_data_arr.encoding.pop("source", None)
 
     return dataset_to_save
 
@@ -1256,6 +1272,152 @@ def tile_filler(data_arr_data, tile_shape, tile_slices, fill_value):
     return empty_tile
 
 
+def _get_tile_fill_value(data_arr):
+    if np.issubdtype(data_arr.dtype, np.floating):
+        return np.nan
+    return data_arr.attrs.get("_FillValue", 0)
+
+
+class _TileAccumulator:
+    """Route the pixels of computed source blocks to the tiles they overlap.
+
+    Tile arrays are only allocated when the first block overlapping them
+    arrives and are handed back as soon as every pixel of the tile has been
+    received so only the tiles overlapping the current blocks are kept in
+    memory.
+
+    """
+
+    def __init__(self, tile_infos, data_arrs):
+        """Prepare tile bounds and pixel counts for the provided tiles."""
+        self._tile_infos = tile_infos
+        self._dtypes = [data_arr.dtype for data_arr in data_arrs]
+        self._fill_values = [_get_tile_fill_value(data_arr) for data_arr in data_arrs]
+        rows, cols = data_arrs[0].shape[-2:]
+        # (row start, row stop, column start, column stop) in the source image
+        self._bounds = np.array([
+            (tile_info.data_slices[0].start, min(tile_info.data_slices[0].stop, rows),
+             tile_info.data_slices[1].start, min(tile_info.data_slices[1].stop, cols))
+            for tile_info in tile_infos], dtype=np.int64).reshape((-1, 4))
+        # tiles past the edge of the image never receive any pixels
+        self._remaining_pixels = (np.clip(self._bounds[:, 1] - self._bounds[:, 0], 0, None) *
+                                  np.clip(self._bounds[:, 3] - self._bounds[:, 2], 0, None))
+        self._tile_arrays = {}
+
+    def _get_tile_arrays(self, tile_idx):
+        tile_arrays = self._tile_arrays.get(tile_idx)
+        if tile_arrays is None:
+            tile_shape = self._tile_infos[tile_idx].tile_shape
+            tile_arrays = [np.full(tile_shape, fill_value, dtype=dtype)
+                           for dtype, fill_value in zip(self._dtypes, self._fill_values)]
+            self._tile_arrays[tile_idx] = tile_arrays
+        return tile_arrays
+
+    def _overlapping_tiles(self, block_slices):
+        row_slice, col_slice = block_slices
+        bounds = self._bounds
+        return np.nonzero((bounds[:, 0] < row_slice.stop) & (bounds[:, 1] > row_slice.start) &
+                          (bounds[:, 2] < col_slice.stop) & (bounds[:, 3] > col_slice.start))[0]
+
+    def add_block(self, block_slices, blocks):
+        """Copy one block of every variable to the tiles and yield completed tiles."""
+        row_slice, col_slice = block_slices
+        for tile_idx in self._overlapping_tiles(block_slices):
+            row_start, row_stop, col_start, col_stop = self._bounds[tile_idx]
+            row_start, row_stop = max(row_start, row_slice.start), min(row_stop, row_slice.stop)
+            col_start, col_stop = max(col_start, col_slice.start), min(col_stop, col_slice.stop)
+            tile_info = self._tile_infos[tile_idx]
+            tile_row = tile_info.tile_slices[0].start + row_start - self._bounds[tile_idx, 0]
+            tile_col = tile_info.tile_slices[1].start + col_start - self._bounds[tile_idx, 2]
+            tile_slices = (slice(tile_row, tile_row + row_stop - row_start),
+                           slice(tile_col, tile_col + col_stop - col_start))
+            block_slices = (slice(row_start - row_slice.start, row_stop - row_slice.start),
+                            slice(col_start - col_slice.start, col_stop - col_slice.start))
+            for tile_array, block in zip(self._get_tile_arrays(tile_idx), blocks):
+                tile_array[tile_slices] = block[block_slices]
+            self._remaining_pixels[tile_idx] -= (row_stop - row_start) * (col_stop - col_start)
+            if self._remaining_pixels[tile_idx] == 0:
+                yield tile_info, self._tile_arrays.pop(tile_idx)
+
+
+class _TileStreamer:
+    """Write the tiles of a set of variables as soon as the blocks covering them are computed.
+
+    This is called by :func:`dask.array.map_blocks` on every block of the
+    variables along with the bounds of the valid ranges still to be computed,
+    so all the blocks and the valid ranges are computed in a single graph.
+    The blocks are copied to their tiles by a :class:`_TileAccumulator` and
+    every completed tile is written with *write_tile*. The *lock* makes sure
+    only one block is copied and one file is written at a time.
+
+    As the tiles are collected in this object, it can't be sent to other
+    processes and only works with the threaded or synchronous schedulers.
+
+    """
+
+    def __init__(self, tile_infos, data_arrs, write_tile, lock):
+        """Prepare the accumulation of the tiles of *data_arrs*."""
+        self._accumulator = _TileAccumulator(tile_infos, data_arrs)
+        self._write_tile = write_tile
+        self._lock = lock
+        self._valid_ranges = [data_arr.attrs.get("valid_range") for data_arr in data_arrs]
+        self._lazy_range_indices = [idx for idx, valid_range in enumerate(self._valid_ranges)
+                                    if valid_range is not None and isinstance(valid_range[0], da.Array)]
+        self._token = uuid.uuid4().hex
+
+    @property
+    def lazy_bounds(self):
+        """Get the dask arrays of the valid range bounds still to be computed."""
+        return [bound for idx in self._lazy_range_indices for bound in self._valid_ranges[idx]]
+
+    def __dask_tokenize__(self):
+        """Get a token unique to this object, as it writes files."""
+        return self._token
+
+    def __reduce__(self):
+        """Refuse to be sent to other processes."""
+        raise TypeError("Streaming AWIPS tiles needs the threaded or synchronous dask scheduler.")
+
+    def __call__(self, *blocks_and_bounds, block_info=None):
+        """Copy the blocks to their tiles and write the completed tiles, returning their filenames."""
+        num_vars = len(self._valid_ranges)
+        blocks = blocks_and_bounds[:num_vars]
+        bounds = iter(blocks_and_bounds[num_vars:])
+        valid_ranges = list(self._valid_ranges)
+        for idx in self._lazy_range_indices:
+            valid_ranges[idx] = (next(bounds)[()], next(bounds)[()])
+        (row_start, row_stop), (col_start, col_stop) = block_info[0]["array-location"]
+        block_slices = (slice(row_start, row_stop), slice(col_start, col_stop))
+        written = np.empty((1, 1), dtype=object)
+        with self._lock:
+            written[0, 0] = [self._write_tile(tile_info, tile_arrays, valid_ranges)
+                             for tile_info, tile_arrays in self._accumulator.add_block(block_slices, blocks)]
+        return written
+
+
+def _stream_tiles(tile_infos, data_arrs, write_tile, lock):
+    """Get a dask array writing the tiles of *data_arrs* as soon as the blocks covering them are computed.
+
+    All variables are rechunked to the chunks of the first one so each block
+    is computed once for all of them. Every block of the returned array holds
+    the list of filenames written once that block was computed, with None
+    for the empty tiles.
+
+    """
+    chunks = data_arrs[0].chunks
+    arrays = [data_arr.data.rechunk(chunks) for data_arr in data_arrs]
+    streamer = _TileStreamer(tile_infos, data_arrs, write_tile, lock)
+    return da.map_blocks(streamer, *arrays, *streamer.lazy_bounds, dtype=object,
+                         chunks=tuple((1,) * len(dim_chunks) for dim_chunks in chunks),
+                         meta=np.empty((0, 0), dtype=object), token="awips-tiled-stream")
+
+
+def _collect_written_filenames(written_arrays):
+    """Get the filenames of the written tiles from the computed arrays of :func:`_stream_tiles`."""
+    return [filename for written in written_arrays for filenames in written.flat
+            for filename in filenames if filename is not None]
+
+
 class AWIPSTiledWriter(Writer):
     """Writer for AWIPS NetCDF4 Tile files.
 
@@ -1398,7 +1560,7 @@ class AWIPSTiledWriter(Writer):
         return new_datasets
 
     def _tile_filler(self, tile_info, data_arr):
-        fill = np.nan if np.issubdtype(data_arr.dtype, np.floating) else data_arr.attrs.get("_FillValue", 0)
+        fill = _get_tile_fill_value(data_arr)
         data_arr_data = data_arr.data[tile_info.data_slices]
         data_arr_data = data_arr_data.rechunk(data_arr_data.shape)
         new_data = da.map_blocks(tile_filler, data_arr_data,
@@ -1407,7 +1569,8 @@ class AWIPSTiledWriter(Writer):
         return xr.DataArray(new_data, dims=("y", "x"),
                             attrs=data_arr.attrs.copy())
 
-    def _slice_and_update_coords(self, tile_info, data_arrays):
+    @staticmethod
+    def _get_tile_coords(tile_info, data_arrays):
         new_x = xr.DataArray(tile_info.x, dims=("x",))
         if "x" in data_arrays[0].coords:
             old_x = data_arrays[0].coords["x"]
@@ -1418,24 +1581,58 @@ class AWIPSTiledWriter(Writer):
             old_y = data_arrays[0].coords["y"]
             new_y.attrs.update(old_y.attrs)
             new_y.encoding = old_y.encoding
+        return new_x, new_y
 
+    def _slice_and_update_coords(self, tile_info, data_arrays):
+        new_x, new_y = self._get_tile_coords(tile_info, data_arrays)
         for data_arr in data_arrays:
             new_data_arr = self._tile_filler(tile_info, data_arr)
             new_data_arr.coords["x"] = new_x
             new_data_arr.coords["y"] = new_y
             yield new_data_arr
 
-    def _iter_tile_info_and_datasets(self, tile_gen, data_arrays, single_variable=True):
+    def _wrap_tile_arrays(self, tile_info, data_arrays, tile_arrays, valid_ranges):
+        new_x, new_y = self._get_tile_coords(tile_info, data_arrays)
+        for data_arr, tile_array, valid_range in zip(data_arrays, tile_arrays, valid_ranges):
+            new_data_arr = xr.DataArray(tile_array, dims=("y", "x"),
+                                        attrs=data_arr.attrs.copy())
+            if valid_range is not None:
+                new_data_arr.attrs["valid_range"] = valid_range
+            new_data_arr.coords["x"] = new_x
+            new_data_arr.coords["y"] = new_y
+            yield new_data_arr
+
+    def _get_data_arrays_sets(self, data_arrays, single_variable=True):
+        """Group data arrays by the files they will be written to."""
         all_data_arrays = self._enhance_and_split_rgbs(data_arrays)
         if single_variable:
-            all_data_arrays = [[single_data_arr] for single_data_arr in all_data_arrays]
-        else:
-            all_data_arrays = [all_data_arrays]
-        for data_arrays_set in all_data_arrays:
+            return [[single_data_arr] for single_data_arr in all_data_arrays]
+        return [all_data_arrays]
+
+    def _iter_tile_info_and_datasets(self, tile_gen, data_arrays, single_variable=True):
+        for data_arrays_set in self._get_data_arrays_sets(data_arrays, single_variable):
             for tile_info in tile_gen():
                 data_arrays_tile_set = list(self._slice_and_update_coords(tile_info, data_arrays_set))
                 yield tile_info, data_arrays_tile_set
 
+    def _stream_area_tiles(self, area_datasets, template, lettered_grid, sector_id,
+                           num_subtiles, tile_size, tile_count, use_sector_reference,
+                           render_kwargs, check_categories=True):
+        """Get the dask arrays writing the tiles of every area as soon as their data is computed."""
+        lock = threading.Lock()
+        for area_def, data_arrays in area_datasets.values():
+            data_arrays = list(_add_valid_ranges(data_arrays))
+            tile_gen = self._get_tile_generator(
+                area_def, lettered_grid, sector_id, num_subtiles, tile_size,
+                tile_count, use_sector_reference=use_sector_reference)
+            tile_infos = list(tile_gen())
+            if not tile_infos:
+                continue
+            for data_arrays_set in self._get_data_arrays_sets(data_arrays, template.is_single_variable):
+                write_tile = functools.partial(self._write_streamed_tile, template, area_def, data_arrays_set,
+                                               check_categories=check_categories, **render_kwargs)
+                yield _stream_tiles(tile_infos, data_arrays_set, write_tile, lock)
+
     def _iter_area_tile_info_and_datasets(self, area_datasets, template,
                                           lettered_grid, sector_id,
                                           num_subtiles, tile_size, tile_count,
@@ -1506,6 +1703,46 @@ class AWIPSTiledWriter(Writer):
         self._adjust_metadata_times(ds_info)
         return ds_info
 
+    def _render_tile_dataset(self, template, area_def, tile_info, data_arrs,
+                             sector_id=None, source_name=None, creation_time=None,
+                             environment_prefix="DR", extra_global_attrs=None):
+        """Render the Dataset for a single tile and get the filename it should be saved to."""
+        # TODO: Create Dataset object of all of the sliced-DataArrays (optional)
+        ds_info = self._get_tile_data_info(data_arrs,
+                                           creation_time,
+                                           source_name)
+        output_filename = self.get_filename(template, area_def,
+                                            tile_info, sector_id,
+                                            environment_prefix=environment_prefix,
+                                            **ds_info)
+        self.check_tile_exists(output_filename)
+        # TODO: Provide attribute caching for things that likely won't change (functools lrucache)
+        new_ds = template.render(data_arrs, area_def,
+                                 tile_info, sector_id,
+                                 creation_time=creation_time,
+                                 shared_attrs=ds_info,
+                                 extra_global_attrs=extra_global_attrs)
+        if self.compress:
+            new_ds.encoding["zlib"] = True
+            for var in new_ds.variables.values():
+                var.encoding["zlib"] = True
+        return new_ds, output_filename
+
+    def _write_streamed_tile(self, template, area_def, data_arrays, tile_info, tile_arrays, valid_ranges,
+                             check_categories=True, **render_kwargs):
+        """Write a completed tile, returning its filename or None if the tile is empty."""
+        data_arrs = list(self._wrap_tile_arrays(tile_info, data_arrays, tile_arrays, valid_ranges))
+        new_ds, output_filename = self._render_tile_dataset(template, area_def, tile_info,
+                                                            data_arrs, **render_kwargs)
+        factors = _extract_factors(new_ds)
+        dataset_to_save, output_filename, mode = to_nonempty_netcdf(
+            new_ds, factors, output_filename,
+            update_existing=True, check_categories=check_categories)
+        if dataset_to_save is None:
+            return None
+        dataset_to_save.to_netcdf(output_filename, mode)
+        return output_filename
+
     # TODO: Add additional untiled variable support
     def save_datasets(self, datasets, sector_id=None,  # noqa: D417
                       source_name=None,
@@ -1514,7 +1751,7 @@ class AWIPSTiledWriter(Writer):
                       use_end_time=False, use_sector_reference=False,
                       template="polar", check_categories=True,
                       extra_global_attrs=None, environment_prefix="DR",
-                      compute=True, **kwargs):
+                      compute=True, streaming=False, **kwargs):
         """Write a series of DataArray objects to multiple NetCDF4 Tile files.
 
         Args:
@@ -1589,6 +1826,17 @@ class AWIPSTiledWriter(Writer):
                 template generated values with the same global attribute name.
             compute (bool): Compute and write the output immediately using
                 dask. Default to ``False``.
+            streaming (bool): Instead of building a dask task graph for every
+                tile, compute the input data chunks in a single graph and
+                write each tile as soon as all of its pixels have been
+                computed. This avoids the graph construction overhead for
+                grids with many tiles and keeps only the tiles overlapping the
+                current chunks in memory, unless the valid ranges of the data
+                have to be computed first. Only the threaded and synchronous
+                dask schedulers are supported. When ``compute`` is ``False`` a
+                list with a single delayed object doing all of the writing is
+                returned, otherwise the list of written filenames is returned.
+                Default is ``False``.
 
         """
         if not isinstance(template, dict):
@@ -1598,30 +1846,26 @@ class AWIPSTiledWriter(Writer):
         datasets_to_save = []
         output_filenames = []
         creation_time = dt.datetime.now(dt.timezone.utc)
+        render_kwargs = dict(sector_id=sector_id, source_name=source_name,
+                             creation_time=creation_time,
+                             environment_prefix=environment_prefix,
+                             extra_global_attrs=extra_global_attrs)
+        if streaming:
+            written = list(self._stream_area_tiles(
+                area_data_arrs, template, lettered_grid, sector_id, num_subtiles,
+                tile_size, tile_count, use_sector_reference, render_kwargs, check_categories=check_categories))
+            delayed_filenames = dask.delayed(_collect_written_filenames, pure=False)(written)
+            if not compute:
+                return [delayed_filenames]
+            return delayed_filenames.compute()
+
         area_tile_data_gen = self._iter_area_tile_info_and_datasets(
             area_data_arrs, template, lettered_grid, sector_id, num_subtiles,
             tile_size, tile_count, use_sector_reference)
-        for area_def, tile_info, data_arrs in area_tile_data_gen:
-            # TODO: Create Dataset object of all of the sliced-DataArrays (optional)
-            ds_info = self._get_tile_data_info(data_arrs,
-                                               creation_time,
-                                               source_name)
-            output_filename = self.get_filename(template, area_def,
-                                                tile_info, sector_id,
-                                                environment_prefix=environment_prefix,
-                                                **ds_info)
-            self.check_tile_exists(output_filename)
-            # TODO: Provide attribute caching for things that likely won't change (functools lrucache)
-            new_ds = template.render(data_arrs, area_def,
-                                     tile_info, sector_id,
-                                     creation_time=creation_time,
-                                     shared_attrs=ds_info,
-                                     extra_global_attrs=extra_global_attrs)
-            if self.compress:
-                new_ds.encoding["zlib"] = True
-                for var in new_ds.variables.values():
-                    var.encoding["zlib"] = True
 
+        for area_def, tile_info, data_arrs in area_tile_data_gen:
+            new_ds, output_filename = self._render_tile_dataset(template, area_def, tile_info,
+                                                                data_arrs, **render_kwargs)
             datasets_to_save.append(new_ds)
             output_filenames.append(output_filename)
         if not datasets_to_save:
@@ -18,14 +18,22 @@
 """GeoTIFF writer objects for creating GeoTIFF files from `DataArray` objects."""
 from __future__ import annotations
 
+import html
 import logging
+import os
+import shutil
+import tempfile
+import warnings
 from typing import Any, Optional, Union
 
+import dask.array as da
 import numpy as np
 
 # make sure we have rasterio even though we don't use it until trollimage
 # saves the image
 import rasterio  # noqa
+import rasterio.shutil
+from rasterio.errors import NotGeoreferencedWarning
 from trollimage.colormap import Colormap
 from trollimage.xrimage import XRImage
 
@@ -34,6 +42,139 @@ from satpy.writers import ImageWriter
 
 LOG = logging.getLogger(__name__)
 
+# rasterio keyword arguments of a trollimage file that aren't creation options
+_DATASET_KWARGS = ("driver", "width", "height", "count", "dtype", "nodata", "crs", "transform", "gcps")
+
+
+def _get_overview_factors(overviews, width, height, overviews_minsize):
+    """Get the overview reduction factors like trollimage does."""
+    if overviews:
+        return list(overviews)
+    from rasterio.rio.overview import get_maximum_overview_level
+    max_level = get_maximum_overview_level(width, height, overviews_minsize)
+    return [2 ** level for level in range(1, max_level + 1)]
+
+
+def _coarsen(data, factor, resampling):
+    """Reduce the resolution of (bands, y, x) data block-wise.
+
+    The result has the same shape as the overview GDAL creates for
+    ``factor``, meaning partial cells at the right and bottom edges are kept.
+
+    """
+    if resampling == "nearest":
+        return data[:, ::factor, ::factor]
+    if resampling == "average":
+        padding = [(0, 0)] + [(0, -size % factor) for size in data.shape[1:]]
+        padded = da.pad(data, padding, mode="edge")
+        coarse = da.coarsen(np.mean, padded, {1: factor, 2: factor})
+        if np.issubdtype(data.dtype, np.integer):
+            coarse = coarse.round()
+        return coarse.astype(data.dtype)
+    raise ValueError("Only 'nearest' and 'average' overview resampling are "
+                     "supported when computing overviews with dask, "
+                     "got '{}'".format(resampling))
+
+
+def _get_creation_options(rfile_kwargs, driver):
+    """Get the options to create the final file with the overviews of its source."""
+    options = {key: value for key, value in rfile_kwargs.items() if key not in _DATASET_KWARGS}
+    if driver == "COG":
+        options = XRImage._gtiff_to_cog_kwargs(options)
+        options["overviews"] = "FORCE_USE_EXISTING"
+    else:
+        options["copy_src_overviews"] = "YES"
+    return options
+
+
+def _add_vrt_overviews(vrt_path, level_paths):
+    """Add the overview levels stored in ``level_paths`` to every band of a VRT file."""
+    with open(vrt_path) as vrt_file:
+        band_parts = vrt_file.read().split("</VRTRasterBand>")
+    for band, band_part in enumerate(band_parts[:-1]):
+        overviews = "".join(
+            '<Overview><SourceFilename relativeToVRT="0">{}</SourceFilename>'
+            "<SourceBand>{}</SourceBand></Overview>".format(html.escape(level_path), band + 1)
+            for level_path in level_paths)
+        band_parts[band] = band_part + overviews
+    with open(vrt_path, "w") as vrt_file:
+        vrt_file.write("</VRTRasterBand>".join(band_parts))
+
+
+class _DaskOverviews:
+    """Overview levels computed with dask and copied to the final file with the image.
+
+    The full resolution image is written to a temporary GeoTIFF. Once it and
+    all the overview levels are complete, a VRT referencing both is copied to
+    the final file, so GDAL takes the overviews as they are instead of
+    building them from the image again.
+
+    """
+
+    def __init__(self, rfile, filename, driver, factors, shapes, dtype):
+        """Allocate the overview levels of the temporary GeoTIFF file ``rfile``."""
+        self.rfile = rfile
+        self.filename = filename
+        self.driver = driver
+        self.factors = factors
+        self.levels = [np.empty(shape, dtype=dtype) for shape in shapes]
+        self._open_levels = len(shapes)
+
+    def get_targets(self):
+        """Get one :func:`dask.array.store` target per overview level."""
+        return [_DaskOverviewLevel(self, level) for level in self.levels]
+
+    def level_closed(self):
+        """Write the final file once all levels are complete."""
+        self._open_levels -= 1
+        if self._open_levels == 0:
+            self._write()
+
+    def _write(self):
+        tmp_dir = os.path.dirname(self.rfile.path)
+        try:
+            self.rfile.close()
+            vrt_path = os.path.join(tmp_dir, "image.vrt")
+            rasterio.shutil.copy(self.rfile.path, vrt_path, driver="VRT")
+            level_paths = [self._write_level(os.path.join(tmp_dir, "overview_{}.tif".format(factor)), level)
+                           for factor, level in zip(self.factors, self.levels)]
+            _add_vrt_overviews(vrt_path, level_paths)
+            LOG.debug("Copying overviews %s computed with dask to %s", str(self.factors), self.filename)
+            rasterio.shutil.copy(vrt_path, self.filename, driver=self.driver,
+                                 **_get_creation_options(self.rfile.kwargs, self.driver))
+        finally:
+            self.levels = []
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write_level(path, level):
+        # the overviews get their georeferencing from the image
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", NotGeoreferencedWarning)
+            with rasterio.open(path, "w", driver="GTiff", width=level.shape[2], height=level.shape[1],
+                               count=level.shape[0], dtype=level.dtype, tiled=True) as dst:
+                dst.write(level)
+        return path
+
+
+class _DaskOverviewLevel:
+    """Store target for a single overview level."""
+
+    def __init__(self, overviews, level):
+        """Store data in ``level`` of ``overviews``."""
+        self._overviews = overviews
+        self._level = level
+        # the output file of this target for group_results_by_output_file
+        self.rfile = overviews.rfile
+
+    def __setitem__(self, key, item):
+        """Put a computed block in the overview level."""
+        self._level[key] = item
+
+    def close(self):
+        """Mark this level as complete."""
+        self._overviews.level_closed()
+
 
 class GeoTIFFWriter(ImageWriter):
     """Writer to save GeoTIFF images.
@@ -62,6 +203,13 @@ class GeoTIFFWriter(ImageWriter):
 
         >>> scn.save_datasets(writer='geotiff', tiled=False)
 
+    Overviews are normally built by GDAL after the full resolution data has
+    been written, which means reading and resampling the whole file again.
+    With ``dask_overviews=True`` they are computed from the data in the same
+    dask computation that produces the full resolution image instead:
+
+        >>> scn.save_datasets(writer='geotiff', overviews=[], dask_overviews=True)
+
     For performance tips on creating geotiffs quickly and making them smaller
     see the :ref:`faq`.
 
@@ -155,6 +303,7 @@ class GeoTIFFWriter(ImageWriter):
             colormap_tag: Optional[str] = None,
             driver: Optional[str] = None,
             tiled: bool = True,
+            dask_overviews: bool = False,
             **kwargs
     ):
         """Save the image to the given ``filename`` in geotiff_ format.
@@ -234,6 +383,17 @@ class GeoTIFFWriter(ImageWriter):
                 GeoTIFF. See GDAL documentation for more information.
             tiled (bool): For performance this defaults to ``True``.
                 Pass ``False`` to created striped TIFF files.
+            dask_overviews (bool): Compute the ``overviews`` by coarsening the
+                data block by block in the same dask computation writing the
+                full resolution image, instead of having GDAL build them by
+                resampling the written file. Only ``nearest`` (every n-th
+                pixel) and ``average`` resampling are supported. The overviews
+                are kept in memory until the full resolution image is written,
+                which is about a third of its size for the default levels.
+                The image is written to a temporary file next to ``filename``
+                first and then copied once, together with the overviews, to
+                the final file. This also works with the "COG" driver.
+                Defaults to ``False``.
             include_scale_offset (deprecated, bool): Deprecated.
                 Use ``scale_offset_tags=("scale", "offset")`` to include scale
                 and offset tags.
@@ -244,6 +404,43 @@ class GeoTIFFWriter(ImageWriter):
         filename = filename or self.get_filename(**img.data.attrs)
 
         gdal_options = self._get_gdal_options(kwargs)
+        if "alpha" in kwargs:
+            raise ValueError(
+                "Keyword 'alpha' is automatically set based on 'fill_value' "
+                "and should not be specified")
+        dtype, fill_value = self._get_dtype_and_fill_value(img, dtype, fill_value)
+        if keep_palette and cmap is None and img.palette is not None:
+            from satpy.enhancements import create_colormap
+            cmap = create_colormap({"colors": img.palette})
+            cmap.set_range(0, len(img.palette) - 1)
+
+        if tags is None:
+            tags = {}
+        tags.update(self.tags)
+
+        save_kwargs = dict(fformat="tif",
+                           fill_value=fill_value,
+                           dtype=dtype,
+                           keep_palette=keep_palette, cmap=cmap,
+                           tags=tags, include_scale_offset_tags=include_scale_offset,
+                           scale_offset_tags=scale_offset_tags,
+                           colormap_tag=colormap_tag,
+                           tiled=tiled,
+                           **gdal_options)
+        if dask_overviews and overviews is not None:
+            factors = _get_overview_factors(overviews, img.data.sizes["x"], img.data.sizes["y"], overviews_minsize)
+            if factors:
+                return self._save_with_dask_overviews(img, filename, driver, compute, save_kwargs,
+                                                      factors, overviews_resampling)
+
+        return img.save(filename, driver=driver,
+                        compute=compute,
+                        overviews=overviews,
+                        overviews_resampling=overviews_resampling,
+                        overviews_minsize=overviews_minsize,
+                        **save_kwargs)
+
+    def _get_dtype_and_fill_value(self, img, dtype, fill_value):
         if fill_value is None:
             # fall back to fill_value from configuration file
             fill_value = self.info.get("fill_value")
@@ -254,10 +451,6 @@ class GeoTIFFWriter(ImageWriter):
         elif dtype is None:
             dtype = img.data.dtype.type
 
-        if "alpha" in kwargs:
-            raise ValueError(
-                "Keyword 'alpha' is automatically set based on 'fill_value' "
-                "and should not be specified")
         if np.issubdtype(dtype, np.floating):
             if img.mode != "L":
                 raise ValueError("Image must be in 'L' mode for floating "
@@ -266,27 +459,26 @@ class GeoTIFFWriter(ImageWriter):
                 LOG.debug("Alpha band not supported for float geotiffs, "
                           "setting fill value to 'NaN'")
                 fill_value = np.nan
-        if keep_palette and cmap is None and img.palette is not None:
-            from satpy.enhancements import create_colormap
-            cmap = create_colormap({"colors": img.palette})
-            cmap.set_range(0, len(img.palette) - 1)
-
-        if tags is None:
-            tags = {}
-        tags.update(self.tags)
-
-        return img.save(filename, fformat="tif", driver=driver,
-                        fill_value=fill_value,
-                        dtype=dtype, compute=compute,
-                        keep_palette=keep_palette, cmap=cmap,
-                        tags=tags, include_scale_offset_tags=include_scale_offset,
-                        scale_offset_tags=scale_offset_tags,
-                        colormap_tag=colormap_tag,
-                        overviews=overviews,
-                        overviews_resampling=overviews_resampling,
-                        overviews_minsize=overviews_minsize,
-                        tiled=tiled,
-                        **gdal_options)
+        return dtype, fill_value
+
+    def _save_with_dask_overviews(self, img, filename, driver, compute, save_kwargs, factors, overviews_resampling):
+        """Save the image to a temporary GeoTIFF and add the overview levels to its sources and targets."""
+        output_dir = os.path.dirname(os.path.abspath(filename))
+        tmp_dir = tempfile.mkdtemp(dir=output_dir, prefix=".{}.".format(os.path.basename(filename)))
+        sources, targets = img.save(os.path.join(tmp_dir, "image.tif"), driver="GTiff",
+                                    compute=False, **save_kwargs)
+        data, rfile = sources[0], targets[0].rfile
+        levels = [_coarsen(data, factor, overviews_resampling or "nearest") for factor in factors]
+        dask_overviews = _DaskOverviews(rfile, filename, driver or "GTiff", factors,
+                                        [level.shape for level in levels], data.dtype)
+        # the overview targets come last so the temporary GeoTIFF is closed before they are copied
+        to_store = (sources + levels, targets + dask_overviews.get_targets())
+        if not compute:
+            return to_store
+        da.store(*to_store)
+        for target in to_store[1]:
+            target.close()
+        return filename
 
     def _get_gdal_options(self, kwargs):
         # Update global GDAL options with these specific ones
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Writer for CF-style Zarr stores.
+
+Example usage
+-------------
+
+The Zarr writer saves the datasets of a Scene to a `Zarr`_ store with the same
+variables, coordinates and attributes as the :mod:`CF writer <satpy.writers.cf_writer>`
+would write to a netCDF file:
+
+    >>> from satpy import Scene
+    >>> import glob
+    >>> filenames = glob.glob('data/H*201903011200*')
+    >>> scn = Scene(filenames=filenames, reader='seviri_l1b_hrit')
+    >>> scn.load(['VIS006', 'IR_108'])
+    >>> scn.save_datasets(writer='zarr', datasets=['VIS006', 'IR_108'], filename='seviri_test.zarr',
+                          exclude_attrs=['raw_metadata'])
+
+The ``filename`` can be a local path or any URL or store supported by
+:meth:`xarray.Dataset.to_zarr`. Options like ``groups``, ``exclude_attrs``,
+``flatten_attrs``, ``include_lonlats`` or ``pretty`` behave like for the CF
+writer. Other keyword arguments, like ``encoding`` or ``consolidated``, are
+passed to :meth:`~xarray.Dataset.to_zarr`.
+
+Parallel writes
+~~~~~~~~~~~~~~~
+
+Unlike netCDF files, where all writes are serialized through the HDF5 library,
+every chunk of a Zarr store is a separate object. The data is rechunked so
+each dask chunk corresponds to exactly one Zarr chunk (by default the largest
+chunks of the data) so all chunks can be computed and written concurrently
+without any locking.
+
+Appending time steps
+~~~~~~~~~~~~~~~~~~~~
+
+With ``append_dim="time"`` the datasets get a time dimension of size one
+using their ``start_time``. The store is created on the first call and the
+data of every following call is appended along that dimension:
+
+    >>> for scn in scenes:
+    ...     scn.save_datasets(writer='zarr', filename='seviri_series.zarr', append_dim='time')
+
+Appended data is rechunked to the chunks of the existing store and encoding
+options are only used when the store is created.
+
+.. _Zarr: https://zarr.dev/
+"""
+
+import copy
+import logging
+
+import numpy as np
+import xarray as xr
+
+from satpy.cf.coords import EPOCH
+from satpy.writers import Writer
+from satpy.writers.cf_writer import _sanitize_writer_kwargs
+
+logger = logging.getLogger(__name__)
+
+
+def _add_time_dimension(data_arr):
+    """Add a scalar time coordinate from ``start_time`` that the CF processing expands to a dimension."""
+    if "time" in data_arr.coords:
+        return data_arr
+    return data_arr.assign_coords(time=np.datetime64(data_arr.attrs["start_time"], "ns"))
+
+
+def _get_appendable_time_encoding(encoding, epoch):
+    """Encode times relative to the epoch instead of the first time step so later time steps fit."""
+    encoding = dict(encoding or {})
+    time_encoding = {"units": epoch or EPOCH, "dtype": "float64"}
+    time_encoding.update(encoding.get("time", {}))
+    encoding["time"] = time_encoding
+    return encoding
+
+
+def _group_exists(store, group):
+    """Check if the store already contains the (root) group."""
+    try:
+        xr.open_zarr(store, group=group, consolidated=None).close()
+    except (FileNotFoundError, KeyError, ValueError, OSError):
+        return False
+    return True
+
+
+def _encode_times_like(variable, existing):
+    """Encode a datetime variable with the units, calendar and dtype of the variable already in the store.
+
+    Appended datetimes are not re-encoded with the units of the store, so they are written as numbers directly.
+    """
+    from xarray.coding.times import encode_cf_datetime
+
+    units = existing.attrs["units"]
+    calendar = existing.attrs.get("calendar", "proleptic_gregorian")
+    num, _, _ = encode_cf_datetime(variable.values, units, calendar, dtype=existing.dtype)
+    return xr.Variable(variable.dims, num, attrs=dict(variable.attrs, units=units, calendar=calendar))
+
+
+def _prepare_append(dataset, store, group):
+    """Make the dataset match the variables already in the store."""
+    with xr.open_zarr(store, group=group, consolidated=None, decode_times=False) as existing:
+        chunks = {}
+        for var_name, variable in list(dataset.variables.items()):
+            if var_name not in existing.variables:
+                continue
+            if "chunks" in existing[var_name].encoding:
+                chunks[var_name] = existing[var_name].encoding["chunks"]
+            if np.issubdtype(variable.dtype, np.datetime64) and "units" in existing[var_name].attrs:
+                dataset[var_name] = _encode_times_like(variable, existing[var_name])
+    return _align_dask_chunks(dataset, chunks)
+
+
+def _get_zarr_encoding(netcdf_encoding):
+    """Convert the netCDF encoding of :func:`satpy.cf.encoding.update_encoding` to Zarr encoding."""
+    encoding = copy.deepcopy(netcdf_encoding)
+    for var_encoding in encoding.values():
+        chunks = var_encoding.pop("chunksizes", None)
+        if chunks is not None:
+            var_encoding.setdefault("chunks", tuple(int(chunk) for chunk in chunks))
+    return encoding
+
+
+def _align_dask_chunks(dataset, chunks):
+    """Rechunk dask variables so each dask chunk is written to exactly one Zarr chunk."""
+    for var_name, var_chunks in chunks.items():
+        variable = dataset.variables[var_name]
+        if variable.chunks is None or var_name in dataset.dims:
+            continue
+        aligned = dict(zip(variable.dims, var_chunks))
+        dataset[var_name] = dataset[var_name].chunk(aligned)
+    return dataset
+
+
+class ZarrWriter(Writer):
+    """Writer producing Zarr stores with CF compatible datasets."""
+
+    def save_dataset(self, dataset, filename=None, fill_value=None, **kwargs):
+        """Save the *dataset* to a given *filename*."""
+        return self.save_datasets([dataset], filename, **kwargs)
+
+    def save_datasets(self, datasets, filename=None, groups=None, header_attrs=None, epoch=None,  # noqa: D417
+                      flatten_attrs=False, exclude_attrs=None, include_lonlats=True, pretty=False,
+                      include_orig_name=True, numeric_name_prefix="CHANNEL_", append_dim=None,
+                      compute=True, **to_zarr_kwargs):
+        """Save the given datasets in one Zarr store.
+
+        Note that all datasets (if grouping: in one group) must have the same projection coordinates.
+
+        Args:
+            datasets (list): List of xr.DataArray to be saved.
+            filename (str): Output store path or URL.
+            groups (dict): Group datasets according to the given assignment:
+                `{'group_name': ['dataset1', 'dataset2', ...]}`.
+                The group name `None` corresponds to the root of the store, i.e., no group will be created.
+            header_attrs: Global attributes to be included.
+            epoch (str, optional): Reference time for encoding of time coordinates.
+                If None, the default reference time is defined using `from satpy.cf.coords import EPOCH`.
+            flatten_attrs (bool, optional): If True, flatten dict-type attributes.
+            exclude_attrs (list, optional): List of dataset attributes to be excluded.
+            include_lonlats (bool, optional): Always include latitude and longitude coordinates,
+                even for datasets with area definition.
+            pretty (bool, optional): Don't modify coordinate names, if possible.
+            include_orig_name (bool, optional): Include the original dataset name as a variable
+                attribute in the final store.
+            numeric_name_prefix (str, optional): Prefix to add to each variable with a name starting with a digit.
+                Use '' or None to leave this out.
+            append_dim (str, optional): Dimension to append the datasets along if the store already exists.
+                If this is "time", a time dimension is added to the datasets from their ``start_time``.
+            compute (bool): Write the data immediately. If False, return the delayed objects of
+                :meth:`xarray.Dataset.to_zarr` to be computed later.
+        """
+        from satpy.cf.datasets import collect_cf_datasets
+
+        logger.info("Saving datasets to Zarr.")
+        filename = filename or self.get_filename(**datasets[0].attrs)
+        if append_dim == "time":
+            datasets = [_add_time_dimension(data_arr) for data_arr in datasets]
+
+        grouped_datasets, header_attrs = collect_cf_datasets(list_dataarrays=datasets,
+                                                             header_attrs=header_attrs,
+                                                             exclude_attrs=exclude_attrs,
+                                                             flatten_attrs=flatten_attrs,
+                                                             pretty=pretty,
+                                                             include_lonlats=include_lonlats,
+                                                             epoch=epoch,
+                                                             include_orig_name=include_orig_name,
+                                                             numeric_name_prefix=numeric_name_prefix,
+                                                             groups=groups,
+                                                             )
+        to_zarr_kwargs = _sanitize_writer_kwargs(to_zarr_kwargs)
+        if append_dim is not None:
+            to_zarr_kwargs["encoding"] = _get_appendable_time_encoding(to_zarr_kwargs.get("encoding"), epoch)
+
+        written = []
+        if groups is not None:
+            written.extend(self._initialize_root_group(filename, header_attrs, append_dim, compute))
+        for group_name, ds in grouped_datasets.items():
+            written.append(self._save_group(ds, filename, group_name, append_dim, compute,
+                                            numeric_name_prefix, to_zarr_kwargs))
+        return [res for res in written if res is not None]
+
+    @staticmethod
+    def _initialize_root_group(filename, header_attrs, append_dim, compute):
+        """Write the global attributes to the root of a grouped store."""
+        if append_dim is not None and _group_exists(filename, None):
+            return []
+        root = xr.Dataset({}, attrs=header_attrs)
+        return [root.to_zarr(filename, mode="w", compute=compute)]
+
+    @staticmethod
+    def _save_group(ds, filename, group_name, append_dim, compute, numeric_name_prefix, to_zarr_kwargs):
+        """Write one group, appending along *append_dim* if the group already exists."""
+        from satpy.cf.encoding import update_encoding
+
+        encoding, other_to_zarr_kwargs = update_encoding(ds,
+                                                         to_engine_kwargs=to_zarr_kwargs,
+                                                         numeric_name_prefix=numeric_name_prefix)
+        encoding = _get_zarr_encoding(encoding)
+        if append_dim is not None and _group_exists(filename, group_name):
+            ds = _prepare_append(ds, filename, group_name)
+            return ds.to_zarr(filename, group=group_name, mode="a", append_dim=append_dim,
+                              compute=compute, **other_to_zarr_kwargs)
+        chunks = {var_name: var_encoding["chunks"] for var_name, var_encoding in encoding.items()
+                  if "chunks" in var_encoding}
+        ds = _align_dask_chunks(ds, chunks)
+        # groups are added to the store holding the global attributes
+        mode = "a" if group_name is not None else "w"
+        return ds.to_zarr(filename, group=group_name, mode=mode, encoding=encoding,
+                          compute=compute, **other_to_zarr_kwargs)